@@ -43,3 +43,17 @@ def normalize_blog_slug(value: object) -> str | None:
         return None
 
     return slug
+
+
+def blog_slug_lookup_key(slug: str) -> str:
+    """Pliega mayúsculas y diacríticos como la colación de MySQL al comparar slugs.
+
+    Dos slugs con la misma clave pueden coincidir en la base de datos; dos claves
+    distintas no. Por eso sirve para descartar slugs inexistentes sin consultar.
+    """
+    decomposed = unicodedata.normalize("NFKD", slug)
+    return "".join(
+        character
+        for character in decomposed
+        if not unicodedata.category(character).startswith("M")
+    ).casefold()
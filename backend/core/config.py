@@ -80,6 +80,9 @@ class Settings(BaseSettings):
         READ_RATE_LIMIT_WINDOW_SECONDS (int): Duración de la ventana de lecturas.
         SITEMAP_RATE_LIMIT_REQUESTS (int): Consultas permitidas al origen de datos del sitemap.
         SITEMAP_RATE_LIMIT_WINDOW_SECONDS (int): Duración de la ventana del sitemap.
+        SITEMAP_CHANGES_RETENTION_SECONDS (int): Tiempo durante el que un cursor del
+            sitemap incremental puede recibir solo los cambios.
+        SITEMAP_PUBLIC_SITE_URL (str): URL pública del frontend usada en el sitemap XML.
         CONTACT_RATE_LIMIT_REQUESTS (int): Envíos permitidos al formulario por ventana.
         CONTACT_RATE_LIMIT_WINDOW_SECONDS (int): Duración de la ventana del formulario.
         TOKEN_RATE_LIMIT_REQUESTS (int): Solicitudes permitidas de token por ventana.
@@ -90,6 +93,8 @@ class Settings(BaseSettings):
         SMTP_TLS_MODE (str): Modo TLS SMTP: starttls, tls o none.
         HEALTHCHECK_DATABASE_TIMEOUT_SECONDS (float): Tiempo máximo de comprobación de MySQL.
         REDIS_URL (str): URL de Redis compartida por todos los workers.
+        REDIS_CLUSTER_MODE (bool): Conecta con Redis Cluster y agrupa en un mismo slot
+            las claves de rate limit de cada cliente.
         REDIS_CONNECT_TIMEOUT_SECONDS (float): Tiempo máximo al abrir conexión Redis.
         REDIS_SOCKET_TIMEOUT_SECONDS (float): Tiempo máximo de una operación Redis.
         REDIS_STARTUP_TIMEOUT_SECONDS (float): Tiempo máximo de Redis durante el arranque.
@@ -97,6 +102,25 @@ class Settings(BaseSettings):
         REDIS_HEALTHCHECK_INTERVAL_SECONDS (int): Intervalo de comprobación del pool Redis.
         REDIS_MAX_CONNECTIONS (int): Conexiones Redis máximas por worker.
         REDIS_RATE_LIMIT_PREFIX (str): Prefijo aislado para las claves del rate limit.
+        RATE_LIMIT_LEASE_CLIENT_IPS (str): IP de clientes de mucho volumen, como el
+            servidor de Next.js, que reservan bloques de permisos del rate limit.
+        RATE_LIMIT_LEASE_SIZE (int): Permisos reservados de una vez por regla y worker,
+            con un tope de una décima parte del límite de la regla.
+        RATE_LIMIT_LEASE_SECONDS (float): Vigencia de una reserva de permisos.
+        REDIS_CONTENT_VERSION_KEY (str): Clave Redis con la versión del contenido publicado.
+        CONTENT_CACHE_ENABLED (bool): Activa la caché de contenido local de cada worker.
+        CONTENT_CACHE_VERSION_POLL_SECONDS (float): Intervalo máximo entre lecturas de la versión.
+        CONTENT_CACHE_MAX_ENTRIES (int): Entradas máximas de la caché de contenido por worker.
+        CONTENT_CACHE_MAX_PAGE_ENTRIES (int): Páginas con cursor y selecciones de campos
+            conservadas por worker, aparte de las entradas anteriores.
+        CONTENT_CACHE_MAX_AGE_SECONDS (float): Edad máxima de una entrada de la caché de
+            contenido aunque la versión publicada no cambie.
+        CONTENT_CACHE_WARMUP_ENABLED (bool): Precarga la caché de contenido al arrancar
+            cada worker, limitada por ``DATABASE_STARTUP_TIMEOUT_SECONDS``.
+        CONTENT_STALE_REFRESH_SECONDS (float): Espera entre intentos de recuperar MySQL
+            mientras se sirve la última copia válida del contenido.
+        CONTENT_VALIDATED_ON_WRITE (bool): Confía en la marca ``publicamente_valido``
+            de cada fila en lugar de validarla en cada lectura pública.
         CORS_ALLOWED_ORIGINS (str): Orígenes frontend autorizados, separados por comas.
         TRUSTED_PROXY_IPS (str): Proxies autorizados para aportar X-Forwarded-For.
         ENABLE_API_DOCS (bool): Habilita OpenAPI, Swagger UI y ReDoc de forma explícita.
@@ -133,6 +157,8 @@ class Settings(BaseSettings):
     READ_RATE_LIMIT_WINDOW_SECONDS: int = Field(default=60, gt=0)
     SITEMAP_RATE_LIMIT_REQUESTS: int = Field(default=12, gt=0)
     SITEMAP_RATE_LIMIT_WINDOW_SECONDS: int = Field(default=60, gt=0)
+    SITEMAP_CHANGES_RETENTION_SECONDS: int = Field(default=604800, ge=60)
+    SITEMAP_PUBLIC_SITE_URL: str = "https://www.paraisodeljamon.com"
     CONTACT_RATE_LIMIT_REQUESTS: int = Field(default=5, gt=0)
     CONTACT_RATE_LIMIT_WINDOW_SECONDS: int = Field(default=600, gt=0)
     TOKEN_RATE_LIMIT_REQUESTS: int = Field(default=120, gt=0)
@@ -146,6 +172,7 @@ class Settings(BaseSettings):
     SMTP_TLS_MODE: Literal["starttls", "tls", "none"] = "starttls"
     HEALTHCHECK_DATABASE_TIMEOUT_SECONDS: float = Field(default=2.0, gt=0)
     REDIS_URL: str = "redis://127.0.0.1:6379/0"
+    REDIS_CLUSTER_MODE: bool = False
     REDIS_CONNECT_TIMEOUT_SECONDS: float = Field(default=2.0, gt=0)
     REDIS_SOCKET_TIMEOUT_SECONDS: float = Field(default=2.0, gt=0)
     REDIS_STARTUP_TIMEOUT_SECONDS: float = Field(default=3.0, gt=0)
@@ -153,6 +180,18 @@ class Settings(BaseSettings):
     REDIS_HEALTHCHECK_INTERVAL_SECONDS: int = Field(default=30, ge=0)
     REDIS_MAX_CONNECTIONS: int = Field(default=10, ge=1, le=1000)
     REDIS_RATE_LIMIT_PREFIX: str = "paraisoweb:rate-limit"
+    RATE_LIMIT_LEASE_CLIENT_IPS: str = ""
+    RATE_LIMIT_LEASE_SIZE: int = Field(default=20, ge=1, le=1000)
+    RATE_LIMIT_LEASE_SECONDS: float = Field(default=2.0, gt=0, le=30)
+    REDIS_CONTENT_VERSION_KEY: str = "paraisoweb:content-version"
+    CONTENT_CACHE_ENABLED: bool = True
+    CONTENT_CACHE_VERSION_POLL_SECONDS: float = Field(default=5.0, gt=0)
+    CONTENT_CACHE_MAX_ENTRIES: int = Field(default=512, ge=1, le=100000)
+    CONTENT_CACHE_MAX_PAGE_ENTRIES: int = Field(default=64, ge=1, le=100000)
+    CONTENT_CACHE_MAX_AGE_SECONDS: float = Field(default=600.0, gt=0)
+    CONTENT_CACHE_WARMUP_ENABLED: bool = False
+    CONTENT_STALE_REFRESH_SECONDS: float = Field(default=10.0, gt=0)
+    CONTENT_VALIDATED_ON_WRITE: bool = False
     CORS_ALLOWED_ORIGINS: str = (
         "http://localhost:3000,https://galenn.asuscomm.com,"
         "http://paraisodeljamon.com,https://paraisodeljamon.com,"
@@ -184,6 +223,9 @@ class Settings(BaseSettings):
         "REDIS_STARTUP_TIMEOUT_SECONDS",
         "HEALTHCHECK_REDIS_TIMEOUT_SECONDS",
         "RECAPTCHA_TIMEOUT_SECONDS",
+        "CONTENT_CACHE_VERSION_POLL_SECONDS",
+        "CONTENT_CACHE_MAX_AGE_SECONDS",
+        "CONTENT_STALE_REFRESH_SECONDS",
     )
     @classmethod
     def validate_finite_timeout(cls, value: float) -> float:
@@ -480,6 +522,17 @@ class Settings(BaseSettings):
             )
         return normalized
 
+    @field_validator("REDIS_CONTENT_VERSION_KEY")
+    @classmethod
+    def validate_redis_content_version_key(cls, value: str) -> str:
+        """Aplica al contador de versión las mismas reglas que al prefijo del rate limit."""
+        normalized = value.strip().strip(":")
+        if not re.fullmatch(r"[A-Za-z0-9:_-]+", normalized):
+            raise ValueError(
+                "REDIS_CONTENT_VERSION_KEY solo puede contener letras, números, dos puntos y guiones"
+            )
+        return normalized
+
     @field_validator("secret_key")
     @classmethod
     def validate_secret_key(cls, value: str) -> str:
@@ -491,6 +544,34 @@ class Settings(BaseSettings):
             raise ValueError("secret_key debe sustituir el valor público del archivo .env.example")
         return normalized
 
+    @field_validator("SITEMAP_PUBLIC_SITE_URL")
+    @classmethod
+    def validate_sitemap_public_site_url(cls, value: str) -> str:
+        """Exige un origen http(s) sin ruta ni query y elimina la barra final."""
+        normalized = value.strip().rstrip("/")
+        if _contains_unsupported_configuration_character(normalized) or any(
+            character.isspace() for character in normalized
+        ):
+            raise ValueError("SITEMAP_PUBLIC_SITE_URL contiene caracteres no permitidos")
+
+        try:
+            parsed = urlsplit(normalized)
+            parsed.port
+        except ValueError as error:
+            raise ValueError("SITEMAP_PUBLIC_SITE_URL no es una URL válida") from error
+
+        if (
+            parsed.scheme.lower() not in {"http", "https"}
+            or parsed.hostname is None
+            or parsed.username is not None
+            or parsed.password is not None
+            or parsed.path
+            or parsed.query
+            or parsed.fragment
+        ):
+            raise ValueError("SITEMAP_PUBLIC_SITE_URL debe ser un origen http(s) sin ruta")
+        return normalized
+
     @field_validator("CORS_ALLOWED_ORIGINS")
     @classmethod
     def validate_cors_allowed_origins(cls, value: str) -> str:
@@ -570,14 +651,14 @@ class Settings(BaseSettings):
         return ",".join(normalized_origins)
 
 
-    @field_validator("TRUSTED_PROXY_IPS")
+    @field_validator("TRUSTED_PROXY_IPS", "RATE_LIMIT_LEASE_CLIENT_IPS")
     @classmethod
-    def validate_trusted_proxy_ips(cls, value: str) -> str:
+    def validate_trusted_proxy_ips(cls, value: str, info) -> str:
         """Acepta únicamente direcciones IP literales y normaliza duplicados."""
         normalized_values: list[str] = []
         for raw_value in value.split(","):
             if _contains_unsupported_configuration_character(raw_value):
-                raise ValueError("TRUSTED_PROXY_IPS contiene caracteres no permitidos")
+                raise ValueError(f"{info.field_name} contiene caracteres no permitidos")
             candidate = raw_value.strip(" ")
             if not candidate:
                 continue
@@ -586,7 +667,7 @@ class Settings(BaseSettings):
                 parsed = ip_address(candidate)
             except ValueError as error:
                 raise ValueError(
-                    f"TRUSTED_PROXY_IPS contiene una dirección IP no válida: {candidate}"
+                    f"{info.field_name} contiene una dirección IP no válida: {candidate}"
                 ) from error
 
             if isinstance(parsed, IPv6Address) and parsed.ipv4_mapped is not None:
@@ -642,6 +723,15 @@ class Settings(BaseSettings):
         """Devuelve los proxies configurados sin aceptar entradas vacías."""
         return {value.strip() for value in self.TRUSTED_PROXY_IPS.split(",") if value.strip()}
 
+    @property
+    def rate_limit_lease_client_ips(self) -> set[str]:
+        """Devuelve las IP que reservan permisos del rate limit por bloques."""
+        return {
+            value.strip()
+            for value in self.RATE_LIMIT_LEASE_CLIENT_IPS.split(",")
+            if value.strip()
+        }
+
     model_config = {
         "from_attributes": True,  # Permite inicializar la configuración desde atributos
         "env_file": str(Path(__file__).resolve().parent.parent / ".env")  # Ruta al archivo `.env`
@@ -0,0 +1,413 @@
+# backend/core/content_cache.py
+
+"""
+core/content_cache.py
+
+Caché de contenido público local a cada worker de Uvicorn.
+
+Este módulo incluye:
+- Un almacén en memoria de resultados ya validados, aislado por proceso.
+- Un contador de versión de contenido compartido en Redis por todos los workers.
+- La invalidación de todas las entradas locales cuando cambia esa versión.
+
+Cada worker consulta la versión como máximo una vez por intervalo de sondeo. Si
+Redis no responde, la caché se desactiva y las lecturas vuelven a MySQL: servir
+datos locales sin poder comprobar su vigencia podría mantener contenido retirado.
+
+Además, ninguna entrada se sirve después de ``max_age_seconds``: si alguien edita
+MySQL directamente y olvida publicar una versión nueva con
+``python -m backend.tools.bump_content_version``, el contenido se corrige solo
+al caducar las entradas.
+
+Las páginas con cursor y las selecciones de campos forman un espacio de claves
+abierto: se guardan en un LRU propio y más pequeño (``paged``) para que recorrer
+el archivo no desplace la primera página, los detalles ni los índices.
+
+Las cargas idénticas concurrentes se agrupan (single-flight): tras un reinicio o
+una publicación, decenas de peticiones iguales esperan a una sola consulta en vez
+de ocupar cada una una conexión de un pool de pocas conexiones. El agrupamiento
+funciona también con la caché desactivada, porque el resultado compartido es
+igual de reciente que el de cada consulta por separado.
+
+Las claves cargadas con ``keep_snapshot`` conservan además su última copia válida,
+que sobrevive a la invalidación. Si MySQL deja de responder, los routers pueden
+servir esa copia marcada como obsoleta mientras una tarea en segundo plano, con
+una frecuencia limitada, intenta recuperarla.
+
+Para datos que deben compartir todos los workers más allá de una versión, como
+las instantáneas del sitemap incremental, se ofrece un almacén auxiliar en Redis
+con caducidad bajo el mismo espacio de claves que el contador de versión.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Cabecera que identifica una respuesta servida desde la última copia válida.
+STALE_CONTENT_HEADER = "X-Content-Stale"
+
+
+@dataclass(frozen=True)
+class StaleContent(Generic[T]):
+    """Última copia válida de un contenido y segundos transcurridos desde su carga."""
+
+    value: T
+    age_seconds: int
+
+
+def stale_content_headers(stale: StaleContent[Any]) -> dict[str, str]:
+    """Cabeceras que advierten al cliente de que el contenido puede no estar al día."""
+    return {STALE_CONTENT_HEADER: "true", "Age": str(stale.age_seconds)}
+
+
+class ContentCache:
+    """Conserva resultados de lectura mientras no cambie la versión compartida."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        version_key: str,
+        poll_interval_seconds: float,
+        max_entries: int,
+        max_page_entries: int = 64,
+        max_age_seconds: float = 600.0,
+        stale_refresh_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._enabled = enabled
+        self._version_key = version_key
+        self._poll_interval_seconds = poll_interval_seconds
+        self._max_entries = max_entries
+        self._max_page_entries = max_page_entries
+        self._max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._redis: Redis | None = None
+        self._version: str | None = None
+        self._checked_at = float("-inf")
+        # Cada entrada guarda ``(valor, instante de carga)`` para aplicar la edad máxima.
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._pages: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._in_flight: dict[tuple[str | None, Hashable], asyncio.Future[Any]] = {}
+        self._stale_refresh_seconds = stale_refresh_seconds
+        self._snapshots: dict[Hashable, tuple[Any, float]] = {}
+        self._next_refresh_at: dict[Hashable, float] = {}
+        self._refresh_tasks: set[asyncio.Task[Any]] = set()
+        self._source_unavailable_until = float("-inf")
+
+    def bind(self, redis_client: Redis) -> None:
+        """Asocia el cliente Redis del worker y descarta cualquier estado anterior."""
+        self._redis = redis_client
+        self.invalidate()
+
+    def unbind(self) -> None:
+        """Desactiva la caché al cerrar el cliente Redis del worker."""
+        self._redis = None
+        self.invalidate()
+        for task in self._refresh_tasks:
+            task.cancel()
+        self._refresh_tasks.clear()
+        self._snapshots.clear()
+        self._next_refresh_at.clear()
+        self._source_unavailable_until = float("-inf")
+
+    def invalidate(self) -> None:
+        """Descarta las entradas locales y obliga a releer la versión compartida."""
+        self._entries.clear()
+        self._pages.clear()
+        self._version = None
+        self._checked_at = float("-inf")
+
+    async def current_version(self) -> str | None:
+        """Devuelve la versión vigente o ``None`` si la caché no puede utilizarse."""
+        if not self._enabled or self._redis is None:
+            return None
+
+        now = self._clock()
+        if self._version is not None and now - self._checked_at < self._poll_interval_seconds:
+            return self._version
+
+        try:
+            raw_version = await self._redis.get(self._version_key)
+        except RedisError:
+            if self._version is not None:
+                logger.warning(
+                    "No se ha podido leer la versión de contenido en Redis; "
+                    "la caché de contenido queda desactivada temporalmente."
+                )
+            self.invalidate()
+            return None
+
+        if isinstance(raw_version, bytes):
+            version = raw_version.decode("ascii", errors="replace")
+        else:
+            version = "0" if raw_version is None else str(raw_version)
+
+        if version != self._version:
+            # Un cambio publicado en cualquier worker invalida todo el contenido local.
+            self._entries.clear()
+            self._pages.clear()
+            self._version = version
+        self._checked_at = now
+        return version
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        should_store: Callable[[T], bool] | None = None,
+        keep_snapshot: bool = False,
+        paged: bool = False,
+    ) -> T:
+        """Devuelve la entrada vigente o ejecuta ``loader`` y guarda su resultado.
+
+        Las llamadas concurrentes con la misma clave y versión esperan a una única
+        ejecución de ``loader`` y reciben su resultado o su excepción.
+
+        ``should_store`` permite no conservar resultados como las búsquedas sin
+        coincidencia, que un cliente puede generar sin límite y desplazarían del LRU
+        entradas útiles. ``keep_snapshot`` conserva el resultado como última copia
+        válida para ``stale``. ``paged`` guarda la entrada en el LRU de páginas.
+        """
+        entries = self._pages if paged else self._entries
+        while True:
+            version = await self.current_version()
+            if version is not None and self._is_fresh(entries, key):
+                return entries[key][0]
+
+            flight_key = (version, key)
+            in_flight = self._in_flight.get(flight_key)
+            if in_flight is None:
+                break
+
+            try:
+                # ``shield`` evita que la cancelación de un seguidor cancele la carga
+                # que comparten el resto de peticiones.
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # Se canceló la petición que cargaba, no esta: se vuelve a intentar.
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        # Marca la excepción como consultada si ningún seguidor llega a esperarla.
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._in_flight[flight_key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            self._in_flight.pop(flight_key, None)
+
+        if keep_snapshot:
+            self._remember(key, value)
+        # Si la versión cambió durante la consulta, el resultado puede ser anterior
+        # a la publicación y no debe quedar asociado a la versión nueva.
+        if should_store is None or should_store(value):
+            self.put(key, value, version, paged=paged)
+        return value
+
+    def begin_load(self, key: Hashable, version: str | None) -> asyncio.Future[Any] | None:
+        """Anuncia una carga de ``key`` que no pasa por ``get_or_load``.
+
+        Quien carga debe resolver el futuro con el valor o cancelarlo si no termina,
+        para que ``wait_for_load`` lo reparta. Devuelve ``None`` si otra petición ya
+        carga ``key`` para esa versión.
+        """
+        flight_key = (version, key)
+        if flight_key in self._in_flight:
+            return None
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda done: self._in_flight.pop(flight_key, None))
+        self._in_flight[flight_key] = future
+        return future
+
+    async def wait_for_load(self, key: Hashable, timeout_seconds: float) -> Any | None:
+        """Devuelve la entrada vigente de ``key`` o espera a la carga ya anunciada.
+
+        Devuelve ``None`` si no hay ninguna, si se cancela o si tarda más de
+        ``timeout_seconds``; en ese caso quien llama debe cargar por su cuenta.
+        """
+        while True:
+            version = await self.current_version()
+            if version is not None and self._is_fresh(self._entries, key):
+                return self._entries[key][0]
+
+            in_flight = self._in_flight.get((version, key))
+            if in_flight is None:
+                return None
+
+            try:
+                return await asyncio.wait_for(asyncio.shield(in_flight), timeout_seconds)
+            except asyncio.TimeoutError:
+                return None
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # Se canceló la carga anunciada, no esta espera: se vuelve a comprobar.
+
+    async def peek(self, key: Hashable) -> Any | None:
+        """Devuelve la entrada vigente de ``key`` sin cargarla, o ``None``."""
+        version = await self.current_version()
+        if version is None or not self._is_fresh(self._entries, key):
+            return None
+        return self._entries[key][0]
+
+    def _is_fresh(self, entries: OrderedDict[Hashable, tuple[Any, float]], key: Hashable) -> bool:
+        """Indica si ``key`` tiene una entrada dentro de la edad máxima y la marca como usada."""
+        entry = entries.get(key)
+        if entry is None:
+            return False
+        if self._clock() - entry[1] >= self._max_age_seconds:
+            del entries[key]
+            return False
+        entries.move_to_end(key)
+        return True
+
+    def put(self, key: Hashable, value: Any, version: str | None, paged: bool = False) -> bool:
+        """Guarda un valor calculado fuera de ``get_or_load`` para ``version``.
+
+        Sirve para resultados que se generan mientras se envían, como un documento en
+        streaming: ``version`` debe leerse antes de empezar a generarlo y el valor se
+        descarta si entretanto se ha publicado otra.
+        """
+        if version is None or self._version != version:
+            return False
+        entries, max_entries = (
+            (self._pages, self._max_page_entries) if paged else (self._entries, self._max_entries)
+        )
+        entries[key] = (value, self._clock())
+        entries.move_to_end(key)
+        while len(entries) > max_entries:
+            entries.popitem(last=False)
+        return True
+
+    def _remember(self, key: Hashable, value: Any) -> None:
+        if self._enabled:
+            self._snapshots[key] = (value, self._clock())
+
+    def stale(self, key: Hashable) -> StaleContent[Any] | None:
+        """Devuelve la última copia válida de ``key`` o ``None`` si nunca se cargó.
+
+        Las copias solo se conservan con ``CONTENT_CACHE_ENABLED``; con la caché
+        desactivada un fallo de MySQL responde siempre con un error.
+        """
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            return None
+        value, stored_at = snapshot
+        return StaleContent(value=value, age_seconds=max(0, int(self._clock() - stored_at)))
+
+    def mark_source_unavailable(self) -> None:
+        """Evita consultar MySQL durante el intervalo de recuperación tras un fallo."""
+        self._source_unavailable_until = self._clock() + self._stale_refresh_seconds
+
+    def source_available(self) -> bool:
+        """Indica si las lecturas deben intentar MySQL antes que la copia obsoleta."""
+        return self._clock() >= self._source_unavailable_until
+
+    def schedule_refresh(
+        self,
+        key: Hashable,
+        refresher: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Recarga en segundo plano la copia de ``key``.
+
+        Se lanza como mucho un intento por intervalo de recuperación, de modo que una
+        caída de MySQL no multiplica las conexiones fallidas.
+        """
+        now = self._clock()
+        if now < self._next_refresh_at.get(key, float("-inf")):
+            return
+        self._next_refresh_at[key] = now + self._stale_refresh_seconds
+
+        async def refresh() -> None:
+            try:
+                value = await refresher()
+            except Exception as exc:
+                logger.warning(
+                    "No se ha podido recuperar el contenido en segundo plano: %s",
+                    type(exc).__name__,
+                )
+                return
+            self._remember(key, value)
+            self._source_unavailable_until = float("-inf")
+            logger.info("Contenido recuperado en segundo plano tras un fallo de MySQL.")
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def store_shared(self, name: str, payload: bytes, ttl_seconds: int) -> bool:
+        """Guarda en Redis un dato compartido entre workers durante ``ttl_seconds``.
+
+        Devuelve ``False`` si la caché está desactivada o Redis no responde; quien lo
+        usa debe tratar el dato como ausente y seguir funcionando sin él.
+        """
+        if not self._enabled or self._redis is None:
+            return False
+        try:
+            await self._redis.set(self._shared_key(name), payload, ex=ttl_seconds)
+        except RedisError:
+            logger.warning("No se ha podido guardar un dato compartido en Redis.")
+            return False
+        return True
+
+    async def load_shared(self, name: str) -> bytes | None:
+        """Lee un dato guardado con ``store_shared`` o ``None`` si no está disponible."""
+        if not self._enabled or self._redis is None:
+            return None
+        try:
+            payload = await self._redis.get(self._shared_key(name))
+        except RedisError:
+            logger.warning("No se ha podido leer un dato compartido de Redis.")
+            return None
+        if isinstance(payload, str):
+            return payload.encode("utf-8")
+        return payload
+
+    def _shared_key(self, name: str) -> str:
+        return f"{self._version_key}:shared:{name}"
+
+    async def bump_version(self) -> int:
+        """Publica una versión nueva para que todos los workers descarten su caché."""
+        if self._redis is None:
+            raise RuntimeError("La caché de contenido no tiene un cliente Redis asociado")
+
+        version = await self._redis.incr(self._version_key)
+        self.invalidate()
+        return int(version)
+
+
+# Instancia compartida por los servicios del worker actual. ``main.lifespan`` le
+# asocia el cliente Redis durante el arranque y la desactiva en el cierre.
+content_cache = ContentCache(
+    enabled=settings.CONTENT_CACHE_ENABLED,
+    version_key=settings.REDIS_CONTENT_VERSION_KEY,
+    poll_interval_seconds=settings.CONTENT_CACHE_VERSION_POLL_SECONDS,
+    max_entries=settings.CONTENT_CACHE_MAX_ENTRIES,
+    max_page_entries=settings.CONTENT_CACHE_MAX_PAGE_ENTRIES,
+    max_age_seconds=settings.CONTENT_CACHE_MAX_AGE_SECONDS,
+    stale_refresh_seconds=settings.CONTENT_STALE_REFRESH_SECONDS,
+)
@@ -9,26 +9,46 @@ Este módulo incluye:
 - Creación de un pool Redis independiente para cada worker de Uvicorn.
 - Configuración de tiempos máximos y comprobación de conexiones inactivas.
 - Uso de un almacén compartido para que todos los procesos consulten las mismas claves.
+- Cliente de Redis Cluster cuando ``REDIS_CLUSTER_MODE`` está activo.
 
 Aunque cada worker mantiene su propio pool de conexiones, Redis centraliza los
 contadores utilizados por el rate limiting distribuido.
 """
 
+from typing import Union
+
 from redis.asyncio import Redis
+from redis.asyncio.cluster import RedisCluster
 
 from .config import Settings
 
+# Cliente de un único servidor o de un clúster; ambos ofrecen las mismas operaciones.
+RedisClient = Union[Redis, RedisCluster]
+
 
-def create_redis_client(settings: Settings) -> Redis:
+def create_redis_client(settings: Settings) -> RedisClient:
     """
     Crea el cliente Redis asíncrono del proceso Uvicorn actual.
 
+    En modo clúster ``REDIS_URL`` es un nodo semilla: el cliente descubre el resto
+    de nodos y envía cada comando al que contiene el slot de sus claves.
+    ``REDIS_MAX_CONNECTIONS`` se aplica entonces a cada nodo.
+
     Args:
         settings (Settings): Configuración validada de la aplicación.
 
     Returns:
-        Redis: Cliente respaldado por un pool de conexiones propio del worker.
+        RedisClient: Cliente respaldado por un pool de conexiones propio del worker.
     """
+    if settings.REDIS_CLUSTER_MODE:
+        return RedisCluster.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,  # Conserva respuestas binarias compatibles con los scripts Lua
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            health_check_interval=settings.REDIS_HEALTHCHECK_INTERVAL_SECONDS,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
     return Redis.from_url(
         settings.REDIS_URL,
         decode_responses=False,  # Conserva respuestas binarias compatibles con los scripts Lua
@@ -23,29 +23,106 @@ from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from redis.asyncio import Redis
 from .middleware.cache_control import ApiNoStoreMiddleware
+from .middleware.conditional_get import ConditionalGetMiddleware
 from .middleware.contact_auth import ContactTokenGuardMiddleware
 from .middleware.logging import LoggingMiddleware
 from .middleware.rate_limit import (
+    LeasingRateLimiter,
     RateLimiter,
     RateLimitMiddleware,
     RateLimitRule,
     RedisRateLimiter,
+    SLIDING_WINDOW_COUNTER,
+    anonymous_client_key,
 )
 from .middleware.request_size import RequestSizeLimitMiddleware, RequestSizeRule
 from contextlib import asynccontextmanager
-from .routers import contacto, charcuteria, blog, sitemap, token
+from .routers import batch, contacto, charcuteria, blog, sitemap, token
 from .database import engine
 from .core.config import settings
+from .core.content_cache import content_cache
 from .core.logging_config import configure_logging
-from .core.redis_client import create_redis_client
+from .core.redis_client import RedisClient, create_redis_client
+from .services.content_warmup import warm_up_content_cache
 import asyncio
 import logging
+import time
 from sqlalchemy import text
 
 configure_logging(settings)
 logger = logging.getLogger(__name__)
 
 
+def create_rate_limiter(redis_client: RedisClient) -> RedisRateLimiter:
+    """
+    Crea el limitador compartido; reserva permisos por bloques para las IP configuradas.
+
+    Args:
+        redis_client (RedisClient): Cliente Redis del worker, de un servidor o de un clúster.
+
+    Returns:
+        RedisRateLimiter: Limitador de Redis, con reservas si hay clientes configurados.
+    """
+    lease_client_ips = settings.rate_limit_lease_client_ips
+    if not lease_client_ips:
+        return RedisRateLimiter(
+            redis_client,
+            settings.REDIS_RATE_LIMIT_PREFIX,
+            cluster_mode=settings.REDIS_CLUSTER_MODE,
+        )
+
+    secret_key = settings.secret_key.encode("utf-8")
+    return LeasingRateLimiter(
+        redis_client,
+        settings.REDIS_RATE_LIMIT_PREFIX,
+        leased_client_keys={
+            anonymous_client_key(secret_key, client_ip) for client_ip in lease_client_ips
+        },
+        lease_size=settings.RATE_LIMIT_LEASE_SIZE,
+        lease_seconds=settings.RATE_LIMIT_LEASE_SECONDS,
+        cluster_mode=settings.REDIS_CLUSTER_MODE,
+    )
+
+
+async def warm_up_content(app: FastAPI) -> None:
+    """
+    Precarga la caché de contenido sin retrasar el arranque más allá del timeout de MySQL.
+
+    Solo se ejecuta con la base de datos disponible y la caché activa: sin una
+    versión de contenido conocida las entradas no se conservarían.
+
+    Args:
+        app (FastAPI): Instancia de la aplicación FastAPI.
+    """
+    if not app.state.database_available:
+        logger.info("Precarga de contenido omitida: la base de datos no está disponible.")
+        return
+    if await content_cache.current_version() is None:
+        logger.info("Precarga de contenido omitida: la caché de contenido no está activa.")
+        return
+
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(
+            warm_up_content_cache(max_concurrency=settings.DATABASE_POOL_SIZE),
+            timeout=settings.DATABASE_STARTUP_TIMEOUT_SECONDS,
+        )
+    except TimeoutError:
+        logger.warning(
+            "La precarga de contenido superó el tiempo máximo de %.1fs; "
+            "el resto se cargará con las primeras peticiones.",
+            settings.DATABASE_STARTUP_TIMEOUT_SECONDS,
+        )
+        return
+
+    logger.info(
+        "Precarga de contenido completada en %.2fs: %d lecturas correctas, %d fallidas.",
+        time.perf_counter() - started,
+        result.loaded,
+        result.failed,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -72,10 +149,7 @@ async def lifespan(app: FastAPI):
         app.state.redis_client_owned = True
 
     if getattr(app.state, "rate_limiter", None) is None:
-        app.state.rate_limiter = RedisRateLimiter(
-            redis_client,
-            settings.REDIS_RATE_LIMIT_PREFIX,
-        )
+        app.state.rate_limiter = create_rate_limiter(redis_client)
 
     async def initialize_database() -> None:
         # Comprueba que MySQL acepta conexiones antes de declarar disponible este worker.
@@ -148,10 +222,18 @@ async def lifespan(app: FastAPI):
             app.state.redis_available = True
             logger.info("Conexión con Redis verificada para el worker actual.")
 
+        # La caché de contenido comprueba su versión en el mismo Redis. Si Redis no
+        # responde más adelante, cada lectura vuelve a consultar MySQL directamente.
+        content_cache.bind(redis_client)
+
+        if settings.CONTENT_CACHE_WARMUP_ENABLED:
+            await warm_up_content(app)
+
         yield
     finally:
         # El cierre también debe ejecutarse si el servidor cancela el lifespan o se produce
         # una excepción mientras la aplicación está activa.
+        content_cache.unbind()
         try:
             if getattr(app.state, "redis_client_owned", True):
                 await redis_client.aclose()
@@ -200,10 +282,7 @@ def create_app(
     app.state.rate_limiter = (
         rate_limiter
         if rate_limiter is not None
-        else RedisRateLimiter(
-            app.state.redis_client,
-            settings.REDIS_RATE_LIMIT_PREFIX,
-        )
+        else create_rate_limiter(app.state.redis_client)
     )
     app.state.redis_available = rate_limiter is not None
     app.state.database_available = False
@@ -298,10 +377,20 @@ def create_app(
                 method="POST",
                 path="/api/contacto",
                 max_bytes=settings.CONTACT_MAX_REQUEST_BYTES,
-            )
+            ),
+            RequestSizeRule(
+                method="POST",
+                path="/api/batch",
+                max_bytes=batch.MAX_BATCH_REQUEST_BYTES,
+            ),
         ],
     )
 
+    # Responde 304 a revalidaciones de contenido sin consultar MySQL. Se registra antes
+    # que la barrera de token para ejecutarse después de ella: un 304 anticipado no
+    # pasa por las dependencias de la ruta.
+    app.add_middleware(ConditionalGetMiddleware)
+
     # FastAPI parsea formularios y archivos antes de ejecutar dependencias de ruta.
     # Esta barrera valida todos los endpoints protegidos y, en contacto, rechaza el
     # token antes de validar el encuadre o leer el cuerpo multipart.
@@ -320,11 +409,16 @@ def create_app(
         allow_credentials=True,
         allow_methods=["GET", "POST", "OPTIONS"],
         allow_headers=["Content-Type", "x-timed-token"],
+        # El listado paginado del blog devuelve el cursor siguiente en X-Next-Cursor y
+        # las copias servidas durante una caída de MySQL se marcan con X-Content-Stale.
+        expose_headers=["X-Next-Cursor", "X-Content-Stale", "Age"],
     )
 
     # Cada petición consume el límite global y, cuando corresponde, el límite específico
     # de su endpoint. Las comprobaciones se realizan de forma atómica para que una
     # petición bloqueada por la regla específica no agote también rutas no relacionadas.
+    # Las reglas de límite alto usan el contador de ventana deslizante, de memoria
+    # constante en Redis; las de pocos envíos mantienen el registro exacto.
     app.add_middleware(
         RateLimitMiddleware,
         rules=[
@@ -334,6 +428,7 @@ def create_app(
                 path="*",
                 max_requests=settings.GLOBAL_RATE_LIMIT_REQUESTS,
                 window_seconds=settings.GLOBAL_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
             ),
             RateLimitRule(
                 name="health",
@@ -370,6 +465,14 @@ def create_app(
                 max_requests=settings.CONTACT_RATE_LIMIT_REQUESTS,
                 window_seconds=settings.CONTACT_RATE_LIMIT_WINDOW_SECONDS,
             ),
+            RateLimitRule(
+                name="lote",
+                method="POST",
+                path="/api/batch",
+                max_requests=settings.READ_RATE_LIMIT_REQUESTS,
+                window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
+            ),
             RateLimitRule(
                 name="token",
                 method="GET",
@@ -383,6 +486,31 @@ def create_app(
                 path="/api/blog",
                 max_requests=settings.READ_RATE_LIMIT_REQUESTS,
                 window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
+            ),
+            RateLimitRule(
+                name="blog-resumenes",
+                method="GET",
+                path="/api/blog/summaries",
+                max_requests=settings.READ_RATE_LIMIT_REQUESTS,
+                window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
+            ),
+            RateLimitRule(
+                name="blog-busqueda",
+                method="GET",
+                path="/api/blog/search",
+                max_requests=settings.READ_RATE_LIMIT_REQUESTS,
+                window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
+            ),
+            RateLimitRule(
+                name="blog-traducciones",
+                method="GET",
+                path="/api/blog/translations",
+                max_requests=settings.READ_RATE_LIMIT_REQUESTS,
+                window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
             ),
             RateLimitRule(
                 name="blog-slug",
@@ -390,6 +518,7 @@ def create_app(
                 path="/api/blog/{slug}",
                 max_requests=settings.READ_RATE_LIMIT_REQUESTS,
                 window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
             ),
             RateLimitRule(
                 name="blog-id",
@@ -397,6 +526,7 @@ def create_app(
                 path="/api/blog/by-id/{id_noticia}",
                 max_requests=settings.READ_RATE_LIMIT_REQUESTS,
                 window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
             ),
             RateLimitRule(
                 name="charcuteria",
@@ -404,6 +534,23 @@ def create_app(
                 path="/api/charcuteria",
                 max_requests=settings.READ_RATE_LIMIT_REQUESTS,
                 window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
+            ),
+            RateLimitRule(
+                name="charcuteria-sugerencias",
+                method="GET",
+                path="/api/charcuteria/suggest",
+                max_requests=settings.READ_RATE_LIMIT_REQUESTS,
+                window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
+            ),
+            RateLimitRule(
+                name="charcuteria-catalogo",
+                method="GET",
+                path="/api/charcuteria/catalogo",
+                max_requests=settings.READ_RATE_LIMIT_REQUESTS,
+                window_seconds=settings.READ_RATE_LIMIT_WINDOW_SECONDS,
+                algorithm=SLIDING_WINDOW_COUNTER,
             ),
             RateLimitRule(
                 name="sitemap",
@@ -412,6 +559,20 @@ def create_app(
                 max_requests=settings.SITEMAP_RATE_LIMIT_REQUESTS,
                 window_seconds=settings.SITEMAP_RATE_LIMIT_WINDOW_SECONDS,
             ),
+            RateLimitRule(
+                name="sitemap-cambios",
+                method="GET",
+                path="/api/sitemap/blog/changes",
+                max_requests=settings.SITEMAP_RATE_LIMIT_REQUESTS,
+                window_seconds=settings.SITEMAP_RATE_LIMIT_WINDOW_SECONDS,
+            ),
+            RateLimitRule(
+                name="sitemap-xml",
+                method="GET",
+                path="/api/sitemap/blog.xml",
+                max_requests=settings.SITEMAP_RATE_LIMIT_REQUESTS,
+                window_seconds=settings.SITEMAP_RATE_LIMIT_WINDOW_SECONDS,
+            ),
         ],
         secret_key=settings.secret_key,
         trusted_proxy_ips=settings.trusted_proxy_ips,
@@ -436,6 +597,9 @@ def create_app(
     app.include_router(
         sitemap.router, prefix="/api", tags=["Sitemap"]
     )  # Datos mínimos del sitemap protegidos mediante token temporal
+    app.include_router(
+        batch.router, prefix="/api", tags=["Lotes"]
+    )  # Varias lecturas públicas con una sola verificación de token y rate limit
     app.include_router(
         token.router, prefix="/api", tags=["Token"]
     )  # Endpoint para obtener tokens temporales
@@ -6,7 +6,12 @@ from starlette.responses import Response
 
 
 class ApiNoStoreMiddleware(BaseHTTPMiddleware):
-    """Impide que navegadores o proxies compartidos reutilicen respuestas de `/api`."""
+    """Impide que navegadores o proxies compartidos reutilicen respuestas de `/api`.
+
+    Las respuestas con ETag (ver ``ConditionalGetMiddleware``) se marcan
+    ``private, no-cache``: siguen fuera de cachés compartidas y el cliente debe
+    revalidarlas siempre, pero puede conservar el cuerpo y recibir un 304.
+    """
 
     async def dispatch(
         self,
@@ -17,7 +22,10 @@ class ApiNoStoreMiddleware(BaseHTTPMiddleware):
         path = request.url.path.rstrip("/") or "/"
 
         if path == "/api" or path.startswith("/api/"):
-            response.headers["Cache-Control"] = "no-store, max-age=0"
+            if "etag" in response.headers:
+                response.headers["Cache-Control"] = "private, no-cache"
+            else:
+                response.headers["Cache-Control"] = "no-store, max-age=0"
             response.headers["Pragma"] = "no-cache"
 
         return response
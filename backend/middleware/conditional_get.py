@@ -0,0 +1,170 @@
+"""Revalidación condicional (ETag / If-None-Match) de los endpoints de contenido."""
+
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.config import settings
+from ..core.content_cache import STALE_CONTENT_HEADER, content_cache
+from .route_table import RouteTable
+
+
+@dataclass(frozen=True)
+class ConditionalRoute:
+    """Ruta GET cuya respuesta depende solo de la URL y de la versión de contenido.
+
+    Con ``answer_before_route`` el 304 se responde sin ejecutar el endpoint. Debe
+    desactivarse cuando la ruta aplica comprobaciones propias, como el origen local
+    del sitemap, que no pueden omitirse.
+    """
+
+    path: str
+    answer_before_route: bool = True
+
+
+class ConditionalGetMiddleware:
+    """Añade ETag fuertes y responde 304 cuando el cliente ya tiene la versión vigente.
+
+    La ETag resume la versión de contenido publicada en Redis, la ruta y la query.
+    Mientras la versión no cambia, la misma URL produce el mismo cuerpo, así que una
+    revalidación coincidente se contesta sin consultar MySQL. Sin versión conocida
+    (caché desactivada o Redis caído) no se emite ETag y la petición sigue igual.
+
+    La ETag incluye además el periodo de ``max_age_seconds`` en curso, la misma edad
+    máxima de la caché de contenido: una edición directa en MySQL sin versión nueva
+    deja de revalidarse con 304 al empezar el periodo siguiente.
+
+    Debe ejecutarse dentro de ``ContactTokenGuardMiddleware``: un 304 anticipado no
+    pasa por las dependencias de la ruta y la autenticación ya debe estar hecha.
+    """
+
+    DEFAULT_ROUTES: tuple[ConditionalRoute, ...] = (
+        ConditionalRoute("/api/blog"),
+        ConditionalRoute("/api/blog/summaries"),
+        ConditionalRoute("/api/blog/search"),
+        ConditionalRoute("/api/blog/translations"),
+        ConditionalRoute("/api/blog/{slug}"),
+        ConditionalRoute("/api/blog/by-id/{id_noticia}"),
+        ConditionalRoute("/api/charcuteria"),
+        ConditionalRoute("/api/charcuteria/catalogo"),
+        ConditionalRoute("/api/charcuteria/suggest"),
+        ConditionalRoute("/api/sitemap/blog", answer_before_route=False),
+        ConditionalRoute("/api/sitemap/blog/changes", answer_before_route=False),
+    )
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Iterable[ConditionalRoute] = DEFAULT_ROUTES,
+        version_provider: Callable[[], Awaitable[str | None]] | None = None,
+        max_age_seconds: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.app = app
+        self._max_age_seconds = max_age_seconds or settings.CONTENT_CACHE_MAX_AGE_SECONDS
+        self._clock = clock
+        self._routes: RouteTable[ConditionalRoute] = RouteTable(
+            ("GET", route.path, route) for route in routes
+        )
+        self._version_provider = version_provider or content_cache.current_version
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # HEAD no pasa por la barrera de token temprana; solo se atiende GET.
+        if scope["type"] != "http" or str(scope.get("method", "")).upper() != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        route = self._match(self._normalize_path(str(scope.get("path", "/"))))
+        if route is None:
+            await self.app(scope, receive, send)
+            return
+
+        # La versión se lee antes de generar el cuerpo: si cambia durante la petición,
+        # la respuesta queda marcada con la versión anterior y se descargará de nuevo,
+        # nunca al revés.
+        version = await self._version_provider()
+        if version is None:
+            await self.app(scope, receive, send)
+            return
+
+        etag = self._build_etag(version, scope)
+        client_has_current = self._matches(etag, scope)
+        if client_has_current and route.answer_before_route:
+            await self._send_not_modified(send, etag)
+            return
+
+        replaced = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal replaced
+            if replaced:
+                # El cuerpo de la respuesta sustituida por el 304 se descarta.
+                return
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                # Una copia obsoleta no corresponde a la versión vigente: sin ETag, el
+                # cliente no la conservará como válida cuando MySQL se recupere.
+                if STALE_CONTENT_HEADER in headers:
+                    await send(message)
+                    return
+                if client_has_current:
+                    replaced = True
+                    await self._send_not_modified(send, etag)
+                    return
+                headers["ETag"] = etag
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+    def _match(self, path: str) -> ConditionalRoute | None:
+        matching_routes = self._routes.match("GET", path)
+        return matching_routes[0] if matching_routes else None
+
+    def _build_etag(self, version: str, scope: Scope) -> str:
+        query = bytes(scope.get("query_string", b""))
+        # Se ordenan los parámetros para que ``?a=1&b=2`` y ``?b=2&a=1`` compartan ETag.
+        normalized_query = b"&".join(sorted(query.split(b"&"))) if query else b""
+        path = str(scope.get("path", "")).encode("utf-8")
+        epoch = str(int(self._clock() // self._max_age_seconds)).encode("ascii")
+        digest = hashlib.sha256()
+        for part in (version.encode("ascii", errors="replace"), epoch, path, normalized_query):
+            digest.update(part)
+            digest.update(b"\0")
+        return f'"{digest.hexdigest()[:32]}"'
+
+    @staticmethod
+    def _matches(etag: str, scope: Scope) -> bool:
+        for key, value in scope.get("headers", []):
+            if key.lower() != b"if-none-match":
+                continue
+            candidates = value.decode("latin-1").split(",")
+            for candidate in candidates:
+                # If-None-Match usa comparación débil: W/"x" equivale a "x". No se
+                # acepta "*": un 304 anticipado no sabe si el recurso existe.
+                if candidate.strip().removeprefix("W/") == etag:
+                    return True
+        return False
+
+    @staticmethod
+    async def _send_not_modified(send: Send, etag: str) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [
+                    (b"etag", etag.encode("ascii")),
+                    (b"cache-control", b"private, no-cache"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        normalized = path.rstrip("/")
+        return normalized or "/"
+
@@ -1,12 +1,11 @@
 """Autenticación temprana de endpoints protegidos mediante token temporal."""
 
-import re
 from collections.abc import Iterable
-from typing import Pattern
 
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..core.auth_utils import verify_timed_token
+from .route_table import RouteTable
 
 
 class ContactTokenGuardMiddleware:
@@ -19,11 +18,19 @@ class ContactTokenGuardMiddleware:
 
     DEFAULT_PROTECTED_ROUTES: tuple[tuple[str, str], ...] = (
         ("POST", "/api/contacto"),
+        ("POST", "/api/batch"),
         ("GET", "/api/blog"),
+        ("GET", "/api/blog/summaries"),
+        ("GET", "/api/blog/search"),
+        ("GET", "/api/blog/translations"),
         ("GET", "/api/blog/{slug}"),
         ("GET", "/api/blog/by-id/{id_noticia}"),
         ("GET", "/api/charcuteria"),
+        ("GET", "/api/charcuteria/catalogo"),
+        ("GET", "/api/charcuteria/suggest"),
         ("GET", "/api/sitemap/blog"),
+        ("GET", "/api/sitemap/blog/changes"),
+        ("GET", "/api/sitemap/blog.xml"),
     )
 
     def __init__(
@@ -32,11 +39,11 @@ class ContactTokenGuardMiddleware:
         protected_routes: Iterable[tuple[str, str]] = DEFAULT_PROTECTED_ROUTES,
     ) -> None:
         self.app = app
-        self._protected_routes: list[tuple[str, Pattern[str]]] = [
-            (method.upper(), self._compile_path_pattern(path))
+        self._protected_routes: RouteTable[bool] = RouteTable(
+            (method, path, True)
             for method, path in protected_routes
             if method.strip() and path.strip()
-        ]
+        )
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -83,21 +90,7 @@ class ContactTokenGuardMiddleware:
         await self.app(scope, receive, send)
 
     def _is_protected(self, method: str, path: str) -> bool:
-        return any(
-            configured_method == method and path_pattern.fullmatch(path)
-            for configured_method, path_pattern in self._protected_routes
-        )
-
-    @classmethod
-    def _compile_path_pattern(cls, path: str) -> Pattern[str]:
-        normalized = cls._normalize_path(path)
-        pattern_segments: list[str] = []
-        for segment in normalized.split("/"):
-            if segment.startswith("{") and segment.endswith("}") and len(segment) > 2:
-                pattern_segments.append(r"[^/]+")
-            else:
-                pattern_segments.append(re.escape(segment))
-        return re.compile(r"^" + "/".join(pattern_segments) + r"$")
+        return bool(self._protected_routes.match(method, path))
 
     @staticmethod
     async def _send_json_error(send: Send, status_code: int, detail: str) -> None:
@@ -13,6 +13,13 @@ Este módulo mantiene contadores temporales compartidos en Redis para:
 
 La limitación distribuida actúa como barrera común para todos los workers. Redis y un
 script Lua atómico evitan que cada proceso mantenga contadores independientes.
+
+Cada regla elige su algoritmo:
+- ``sliding_log``: un miembro de sorted set por petición; exacto, pero su memoria
+  crece con el límite. Adecuado para límites bajos como el del formulario.
+- ``sliding_window_counter``: dos contadores (ventana actual y anterior) en un hash
+  por regla y cliente; el recuento se estima ponderando la ventana anterior por la
+  parte que aún se solapa. Memoria constante para límites altos como el global.
 """
 
 import asyncio
@@ -21,17 +28,16 @@ import hmac
 import logging
 import math
 import os
-import re
 import secrets
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass
 from typing import (
     Callable,
     Deque,
     Dict,
     Iterable,
-    Pattern,
+    Literal,
     Protocol,
     Sequence,
     Set,
@@ -40,53 +46,136 @@ from typing import (
 
 from fastapi import Request
 from redis.asyncio import Redis
+from redis.asyncio.cluster import RedisCluster
 from redis.exceptions import RedisError
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import JSONResponse, Response
 
 from ..core.client_ip import normalize_host, resolve_client_host
+from .route_table import RouteTable
 
 logger = logging.getLogger(__name__)
 
 
+SLIDING_LOG = "sliding_log"
+SLIDING_WINDOW_COUNTER = "sliding_window_counter"
+RateLimitAlgorithm = Literal["sliding_log", "sliding_window_counter"]
+# Código que recibe el script Lua para cada algoritmo.
+RATE_LIMIT_ALGORITHM_CODES: Dict[str, int] = {SLIDING_LOG: 0, SLIDING_WINDOW_COUNTER: 1}
+
 # Comprueba todas las reglas aplicables y registra la petición en una única operación.
-# KEYS contiene un sorted set por regla. ARGV contiene el instante, un miembro único
-# y, por cada clave, el máximo de peticiones y la ventana en milisegundos.
+# KEYS contiene un sorted set (registro) o un hash (contador) por regla. ARGV contiene
+# el instante, un miembro único y, por cada clave, el máximo de peticiones, la ventana
+# en milisegundos y el código del algoritmo. El hash del contador guarda la ventana
+# actual (w), sus peticiones (c) y las de la ventana anterior (p).
 RATE_LIMIT_LUA_SCRIPT = r"""
 local now_ms = tonumber(ARGV[1])
 local member = ARGV[2]
+local counters = {}
 
 for index = 1, #KEYS do
-    local argument_offset = 3 + ((index - 1) * 2)
+    local argument_offset = 3 + ((index - 1) * 3)
     local max_requests = tonumber(ARGV[argument_offset])
     local window_ms = tonumber(ARGV[argument_offset + 1])
-    local cutoff_ms = now_ms - window_ms
-
-    redis.call('ZREMRANGEBYSCORE', KEYS[index], '-inf', cutoff_ms)
-    local current_count = redis.call('ZCARD', KEYS[index])
-
-    if current_count >= max_requests then
-        local oldest = redis.call('ZRANGE', KEYS[index], 0, 0, 'WITHSCORES')
-        local retry_ms = window_ms
-        if oldest[2] ~= nil then
-            retry_ms = tonumber(oldest[2]) + window_ms - now_ms
+    local algorithm = tonumber(ARGV[argument_offset + 2])
+    local retry_ms = nil
+
+    if algorithm == 1 then
+        local window_index = math.floor(now_ms / window_ms)
+        local stored = redis.call('HMGET', KEYS[index], 'w', 'c', 'p')
+        local stored_window = tonumber(stored[1])
+        local current = tonumber(stored[2]) or 0
+        local previous = tonumber(stored[3]) or 0
+        if stored_window == window_index - 1 then
+            previous = current
+            current = 0
+        elseif stored_window ~= window_index then
+            previous = 0
+            current = 0
+        end
+        counters[index] = {window_index, current, previous}
+
+        local remaining_ms = (window_index + 1) * window_ms - now_ms
+        if previous * remaining_ms / window_ms + current + 1 > max_requests then
+            if current + 1 > max_requests then
+                retry_ms = remaining_ms + window_ms * (1 - (max_requests - 1) / current)
+            else
+                retry_ms = remaining_ms - (max_requests - 1 - current) * window_ms / previous
+            end
         end
-        local retry_seconds = math.max(1, math.ceil(retry_ms / 1000))
-        return {0, retry_seconds, index}
+    else
+        redis.call('ZREMRANGEBYSCORE', KEYS[index], '-inf', now_ms - window_ms)
+        local current_count = redis.call('ZCARD', KEYS[index])
+
+        if current_count >= max_requests then
+            local oldest = redis.call('ZRANGE', KEYS[index], 0, 0, 'WITHSCORES')
+            retry_ms = window_ms
+            if oldest[2] ~= nil then
+                retry_ms = tonumber(oldest[2]) + window_ms - now_ms
+            end
+        end
+    end
+
+    if retry_ms ~= nil then
+        return {0, math.max(1, math.ceil(retry_ms / 1000)), index}
     end
 end
 
 for index = 1, #KEYS do
-    local argument_offset = 3 + ((index - 1) * 2)
+    local argument_offset = 3 + ((index - 1) * 3)
     local window_ms = tonumber(ARGV[argument_offset + 1])
-    redis.call('ZADD', KEYS[index], now_ms, member)
-    redis.call('PEXPIRE', KEYS[index], window_ms)
+    local counter = counters[index]
+    if counter ~= nil then
+        redis.call('HSET', KEYS[index], 'w', counter[1], 'c', counter[2] + 1, 'p', counter[3])
+        -- La ventana anterior sigue contando hasta el final de la actual.
+        redis.call('PEXPIRE', KEYS[index], window_ms * 2)
+    else
+        redis.call('ZADD', KEYS[index], now_ms, member)
+        redis.call('PEXPIRE', KEYS[index], window_ms)
+    end
 end
 
 return {1, 0, 0}
 """
 
 
+def evaluate_window_counter(
+    state: Tuple[int, int, int] | None,
+    now_ms: int,
+    max_requests: int,
+    window_ms: int,
+) -> tuple[Tuple[int, int, int], int | None]:
+    """Replica en Python la estimación del contador de ventana deslizante del script Lua.
+
+    Args:
+        state: Ventana guardada, peticiones en ella y en la anterior, o None.
+        now_ms: Instante actual en milisegundos.
+        max_requests: Máximo de peticiones por ventana.
+        window_ms: Duración de la ventana en milisegundos.
+
+    Returns:
+        El estado desplazado a la ventana actual y los milisegundos hasta que se
+        admitiría la petición, o None si se admite ya.
+    """
+    window_index = now_ms // window_ms
+    stored_window, current, previous = state if state is not None else (None, 0, 0)
+    if stored_window == window_index - 1:
+        previous, current = current, 0
+    elif stored_window != window_index:
+        previous, current = 0, 0
+
+    remaining_ms = (window_index + 1) * window_ms - now_ms
+    retry_ms: float | None = None
+    if previous * remaining_ms / window_ms + current + 1 > max_requests:
+        if current + 1 > max_requests:
+            retry_ms = remaining_ms + window_ms * (1 - (max_requests - 1) / current)
+        else:
+            retry_ms = remaining_ms - (max_requests - 1 - current) * window_ms / previous
+    return (window_index, current, previous), (
+        math.ceil(retry_ms) if retry_ms is not None else None
+    )
+
+
 @dataclass(frozen=True)
 class RateLimitRule:
     """Describe un límite aplicable a un método y una ruta concretos."""
@@ -96,6 +185,7 @@ class RateLimitRule:
     path: str
     max_requests: int
     window_seconds: int
+    algorithm: RateLimitAlgorithm = SLIDING_LOG
 
     def __post_init__(self) -> None:
         if not self.name.strip():
@@ -108,6 +198,8 @@ class RateLimitRule:
             raise ValueError("max_requests debe ser mayor que cero")
         if self.window_seconds <= 0:
             raise ValueError("window_seconds debe ser mayor que cero")
+        if self.algorithm not in RATE_LIMIT_ALGORITHM_CODES:
+            raise ValueError("algorithm no es un algoritmo de rate limit conocido")
 
 
 class InMemoryRateLimiter:
@@ -121,6 +213,7 @@ class InMemoryRateLimiter:
         self._clock = clock
         self._requests: Dict[Tuple[str, str], Deque[float]] = defaultdict(deque)
         self._window_seconds: Dict[Tuple[str, str], int] = {}
+        self._counters: Dict[Tuple[str, str], Tuple[int, int, int]] = {}
         self._lock = asyncio.Lock()
         self._last_cleanup = self._clock()
 
@@ -145,14 +238,27 @@ class InMemoryRateLimiter:
 
         now = self._clock()
         prepared_buckets: list[tuple[RateLimitRule, Deque[float]]] = []
+        prepared_counters: list[tuple[Tuple[str, str], Tuple[int, int, int]]] = []
 
         async with self._lock:
             self._cleanup_expired_buckets(now)
 
             for rule in rules:
                 bucket_key = (rule.name, client_key)
-                bucket = self._requests[bucket_key]
                 self._window_seconds[bucket_key] = rule.window_seconds
+                if rule.algorithm == SLIDING_WINDOW_COUNTER:
+                    state, retry_ms = evaluate_window_counter(
+                        self._counters.get(bucket_key),
+                        int(now * 1000),
+                        rule.max_requests,
+                        rule.window_seconds * 1000,
+                    )
+                    if retry_ms is not None:
+                        return False, max(1, math.ceil(retry_ms / 1000)), rule
+                    prepared_counters.append((bucket_key, state))
+                    continue
+
+                bucket = self._requests[bucket_key]
                 cutoff = now - rule.window_seconds
 
                 while bucket and bucket[0] <= cutoff:
@@ -166,6 +272,8 @@ class InMemoryRateLimiter:
 
             for _, bucket in prepared_buckets:
                 bucket.append(now)
+            for bucket_key, (window_index, current, previous) in prepared_counters:
+                self._counters[bucket_key] = (window_index, current + 1, previous)
 
         return True, 0, None
 
@@ -187,6 +295,16 @@ class InMemoryRateLimiter:
             self._requests.pop(bucket_key, None)
             self._window_seconds.pop(bucket_key, None)
 
+        now_ms = int(now * 1000)
+        expired_counters = [
+            bucket_key
+            for bucket_key, (window_index, _, _) in self._counters.items()
+            if now_ms // (self._window_seconds.get(bucket_key, 60) * 1000) > window_index + 1
+        ]
+        for bucket_key in expired_counters:
+            self._counters.pop(bucket_key, None)
+            self._window_seconds.pop(bucket_key, None)
+
         self._last_cleanup = now
 
 
@@ -211,19 +329,26 @@ class RedisRateLimiter:
 
     El script Lua comprueba primero todas las reglas y solo registra la petición
     cuando ninguna está agotada. Así se conserva la atomicidad que ya ofrecía el
-    limitador en memoria, pero utilizando un estado común entre procesos.
+    limitador en memoria, pero utilizando un estado común entre procesos. Las reglas
+    de registro y de contador pueden mezclarse en la misma comprobación.
+
+    En Redis Cluster todas las claves de un script deben estar en el mismo slot. Con
+    ``cluster_mode`` el cliente va entre llaves (``prefijo:{cliente}:regla``): las
+    reglas de un cliente comparten slot y los clientes se reparten entre nodos.
     """
 
     def __init__(
         self,
-        redis_client: Redis,
+        redis_client: Redis | RedisCluster,
         key_prefix: str,
         *,
         clock: Callable[[], float] = time.time,
+        cluster_mode: bool = False,
     ) -> None:
         self._redis = redis_client
         self._key_prefix = key_prefix.rstrip(":")
         self._clock = clock
+        self._cluster_mode = cluster_mode
         self._script = redis_client.register_script(RATE_LIMIT_LUA_SCRIPT)
 
     async def check_many(
@@ -239,10 +364,16 @@ class RedisRateLimiter:
         # El miembro debe ser único incluso cuando dos workers reciben una petición
         # durante el mismo milisegundo; de lo contrario ZADD sobrescribiría una entrada.
         member = f"{now_ms}:{os.getpid()}:{secrets.token_hex(8)}"
-        keys = [f"{self._key_prefix}:{rule.name}:{client_key}" for rule in rules]
+        keys = [self._build_key(rule, client_key) for rule in rules]
         arguments: list[str | int] = [now_ms, member]
         for rule in rules:
-            arguments.extend((rule.max_requests, rule.window_seconds * 1000))
+            arguments.extend(
+                (
+                    rule.max_requests,
+                    rule.window_seconds * 1000,
+                    RATE_LIMIT_ALGORITHM_CODES[rule.algorithm],
+                )
+            )
 
         try:
             raw_result = await self._script(keys=keys, args=arguments)
@@ -273,9 +404,357 @@ class RedisRateLimiter:
 
         return False, max(1, retry_after), rules[blocked_index - 1]
 
+    def _build_key(self, rule: RateLimitRule, client_key: str) -> str:
+        """Separa las claves por algoritmo: cambiar el de una regla no reutiliza otro tipo."""
+        suffix = ":contador" if rule.algorithm == SLIDING_WINDOW_COUNTER else ""
+        if self._cluster_mode:
+            return f"{self._key_prefix}:{{{client_key}}}:{rule.name}{suffix}"
+        return f"{self._key_prefix}:{rule.name}{suffix}:{client_key}"
+
+
+# Clientes bloqueados que cada worker recuerda para responder 429 sin consultar Redis.
+DEFAULT_MAX_BLOCKED_CLIENTS = 10_000
+
+# Una reserva nunca toma más de esta fracción (1/N) del límite de la regla, para que
+# un worker no agote la cuota que comparten los demás.
+LEASE_QUOTA_DIVISOR = 10
+# Por debajo de este tamaño una reserva no ahorra llamadas: la regla se consulta en Redis.
+MIN_LEASE_GRANT = 2
+
+
+# Reserva de una vez varios permisos de todas las reglas indicadas y devuelve los
+# sobrantes de reservas caducadas. ARGV contiene el instante y, por cada clave, el
+# máximo, la ventana en milisegundos, el algoritmo, los permisos pedidos, los
+# sobrantes devueltos y el identificador de la reserva que los generó: prefijo de
+# sus miembros en el registro o índice de su ventana en el contador. Si alguna regla
+# no tiene ningún permiso libre no se reserva nada y se devuelve la espera.
+RATE_LIMIT_LEASE_LUA_SCRIPT = r"""
+local now_ms = tonumber(ARGV[1])
+local counters = {}
+local grants = {}
+
+for index = 1, #KEYS do
+    local argument_offset = 2 + ((index - 1) * 6)
+    local algorithm = tonumber(ARGV[argument_offset + 2])
+    local released = tonumber(ARGV[argument_offset + 4])
+    local lease_id = ARGV[argument_offset + 5]
+
+    if released > 0 then
+        if algorithm == 1 then
+            local stored = redis.call('HMGET', KEYS[index], 'w', 'c', 'p')
+            local stored_window = tonumber(stored[1])
+            local lease_window = tonumber(lease_id)
+            if stored_window == lease_window then
+                local current = math.max(0, (tonumber(stored[2]) or 0) - released)
+                redis.call('HSET', KEYS[index], 'c', current)
+            elseif stored_window == lease_window + 1 then
+                local previous = math.max(0, (tonumber(stored[3]) or 0) - released)
+                redis.call('HSET', KEYS[index], 'p', previous)
+            end
+        else
+            local members = {}
+            for position = 1, released do
+                members[position] = lease_id .. ':' .. position
+            end
+            redis.call('ZREM', KEYS[index], unpack(members))
+        end
+    end
+end
+
+for index = 1, #KEYS do
+    local argument_offset = 2 + ((index - 1) * 6)
+    local max_requests = tonumber(ARGV[argument_offset])
+    local window_ms = tonumber(ARGV[argument_offset + 1])
+    local algorithm = tonumber(ARGV[argument_offset + 2])
+    local requested = tonumber(ARGV[argument_offset + 3])
+    local available = 0
+    local retry_ms = nil
+
+    if algorithm == 1 then
+        local window_index = math.floor(now_ms / window_ms)
+        local stored = redis.call('HMGET', KEYS[index], 'w', 'c', 'p')
+        local stored_window = tonumber(stored[1])
+        local current = tonumber(stored[2]) or 0
+        local previous = tonumber(stored[3]) or 0
+        if stored_window == window_index - 1 then
+            previous = current
+            current = 0
+        elseif stored_window ~= window_index then
+            previous = 0
+            current = 0
+        end
+        counters[index] = {window_index, current, previous}
+
+        local remaining_ms = (window_index + 1) * window_ms - now_ms
+        available = math.floor(max_requests - previous * remaining_ms / window_ms - current)
+        if available < 1 then
+            if current + 1 > max_requests then
+                retry_ms = remaining_ms + window_ms * (1 - (max_requests - 1) / current)
+            else
+                retry_ms = remaining_ms - (max_requests - 1 - current) * window_ms / previous
+            end
+        end
+    else
+        redis.call('ZREMRANGEBYSCORE', KEYS[index], '-inf', now_ms - window_ms)
+        available = max_requests - redis.call('ZCARD', KEYS[index])
+        if available < 1 then
+            local oldest = redis.call('ZRANGE', KEYS[index], 0, 0, 'WITHSCORES')
+            retry_ms = window_ms
+            if oldest[2] ~= nil then
+                retry_ms = tonumber(oldest[2]) + window_ms - now_ms
+            end
+        end
+    end
+
+    if retry_ms ~= nil then
+        return {0, math.max(1, math.ceil(retry_ms / 1000)), index}
+    end
+    grants[index] = math.min(requested, available)
+end
+
+local result = {1, 0, 0}
+for index = 1, #KEYS do
+    local argument_offset = 2 + ((index - 1) * 6)
+    local window_ms = tonumber(ARGV[argument_offset + 1])
+    local lease_id = ARGV[argument_offset + 5]
+    local counter = counters[index]
+    if counter ~= nil then
+        redis.call('HSET', KEYS[index], 'w', counter[1], 'c', counter[2] + grants[index], 'p', counter[3])
+        redis.call('PEXPIRE', KEYS[index], window_ms * 2)
+    else
+        local entries = {}
+        for position = 1, grants[index] do
+            entries[#entries + 1] = now_ms
+            entries[#entries + 1] = lease_id .. ':' .. position
+        end
+        redis.call('ZADD', KEYS[index], unpack(entries))
+        redis.call('PEXPIRE', KEYS[index], window_ms)
+    end
+    result[#result + 1] = grants[index]
+end
+
+return result
+"""
+
+
+@dataclass
+class _Lease:
+    """Permisos reservados en Redis para una regla y un cliente."""
+
+    remaining: int
+    expires_at: float
+    lease_id: str
+
+
+class LeasingRateLimiter(RedisRateLimiter):
+    """Reserva bloques de permisos en Redis para los clientes de mucho volumen.
+
+    El renderizado de Next.js llama a la API desde unas pocas IP y cada petición
+    pagaba una llamada al script Lua. Para esos clientes el worker reserva de una
+    vez hasta ``lease_size`` permisos de cada regla, con el mismo script atómico que
+    comprueba los límites, y los gasta en memoria. Al caducar la reserva, los
+    permisos sin usar se devuelven en la siguiente reserva de la misma regla; si el
+    cliente no vuelve, simplemente caducan con la ventana.
+
+    El límite sigue siendo común a todos los workers: un permiso reservado cuenta en
+    Redis aunque aún no se haya gastado. Como se registra al reservarlo, un permiso
+    gastado hasta ``lease_seconds`` más tarde sale de la ventana antes que la
+    petición real; por eso la duración de la reserva debe ser pequeña frente a la
+    ventana. El resto de clientes usa ``RedisRateLimiter`` sin cambios.
+
+    Cada reserva se limita a ``max_requests // LEASE_QUOTA_DIVISOR`` permisos. Las
+    reglas de límite bajo (sitemap, token, health), en las que ese tope no llega a
+    ``MIN_LEASE_GRANT``, no se reservan: una reserva de toda su cuota en un worker
+    dejaría al cliente bloqueado en los demás hasta que acabara la ventana.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis | RedisCluster,
+        key_prefix: str,
+        *,
+        leased_client_keys: Iterable[str],
+        lease_size: int,
+        lease_seconds: float,
+        clock: Callable[[], float] = time.time,
+        cluster_mode: bool = False,
+    ) -> None:
+        super().__init__(redis_client, key_prefix, clock=clock, cluster_mode=cluster_mode)
+        if lease_size < 1:
+            raise ValueError("lease_size debe ser mayor que cero")
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds debe ser mayor que cero")
+        self._leased_client_keys = frozenset(leased_client_keys)
+        self._lease_size = lease_size
+        self._lease_seconds = lease_seconds
+        self._lease_script = redis_client.register_script(RATE_LIMIT_LEASE_LUA_SCRIPT)
+        self._leases: Dict[Tuple[str, str], _Lease] = {}
+        # Un cerrojo por cliente: las reservas de un cliente no esperan a las de otro.
+        self._locks: Dict[str, asyncio.Lock] = {
+            client_key: asyncio.Lock() for client_key in self._leased_client_keys
+        }
+
+    async def check_many(
+        self,
+        rules: Sequence[RateLimitRule],
+        client_key: str,
+    ) -> tuple[bool, int, RateLimitRule | None]:
+        """Gasta permisos reservados y solo consulta Redis cuando alguna reserva se agota.
+
+        Las reglas que no admiten reserva se comprueban después en Redis; si alguna
+        bloquea la petición, los permisos reservados que se iban a gastar se recuperan.
+        """
+        if client_key not in self._leased_client_keys:
+            return await super().check_many(rules, client_key)
+        leased_rules = [rule for rule in rules if self._lease_grant(rule) >= MIN_LEASE_GRANT]
+        if not leased_rules:
+            return await super().check_many(rules, client_key)
+        plain_rules = [rule for rule in rules if self._lease_grant(rule) < MIN_LEASE_GRANT]
+
+        async with self._locks[client_key]:
+            now = self._clock()
+            exhausted = [
+                rule
+                for rule in leased_rules
+                if not self._lease_usable(self._leases.get((rule.name, client_key)), now)
+            ]
+            if exhausted:
+                blocked = await self._renew_leases(exhausted, client_key, now)
+                if blocked is not None:
+                    return blocked
+
+            # Todas las reglas reservadas tienen permisos: se gasta uno de cada.
+            spent = [self._leases[(rule.name, client_key)] for rule in leased_rules]
+            for lease in spent:
+                lease.remaining -= 1
+
+        if not plain_rules:
+            return True, 0, None
+        try:
+            result = await super().check_many(plain_rules, client_key)
+        except RateLimiterUnavailableError:
+            self._refund(spent)
+            raise
+        if not result[0]:
+            self._refund(spent)
+        return result
+
+    def _lease_grant(self, rule: RateLimitRule) -> int:
+        """Permisos que puede tomar una reserva de ``rule``."""
+        return min(self._lease_size, rule.max_requests // LEASE_QUOTA_DIVISOR)
+
+    @staticmethod
+    def _refund(leases: Sequence[_Lease]) -> None:
+        # Si la reserva se renovó entretanto, el permiso queda en la reserva anterior y
+        # sigue contando en Redis hasta el final de su ventana: el error es conservador.
+        for lease in leases:
+            lease.remaining += 1
+
+    @staticmethod
+    def _lease_usable(lease: _Lease | None, now: float) -> bool:
+        return lease is not None and lease.remaining > 0 and lease.expires_at > now
+
+    async def _renew_leases(
+        self,
+        rules: Sequence[RateLimitRule],
+        client_key: str,
+        now: float,
+    ) -> tuple[bool, int, RateLimitRule] | None:
+        """Reserva permisos para las reglas agotadas y devuelve el bloqueo si lo hay."""
+        now_ms = int(now * 1000)
+        lease_ids: list[str] = []
+        arguments: list[str | int] = [now_ms]
+        for rule in rules:
+            window_ms = rule.window_seconds * 1000
+            if rule.algorithm == SLIDING_WINDOW_COUNTER:
+                lease_id = str(now_ms // window_ms)
+            else:
+                lease_id = f"{now_ms}:{os.getpid()}:{secrets.token_hex(8)}"
+            lease_ids.append(lease_id)
+
+            # Solo quedan sobrantes en reservas caducadas: las vigentes se renuevan
+            # al agotarse.
+            previous = self._leases.get((rule.name, client_key))
+            released = previous.remaining if previous is not None else 0
+            arguments.extend(
+                (
+                    rule.max_requests,
+                    window_ms,
+                    RATE_LIMIT_ALGORITHM_CODES[rule.algorithm],
+                    self._lease_grant(rule),
+                    released,
+                    previous.lease_id if previous is not None and released else "",
+                )
+            )
+
+        # Los sobrantes se dan por devueltos antes de llamar: si la respuesta se pierde
+        # no se devuelven dos veces, como mucho se pierden.
+        for rule in rules:
+            previous = self._leases.get((rule.name, client_key))
+            if previous is not None:
+                previous.remaining = 0
+
+        try:
+            raw_result = await self._lease_script(
+                keys=[self._build_key(rule, client_key) for rule in rules],
+                args=arguments,
+            )
+        except RedisError as error:
+            raise RateLimiterUnavailableError("Redis no está disponible") from error
+
+        if not isinstance(raw_result, (list, tuple)) or len(raw_result) not in (
+            3,
+            3 + len(rules),
+        ):
+            raise RateLimiterUnavailableError(
+                "Redis devolvió una respuesta de reserva de rate limit no válida"
+            )
+        try:
+            values = [int(value) for value in raw_result]
+        except (TypeError, ValueError) as error:
+            raise RateLimiterUnavailableError(
+                "Redis devolvió datos de reserva de rate limit no válidos"
+            ) from error
+
+        if values[0] != 1:
+            blocked_index = values[2]
+            if blocked_index < 1 or blocked_index > len(rules):
+                raise RateLimiterUnavailableError(
+                    "Redis devolvió una regla bloqueada no válida"
+                )
+            return False, max(1, values[1]), rules[blocked_index - 1]
+
+        if len(values) != 3 + len(rules):
+            raise RateLimiterUnavailableError(
+                "Redis devolvió una respuesta de reserva de rate limit no válida"
+            )
+        expires_at = now + self._lease_seconds
+        for rule, lease_id, granted in zip(rules, lease_ids, values[3:]):
+            self._leases[(rule.name, client_key)] = _Lease(
+                remaining=granted,
+                expires_at=expires_at,
+                lease_id=lease_id,
+            )
+        return None
+
+
+def anonymous_client_key(secret_key: bytes, client_host: str) -> str:
+    """Deriva el identificador del cliente sin conservar su IP en claro."""
+    return hmac.new(
+        secret_key,
+        client_host.encode("utf-8", errors="replace"),
+        hashlib.sha256,
+    ).hexdigest()[:16]
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Aplica reglas de frecuencia antes de que FastAPI lea formularios o adjuntos."""
+    """Aplica reglas de frecuencia antes de que FastAPI lea formularios o adjuntos.
+
+    Cuando el limitador bloquea a un cliente, el worker recuerda hasta cuándo para
+    esa regla y responde 429 desde memoria mientras dure, sin volver a consultar
+    Redis. Durante un ataque, la carga de Redis depende así del número de clientes
+    distintos y no del volumen de peticiones.
+    """
 
     _DEPENDENCY_STATUS_PATHS = frozenset({"/health", "/livez"})
 
@@ -289,17 +768,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         cors_allow_credentials: bool = False,
         clock: Callable[[], float] = time.monotonic,
         limiter: RateLimiter | None = None,
+        max_blocked_clients: int = DEFAULT_MAX_BLOCKED_CLIENTS,
     ) -> None:
         super().__init__(app)
+        if max_blocked_clients < 0:
+            raise ValueError("max_blocked_clients no puede ser negativo")
         raw_rules = list(rules)
         rule_names = [rule.name for rule in raw_rules]
         if len(rule_names) != len(set(rule_names)):
             raise ValueError("Los nombres de las reglas de rate limit deben ser únicos")
 
-        self._rules: list[tuple[RateLimitRule, Pattern[str]]] = [
-            (rule, self._compile_path_pattern(rule.path))
-            for rule in raw_rules
-        ]
+        self._route_table: RouteTable[RateLimitRule] = RouteTable(
+            (rule.method, rule.path, rule) for rule in raw_rules
+        )
         self._secret_key = secret_key.encode("utf-8")
         self._trusted_proxy_ips: Set[str] = {
             normalize_host(value)
@@ -317,21 +798,25 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self._limiter: RateLimiter = (
             limiter if limiter is not None else InMemoryRateLimiter(clock=clock)
         )
+        self._clock = clock
+        # (regla, cliente) -> instante del reloj en que vuelve a consultarse el limitador.
+        self._blocked_until: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._max_blocked_clients = max_blocked_clients
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         normalized_path = self._normalize_path(request.url.path)
-        request_method = request.method.upper()
-        matching_rules = [
-            rule
-            for rule, path_pattern in self._rules
-            if (rule.method == "*" or rule.method.upper() == request_method)
-            and path_pattern.fullmatch(normalized_path)
-        ]
+        matching_rules = self._route_table.match(request.method, normalized_path)
 
         if not matching_rules:
             return await call_next(request)
 
         client_key = self._build_anonymous_client_key(request)
+        retry_after = self._local_retry_after(matching_rules, client_key)
+        if retry_after is not None:
+            # Ya se registró el bloqueo al recibirlo del limitador; repetirlo en cada
+            # petición de una inundación solo llenaría el log.
+            return self._too_many_requests(request, retry_after)
+
         try:
             allowed, retry_after, blocked_rule = await self._limiter.check_many(
                 matching_rules,
@@ -349,6 +834,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if allowed:
             return await call_next(request)
 
+        if blocked_rule is not None:
+            self._remember_block(blocked_rule, client_key, retry_after)
         # El identificador está derivado mediante HMAC y no permite recuperar la IP original.
         logger.warning(
             "Límite de solicitudes excedido | endpoint=%s | cliente=%s | reintento=%ss",
@@ -356,6 +843,42 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             client_key,
             retry_after,
         )
+        return self._too_many_requests(request, retry_after)
+
+    def _local_retry_after(
+        self,
+        rules: Sequence[RateLimitRule],
+        client_key: str,
+    ) -> int | None:
+        """Devuelve la espera si alguna regla aplicable sigue bloqueada en este worker."""
+        if not self._blocked_until:
+            return None
+
+        now = self._clock()
+        retry_after: int | None = None
+        for rule in rules:
+            bucket_key = (rule.name, client_key)
+            blocked_until = self._blocked_until.get(bucket_key)
+            if blocked_until is None:
+                continue
+            if blocked_until <= now:
+                del self._blocked_until[bucket_key]
+                continue
+            remaining = max(1, math.ceil(blocked_until - now))
+            retry_after = remaining if retry_after is None else max(retry_after, remaining)
+        return retry_after
+
+    def _remember_block(self, rule: RateLimitRule, client_key: str, retry_after: int) -> None:
+        """Guarda el bloqueo devuelto por el limitador, descartando los más antiguos."""
+        if self._max_blocked_clients == 0:
+            return
+        bucket_key = (rule.name, client_key)
+        self._blocked_until.pop(bucket_key, None)
+        self._blocked_until[bucket_key] = self._clock() + retry_after
+        while len(self._blocked_until) > self._max_blocked_clients:
+            self._blocked_until.popitem(last=False)
+
+    def _too_many_requests(self, request: Request, retry_after: int) -> Response:
         headers = {
             "Retry-After": str(retry_after),
             "Cache-Control": "no-store",
@@ -430,34 +953,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             )
 
     def _build_anonymous_client_key(self, request: Request) -> str:
-        client_host = self._resolve_client_host(request)
-        return hmac.new(
-            self._secret_key,
-            client_host.encode("utf-8", errors="replace"),
-            hashlib.sha256,
-        ).hexdigest()[:16]
+        return anonymous_client_key(self._secret_key, self._resolve_client_host(request))
 
     def _resolve_client_host(self, request: Request) -> str:
         """Usa cabeceras de proxy solo cuando la conexión procede de un proxy confiable."""
         return resolve_client_host(request, self._trusted_proxy_ips, logger)
 
-    @classmethod
-    def _compile_path_pattern(cls, path: str) -> Pattern[str]:
-        """Compila rutas exactas, globales o con parámetros ``{nombre}``."""
-        if path.strip() == "*":
-            return re.compile(r"^.*$")
-
-        normalized = cls._normalize_path(path)
-        segments = normalized.split("/")
-        pattern_segments: list[str] = []
-        for segment in segments:
-            if segment.startswith("{") and segment.endswith("}") and len(segment) > 2:
-                pattern_segments.append(r"[^/]+")
-            else:
-                pattern_segments.append(re.escape(segment))
-
-        return re.compile(r"^" + "/".join(pattern_segments) + r"$")
-
     @staticmethod
     def _normalize_path(path: str) -> str:
         normalized = path.rstrip("/")
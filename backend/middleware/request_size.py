@@ -13,6 +13,8 @@ from typing import Iterable
 
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from .route_table import RouteTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,10 +40,9 @@ class RequestSizeLimitMiddleware:
 
     def __init__(self, app: ASGIApp, rules: Iterable[RequestSizeRule]) -> None:
         self.app = app
-        self._rules = {
-            (rule.method.upper(), self._normalize_path(rule.path)): rule
-            for rule in rules
-        }
+        self._rules: RouteTable[RequestSizeRule] = RouteTable(
+            (rule.method, rule.path, rule) for rule in rules
+        )
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -50,11 +51,12 @@ class RequestSizeLimitMiddleware:
 
         method = str(scope.get("method", "")).upper()
         path = self._normalize_path(str(scope.get("path", "/")))
-        rule = self._rules.get((method, path))
-        if rule is None:
+        matching_rules = self._rules.match(method, path)
+        if not matching_rules:
             await self.app(scope, receive, send)
             return
 
+        rule = matching_rules[0]
         raw_headers = scope.get("headers", [])
         content_length_values = [
             value for key, value in raw_headers if key.lower() == b"content-length"
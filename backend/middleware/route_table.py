@@ -0,0 +1,141 @@
+# backend/middleware/route_table.py
+
+"""
+middleware/route_table.py
+
+Tabla de rutas compilada que comparten los middlewares de rate limit, token,
+tamaño de cuerpo y revalidación condicional.
+
+Las rutas configuradas (``/api/blog/{slug}``, ``*`` para cualquier ruta) se
+organizan en un árbol de segmentos. Una búsqueda recorre la ruta de la petición una
+sola vez, siguiendo a la vez el segmento literal y el comodín ``{param}``, y devuelve
+todos los valores que coinciden en el orden en que se registraron: lo mismo que
+comprobar cada expresión regular con ``fullmatch``, sin recorrer la lista completa.
+El resultado de cada combinación de plantillas y método se calcula una vez y se
+reutiliza en las peticiones siguientes.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Método de las entradas que se aplican a cualquier método.
+ANY_METHOD = "*"
+# Ruta de las entradas que se aplican a cualquier ruta.
+ANY_PATH = "*"
+
+
+def normalize_route_path(path: str) -> str:
+    """Ignora la barra final, igual que el enrutado de la aplicación."""
+    normalized = path.rstrip("/")
+    return normalized or "/"
+
+
+def _is_parameter(segment: str) -> bool:
+    return segment.startswith("{") and segment.endswith("}") and len(segment) > 2
+
+
+class _Node(Generic[T]):
+    """Segmento del árbol con sus hijos literales, su comodín y las entradas que terminan en él."""
+
+    __slots__ = ("index", "children", "parameter", "entries")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.children: Dict[str, "_Node[T]"] = {}
+        self.parameter: Optional["_Node[T]"] = None
+        self.entries: List[Tuple[int, str, T]] = []
+
+
+class RouteTable(Generic[T]):
+    """Resuelve en una búsqueda los valores registrados para un método y una ruta."""
+
+    def __init__(self, routes: Iterable[Tuple[str, str, T]]) -> None:
+        """
+        Compila las rutas configuradas.
+
+        Args:
+            routes: Tuplas ``(método, ruta, valor)``. El método ``*`` y la ruta ``*``
+                coinciden con cualquiera.
+        """
+        self._node_count = 0
+        self._root: _Node[T] = self._new_node()
+        self._any_path: List[Tuple[int, str, T]] = []
+        self._methods: set[str] = set()
+        for order, (method, path, value) in enumerate(routes):
+            entry = (order, method.strip().upper(), value)
+            self._methods.add(entry[1])
+            if path.strip() == ANY_PATH:
+                self._any_path.append(entry)
+            else:
+                self._insert(normalize_route_path(path).split("/"), entry)
+        # (método, plantillas alcanzadas) -> valores, en orden de registro.
+        self._resolved: Dict[Tuple[str, Tuple[int, ...]], Tuple[T, ...]] = {}
+
+    def match(self, method: str, path: str) -> Tuple[T, ...]:
+        """
+        Devuelve los valores cuyas rutas y métodos coinciden con la petición.
+
+        Args:
+            method (str): Método HTTP de la petición.
+            path (str): Ruta de la petición, con o sin barra final.
+
+        Returns:
+            Tuple[T, ...]: Valores coincidentes en el orden en que se registraron.
+        """
+        method = method.upper()
+        # Los métodos no configurados comparten entrada: solo les afectan las reglas ``*``.
+        if method not in self._methods:
+            method = ""
+        terminals = self._terminals(normalize_route_path(path).split("/"))
+        key = (method, tuple(node.index for node in terminals))
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            entries = sorted(
+                (*self._any_path, *(entry for node in terminals for entry in node.entries)),
+                key=lambda entry: entry[0],
+            )
+            resolved = tuple(
+                value
+                for _, entry_method, value in entries
+                if entry_method == ANY_METHOD or entry_method == method
+            )
+            self._resolved[key] = resolved
+        return resolved
+
+    def _new_node(self) -> _Node[T]:
+        node: _Node[T] = _Node(self._node_count)
+        self._node_count += 1
+        return node
+
+    def _insert(self, segments: Sequence[str], entry: Tuple[int, str, T]) -> None:
+        node = self._root
+        for segment in segments:
+            if _is_parameter(segment):
+                if node.parameter is None:
+                    node.parameter = self._new_node()
+                node = node.parameter
+            else:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = self._new_node()
+                node = child
+        node.entries.append(entry)
+
+    def _terminals(self, segments: Sequence[str]) -> Tuple[_Node[T], ...]:
+        """Recorre el árbol siguiendo a la vez literales y comodines."""
+        nodes: List[_Node[T]] = [self._root]
+        for segment in segments:
+            next_nodes: List[_Node[T]] = []
+            for node in nodes:
+                child = node.children.get(segment)
+                if child is not None:
+                    next_nodes.append(child)
+                # Un parámetro nunca coincide con un segmento vacío (``//``).
+                if node.parameter is not None and segment:
+                    next_nodes.append(node.parameter)
+            if not next_nodes:
+                return ()
+            nodes = next_nodes
+        return tuple(node for node in nodes if node.entries)
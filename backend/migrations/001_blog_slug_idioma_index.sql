@@ -0,0 +1,13 @@
+-- backend/migrations/001_blog_slug_idioma_index.sql
+--
+-- Índice de búsqueda por slug de la tabla 'blog'.
+--
+-- Sin él, GET /api/blog/{slug} recorre la tabla completa cuando el índice local
+-- de slugs del worker no está disponible (arranque, Redis caído o slug ausente).
+-- No es UNIQUE: la base de datos no garantiza hoy que cada slug sea único por
+-- idioma y el servicio ya elige la copia válida más reciente.
+--
+-- Ejecución (una sola vez, con un usuario con permiso ALTER):
+--   mysql -u usuario -p paraisoweb < backend/migrations/001_blog_slug_idioma_index.sql
+
+CREATE INDEX ix_blog_slug_idioma ON blog (slug, idioma);
@@ -0,0 +1,17 @@
+-- backend/migrations/002_public_validation_mark.sql
+--
+-- Marca de validación pública de las tablas 'blog' y 'charcuteria'.
+--
+-- Con CONTENT_VALIDATED_ON_WRITE=true las lecturas públicas solo devuelven las filas
+-- con publicamente_valido = TRUE y construyen las respuestas sin volver a validarlas.
+-- La marca la escriben la importación (backend/tools/import_content) y la validación
+-- por lotes (backend/tools/validate_public_content). Las filas existentes empiezan sin
+-- marca: ejecute la validación antes de activar la opción.
+--
+-- Ejecución (una sola vez, con un usuario con permiso ALTER, antes de importar con
+-- backend/tools/import_content):
+--   mysql -u usuario -p paraisoweb < backend/migrations/002_public_validation_mark.sql
+--   python -m backend.tools.validate_public_content
+
+ALTER TABLE blog ADD COLUMN publicamente_valido BOOLEAN NOT NULL DEFAULT FALSE;
+ALTER TABLE charcuteria ADD COLUMN publicamente_valido BOOLEAN NOT NULL DEFAULT FALSE;
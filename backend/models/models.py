@@ -11,8 +11,8 @@ Este archivo incluye:
 - Definición de claves primarias, columnas y relaciones.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, func, PrimaryKeyConstraint
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, false, func, Index, PrimaryKeyConstraint
+from sqlalchemy.orm import declarative_base, deferred
 
 # Creación de la clase base para los modelos
 Base = declarative_base()
@@ -34,6 +34,8 @@ class Charcuteria(Base):
         imagen_url (str): URL de la imagen representativa del producto.
         categoria (str): Categoría a la que pertenece el producto (e.g., 'embutidos').
         fecha (datetime): Fecha de creación del registro.
+        publicamente_valido (bool): Si la fila cumple el contrato público según la
+            última validación en escritura.
     """
     __tablename__ = TABLE_NAME_CHARCUTERIA
 
@@ -45,6 +47,8 @@ class Charcuteria(Base):
     imagen_url = Column(String(255), nullable=False)  # URL de la imagen del producto
     categoria = Column(String(50), nullable=False)  # Categoría del producto (e.g., 'embutidos', 'quesos')
     fecha = Column(DateTime(timezone=True), server_default=func.now())  # Fecha de creación del registro
+    # Diferida: las lecturas solo la usan como filtro y sin la migración 002 no se consulta.
+    publicamente_valido = deferred(Column(Boolean, nullable=False, default=False, server_default=false()))
 
     __table_args__ = (
         PrimaryKeyConstraint('id_producto', 'idioma', name="pk_id_producto_idioma"),
@@ -70,6 +74,8 @@ class Blog(Base):
         imagen_url_2 (str, optional): URL de una segunda imagen asociada.
         fecha_publicacion (datetime): Fecha en que se publicó la noticia.
         fecha_actualizacion (datetime): Fecha de la última actualización de la noticia.
+        publicamente_valido (bool): Si la fila cumple el contrato público según la
+            última validación en escritura.
     """
     __tablename__ = TABLE_NAME_BLOG
 
@@ -83,11 +89,14 @@ class Blog(Base):
     imagen_url_2 = Column(String(255), nullable=True)             # URL de una segunda imagen (opcional)
     fecha_publicacion = Column(DateTime, default=func.now(), nullable=False)  # Fecha de publicación
     fecha_actualizacion = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=True)  # Puede ser nula en registros antiguos
+    publicamente_valido = deferred(Column(Boolean, nullable=False, default=False, server_default=false()))
 
     __table_args__ = (
         PrimaryKeyConstraint('id_noticia', 'idioma', name="pk_id_noticia_idioma"),
+        Index("ix_blog_slug_idioma", "slug", "idioma"),
     )
     """
     Clave primaria compuesta por 'id_noticia' e 'idioma', garantizando la unicidad del registro
-    para cada combinación de identificador e idioma.
+    para cada combinación de identificador e idioma. El índice 'ix_blog_slug_idioma' evita
+    recorrer la tabla al buscar por slug; se crea con backend/migrations.
     """
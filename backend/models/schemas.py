@@ -10,10 +10,11 @@ Este archivo incluye:
 - Esquemas para el formulario de contacto.
 - Esquemas para la tabla 'charcuteria'.
 - Esquemas para la tabla 'blog'.
+- Esquemas para las lecturas por lotes.
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Literal, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Any, Dict, List, Literal, Optional
 from datetime import datetime
 from urllib.parse import unquote
 import re
@@ -23,6 +24,7 @@ from ..core.blog_slug import normalize_blog_slug
 
 
 MAX_ASSET_DECODE_PASSES = 5
+MAX_BATCH_OPERATIONS = 10
 ALLOWED_CONTACT_MESSAGE_FORMAT_CHARACTERS = {"\u200c", "\u200d"}
 
 
@@ -393,39 +395,53 @@ class SitemapBlogEntry(BaseModel):
     lastmod: datetime
 
 
-# Esquemas para la Tabla 'charcuteria'
-class CharcuteriaBase(BaseModel):
+class SitemapBlogRemoval(BaseModel):
+    """Publicación que ha dejado de formar parte del sitemap."""
+
+    id_noticia: int = Field(gt=0)
+    idioma: Literal["es", "en", "de", "fr"]
+
+
+class SitemapBlogChanges(BaseModel):
     """
-    Esquema base para los productos de charcutería.
+    Cambios del sitemap desde un cursor anterior.
 
     Atributos:
-        idioma (str): Idioma del producto (ejemplo: 'es').
-        nombre (str): Nombre del producto.
-        empresa (Optional[str]): Empresa del producto, si está informada.
-        descripcion (str): Descripción detallada del producto.
-        imagen_url (str): URL de la imagen del producto.
-        categoria (str): Categoría del producto (ejemplo: 'Embutidos').
+        completo (bool): Si es verdadero, ``entradas`` contiene el sitemap entero y
+            sustituye a la copia del cliente.
+        cursor (str): Cursor opaco que representa el estado devuelto.
+        entradas (list[SitemapBlogEntry]): Entradas nuevas o modificadas.
+        eliminadas (list[SitemapBlogRemoval]): Entradas que deben retirarse.
     """
-    idioma: Literal["es", "en", "de", "fr"]
-    nombre: str
-    empresa: Optional[str] = None
-    descripcion: str
-    imagen_url: str
-    categoria: str
 
-    @field_validator("nombre", "categoria", mode="before")
+    completo: bool
+    cursor: str
+    entradas: list[SitemapBlogEntry]
+    eliminadas: list[SitemapBlogRemoval]
+
+
+# Esquemas para la Tabla 'charcuteria'
+class CharcuteriaPublicValidators(BaseModel):
+    """
+    Validadores del contrato público de charcutería.
+
+    Igual que en el blog, se declaran con ``check_fields=False`` para que las
+    proyecciones de ``fields=`` apliquen las mismas reglas a los campos incluidos.
+    """
+
+    @field_validator("nombre", "categoria", mode="before", check_fields=False)
     @classmethod
     def validate_required_single_line_text(cls, value: object, info) -> object:
         """Protege los textos de una línea usados como encabezados públicos."""
         return _require_safe_public_text(value, info.field_name)
 
-    @field_validator("descripcion", mode="before")
+    @field_validator("descripcion", mode="before", check_fields=False)
     @classmethod
     def validate_required_multiline_text(cls, value: object, info) -> object:
         """Permite saltos normales, pero no controles invisibles en la descripción."""
         return _require_safe_public_text(value, info.field_name, multiline=True)
 
-    @field_validator("empresa", mode="before")
+    @field_validator("empresa", mode="before", check_fields=False)
     @classmethod
     def normalize_optional_company(cls, value: object) -> object:
         """Representa empresas heredadas vacías como ausencia real y valida las informadas."""
@@ -435,7 +451,7 @@ class CharcuteriaBase(BaseModel):
             return _require_safe_public_text(value, "empresa")
         return value
 
-    @field_validator("imagen_url")
+    @field_validator("imagen_url", check_fields=False)
     @classmethod
     def validate_image_path(cls, value: str) -> str:
         """Solo expone imágenes relativas que permanezcan dentro del directorio público."""
@@ -444,6 +460,26 @@ class CharcuteriaBase(BaseModel):
         return value
 
 
+class CharcuteriaBase(CharcuteriaPublicValidators):
+    """
+    Esquema base para los productos de charcutería.
+
+    Atributos:
+        idioma (str): Idioma del producto (ejemplo: 'es').
+        nombre (str): Nombre del producto.
+        empresa (Optional[str]): Empresa del producto, si está informada.
+        descripcion (str): Descripción detallada del producto.
+        imagen_url (str): URL de la imagen del producto.
+        categoria (str): Categoría del producto (ejemplo: 'Embutidos').
+    """
+    idioma: Literal["es", "en", "de", "fr"]
+    nombre: str
+    empresa: Optional[str] = None
+    descripcion: str
+    imagen_url: str
+    categoria: str
+
+
 class CharcuteriaCreate(CharcuteriaBase):
     """
     Esquema para crear nuevos registros en la tabla 'charcuteria'.
@@ -467,29 +503,83 @@ class Charcuteria(CharcuteriaBase):
     model_config = {"from_attributes": True}
 
 
-# Esquemas para la Tabla 'blog'
-class BlogBase(BaseModel):
+class CharcuteriaFacetCount(BaseModel):
     """
-    Esquema base para las publicaciones de blog.
+    Recuento de productos para un valor de faceta del catálogo.
 
     Atributos:
-        idioma (str): Idioma de la publicación (ejemplo: 'es', 'en').
-        slug (str): Slug único para la URL amigable.
-        titulo (str): Título de la publicación.
-        contenido (str): Contenido completo de la publicación.
-        autor (str): Autor de la publicación.
-        imagen_url (str): URL de la imagen principal de la publicación.
-        imagen_url_2 (Optional[str]): URL de una segunda imagen (opcional).
+        valor (str): Categoría o empresa.
+        total (int): Número de productos con ese valor.
+    """
+    valor: str
+    total: int
+
+
+class CharcuteriaCategoryGroup(BaseModel):
+    """
+    Categoría del catálogo con sus productos ya agrupados.
+
+    Atributos:
+        categoria (str): Nombre de la categoría.
+        total (int): Número de productos incluidos en el grupo.
+        productos (List[Charcuteria]): Productos ordenados por nombre.
+    """
+    categoria: str
+    total: int
+    productos: List[Charcuteria]
+
+
+class CharcuteriaCatalog(BaseModel):
+    """
+    Catálogo de charcutería agrupado por categoría con recuentos por faceta.
+
+    Cada faceta cuenta los productos aplicando solo el filtro de la otra faceta,
+    de modo que el frontend puede mostrar las alternativas disponibles sin pedir
+    el catálogo completo.
+
+    Atributos:
+        idioma (str): Idioma del catálogo.
+        total (int): Número de productos que cumplen todos los filtros.
+        categorias (List[CharcuteriaCategoryGroup]): Grupos que cumplen los filtros.
+        facetas_categoria (List[CharcuteriaFacetCount]): Recuento por categoría.
+        facetas_empresa (List[CharcuteriaFacetCount]): Recuento por empresa.
     """
     idioma: Literal["es", "en", "de", "fr"]
-    slug: str
-    titulo: str
-    contenido: str
-    autor: str
+    total: int
+    categorias: List[CharcuteriaCategoryGroup]
+    facetas_categoria: List[CharcuteriaFacetCount]
+    facetas_empresa: List[CharcuteriaFacetCount]
+
+
+class CharcuteriaSuggestion(BaseModel):
+    """
+    Producto sugerido al autocompletar la búsqueda por nombre.
+
+    Atributos:
+        id_producto (int): Identificador único del producto.
+        nombre (str): Nombre del producto.
+        empresa (Optional[str]): Empresa del producto, si está informada.
+        categoria (str): Categoría del producto.
+        imagen_url (str): URL de la imagen del producto.
+    """
+    id_producto: int
+    nombre: str
+    empresa: Optional[str] = None
+    categoria: str
     imagen_url: str
-    imagen_url_2: Optional[str] = None
 
-    @field_validator("slug", mode="before")
+
+# Esquemas para la Tabla 'blog'
+class BlogPublicValidators(BaseModel):
+    """
+    Validadores del contrato público del blog.
+
+    Se declaran con ``check_fields=False`` para que las proyecciones parciales, como
+    los resúmenes del listado, apliquen exactamente las mismas reglas a los campos
+    que contienen sin tener que declarar también el resto.
+    """
+
+    @field_validator("slug", mode="before", check_fields=False)
     @classmethod
     def validate_slug(cls, value: object) -> str:
         """Normaliza el slug y rechaza rutas que el frontend no puede representar."""
@@ -498,19 +588,19 @@ class BlogBase(BaseModel):
             raise ValueError("slug no válido")
         return normalized_slug
 
-    @field_validator("titulo", "autor", mode="before")
+    @field_validator("titulo", "autor", mode="before", check_fields=False)
     @classmethod
     def validate_required_single_line_text(cls, value: object, info) -> object:
         """Protege títulos y autores usados en tarjetas y metadatos públicos."""
         return _require_safe_public_text(value, info.field_name)
 
-    @field_validator("contenido", mode="before")
+    @field_validator("contenido", "extracto", mode="before", check_fields=False)
     @classmethod
     def validate_required_multiline_text(cls, value: object, info) -> object:
         """Conserva el formato normal del artículo y rechaza controles peligrosos."""
         return _require_safe_public_text(value, info.field_name, multiline=True)
 
-    @field_validator("imagen_url")
+    @field_validator("imagen_url", check_fields=False)
     @classmethod
     def validate_primary_image_path(cls, value: str) -> str:
         """Valida la ruta pública obligatoria de la imagen principal."""
@@ -518,7 +608,7 @@ class BlogBase(BaseModel):
             raise ValueError("imagen_url no contiene una ruta pública segura")
         return value
 
-    @field_validator("imagen_url_2", mode="before")
+    @field_validator("imagen_url_2", mode="before", check_fields=False)
     @classmethod
     def validate_optional_image_path(cls, value: object) -> object:
         """Normaliza imágenes opcionales vacías y valida las rutas informadas."""
@@ -529,6 +619,28 @@ class BlogBase(BaseModel):
         return value
 
 
+class BlogBase(BlogPublicValidators):
+    """
+    Esquema base para las publicaciones de blog.
+
+    Atributos:
+        idioma (str): Idioma de la publicación (ejemplo: 'es', 'en').
+        slug (str): Slug único para la URL amigable.
+        titulo (str): Título de la publicación.
+        contenido (str): Contenido completo de la publicación.
+        autor (str): Autor de la publicación.
+        imagen_url (str): URL de la imagen principal de la publicación.
+        imagen_url_2 (Optional[str]): URL de una segunda imagen (opcional).
+    """
+    idioma: Literal["es", "en", "de", "fr"]
+    slug: str
+    titulo: str
+    contenido: str
+    autor: str
+    imagen_url: str
+    imagen_url_2: Optional[str] = None
+
+
 class BlogCreate(BlogBase):
     """
     Esquema para crear nuevas publicaciones en la tabla 'blog'.
@@ -552,3 +664,114 @@ class Blog(BlogBase):
     fecha_actualizacion: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
+
+
+class BlogSummary(BlogPublicValidators):
+    """
+    Resumen de una publicación para los listados, sin el contenido completo.
+
+    Atributos:
+        id_noticia (int): Identificador único de la noticia.
+        idioma (str): Idioma de la publicación.
+        slug (str): Slug único para la URL amigable.
+        titulo (str): Título de la publicación.
+        autor (str): Autor de la publicación.
+        imagen_url (str): URL de la imagen principal de la publicación.
+        imagen_url_2 (Optional[str]): URL de una segunda imagen (opcional).
+        extracto (str): Comienzo del contenido, recortado en un límite de palabra.
+        fecha_publicacion (datetime): Fecha de publicación de la noticia.
+        fecha_actualizacion (datetime): Fecha de última actualización de la noticia.
+    """
+    id_noticia: int = Field(gt=0)
+    idioma: Literal["es", "en", "de", "fr"]
+    slug: str
+    titulo: str
+    autor: str
+    imagen_url: str
+    imagen_url_2: Optional[str] = None
+    extracto: str
+    fecha_publicacion: datetime
+    fecha_actualizacion: Optional[datetime] = None
+
+
+class BlogSearchResult(BlogSummary):
+    """
+    Resumen de una publicación encontrada por la búsqueda de texto completo.
+
+    Atributos adicionales:
+        puntuacion (float): Relevancia BM25 de la publicación para la consulta.
+    """
+    puntuacion: float
+
+
+# Esquemas para las lecturas por lotes
+class BatchRead(BaseModel):
+    """
+    Lectura incluida en una petición por lotes.
+
+    Atributos:
+        clave (str): Nombre con el que se devuelve el resultado.
+        recurso (str): Lectura solicitada.
+        idioma (str): Idioma del contenido; las traducciones lo ignoran.
+        slug (Optional[str]): Slug de la publicación; obligatorio en ``blog-slug``.
+    """
+    model_config = {"extra": "forbid"}
+
+    clave: str = Field(min_length=1, max_length=40, pattern=r"^[A-Za-z0-9_-]+$")
+    recurso: Literal["blog", "blog-traducciones", "blog-slug", "charcuteria"]
+    idioma: Literal["es", "en", "de", "fr"] = "es"
+    slug: Optional[str] = Field(default=None, min_length=1, max_length=150)
+
+    @model_validator(mode="after")
+    def validate_slug_presence(self) -> "BatchRead":
+        """Exige el slug solo en la lectura de una publicación."""
+        if (self.recurso == "blog-slug") != (self.slug is not None):
+            raise ValueError("slug solo se admite, y es obligatorio, en el recurso blog-slug")
+        return self
+
+
+class BatchRequest(BaseModel):
+    """
+    Lecturas que se resuelven en una sola petición.
+
+    Atributos:
+        operaciones (List[BatchRead]): Lecturas con claves distintas.
+    """
+    model_config = {"extra": "forbid"}
+
+    operaciones: List[BatchRead] = Field(min_length=1, max_length=MAX_BATCH_OPERATIONS)
+
+    @field_validator("operaciones")
+    @classmethod
+    def validate_unique_keys(cls, value: List[BatchRead]) -> List[BatchRead]:
+        """Rechaza claves repetidas, que se pisarían en la respuesta."""
+        keys = [operation.clave for operation in value]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Las claves de las operaciones deben ser distintas")
+        return value
+
+
+class BatchResult(BaseModel):
+    """
+    Resultado de una lectura del lote.
+
+    Atributos:
+        estado (int): Código HTTP que habría devuelto el endpoint individual.
+        datos (Any): Cuerpo JSON del endpoint individual, si la lectura tuvo éxito.
+        detalle (Optional[str]): Motivo del error, si lo hubo.
+        antiguedad (Optional[int]): Segundos de la copia servida si MySQL no respondía.
+    """
+    estado: int
+    datos: Any = None
+    detalle: Optional[str] = None
+    antiguedad: Optional[int] = None
+
+
+class BatchResponse(BaseModel):
+    """
+    Resultados de una petición por lotes, indexados por la clave de cada lectura.
+
+    Atributos:
+        resultados (Dict[str, BatchResult]): Resultado de cada operación.
+    """
+    resultados: Dict[str, BatchResult]
@@ -0,0 +1,199 @@
+# backend/routers/batch.py
+
+"""
+routers/batch.py
+
+Router para resolver varias lecturas públicas en una sola petición.
+
+El servidor de Next.js necesita, para una página, el listado del blog, el mapa de
+traducciones y el catálogo de charcutería. Por separado, cada lectura recorre el
+rate limit, la verificación del token y el log. ``POST /api/batch`` las recibe
+juntas: el token se verifica y el límite se consume una sola vez, las lecturas
+comparten la sesión de la petición y la respuesta es un único documento JSON.
+
+Cada resultado conserva el código HTTP y el cuerpo que habría devuelto su endpoint
+individual, incluida la última copia válida cuando MySQL no responde. Si tras un
+fallo no se puede descartar la transacción de la sesión compartida, el lote se
+detiene y las lecturas pendientes responden 503.
+
+Dependencias:
+- FastAPI: Para definir el endpoint y validar la petición.
+- Servicios: ``BlogService`` y ``CharcuteriaService`` con su caché de contenido.
+"""
+
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.exc import DBAPIError, TimeoutError as SQLAlchemyTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.blog_slug import normalize_blog_slug
+from ..core.content_cache import StaleContent, content_cache
+from ..dependencies import get_db, verify_token
+from ..models import schemas
+from ..services.blog_service import BlogService
+from ..services.charcuteria_service import CharcuteriaService
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Cabe holgadamente el máximo de operaciones con slugs largos.
+MAX_BATCH_REQUEST_BYTES = 16 * 1024
+
+_SERVICE_UNAVAILABLE_DETAIL = "Servicio de datos temporalmente no disponible"
+
+
+class _BrokenSessionError(Exception):
+    """La sesión compartida no ha podido descartar una transacción fallida."""
+
+
+@dataclass(frozen=True)
+class _BatchOutcome:
+    """Resultado de una lectura antes de componer la respuesta."""
+
+    status: int
+    body: bytes | None = None
+    detail: str | None = None
+    stale_age: int | None = None
+
+
+@dataclass(frozen=True)
+class _BatchReader:
+    """Lectura de un recurso, su copia obsoleta y el detalle si no existe."""
+
+    load: Callable[[], Awaitable[bytes | None]]
+    stale: Callable[[], StaleContent[bytes] | None]
+    not_found: str = "Recurso no encontrado"
+
+
+def _reader_for(
+    operation: schemas.BatchRead,
+    blog_service: BlogService,
+    charcuteria_service: CharcuteriaService,
+) -> _BatchReader | None:
+    """Asocia la operación con los mismos métodos que usa su endpoint individual."""
+    idioma = operation.idioma
+    if operation.recurso == "blog":
+        return _BatchReader(
+            load=lambda: blog_service.get_all_posts_json(idioma),
+            stale=lambda: blog_service.stale_all_posts_json(idioma),
+        )
+    if operation.recurso == "blog-traducciones":
+        return _BatchReader(
+            load=blog_service.get_translations_json,
+            stale=blog_service.stale_translations_json,
+        )
+    if operation.recurso == "charcuteria":
+        return _BatchReader(
+            load=lambda: charcuteria_service.get_all_products_json(idioma),
+            stale=lambda: charcuteria_service.stale_all_products_json(idioma),
+        )
+
+    slug = normalize_blog_slug(operation.slug)
+    if slug is None:
+        return None
+    return _BatchReader(
+        load=lambda: blog_service.get_post_by_slug_json(slug, idioma),
+        stale=lambda: blog_service.stale_post_by_slug_json(slug, idioma),
+        not_found="Blog no encontrado",
+    )
+
+
+def _stale_outcome(stale: StaleContent[bytes] | None) -> _BatchOutcome | None:
+    if stale is None:
+        return None
+    return _BatchOutcome(status=200, body=stale.value, stale_age=stale.age_seconds)
+
+
+async def _run_read(operation: schemas.BatchRead, db: AsyncSession) -> _BatchOutcome:
+    """Ejecuta una lectura y convierte sus errores en el resultado correspondiente."""
+    reader = _reader_for(operation, BlogService(db), CharcuteriaService(db))
+    if reader is None:
+        return _BatchOutcome(status=422, detail="Slug de blog no válido")
+
+    try:
+        if not content_cache.source_available():
+            stale = _stale_outcome(reader.stale())
+            if stale is not None:
+                return stale
+        body = await reader.load()
+        if body is None:
+            return _BatchOutcome(status=404, detail=reader.not_found)
+        return _BatchOutcome(status=200, body=body)
+    except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        try:
+            # La sesión es compartida: se descarta la transacción fallida para que las
+            # lecturas siguientes puedan servirse desde la caché o volver a intentarlo.
+            await db.rollback()
+        except Exception as exc:
+            logger.exception("No se ha podido descartar la transacción de una lectura por lotes")
+            raise _BrokenSessionError from exc
+        stale = _stale_outcome(reader.stale())
+        if stale is not None:
+            logger.warning("Base de datos no disponible; el lote sirve la última copia válida")
+            return stale
+        logger.exception("Base de datos no disponible en una lectura por lotes")
+        return _BatchOutcome(status=503, detail=_SERVICE_UNAVAILABLE_DETAIL)
+    except Exception:
+        logger.exception("Error inesperado en una lectura por lotes")
+        return _BatchOutcome(status=500, detail="Error interno al procesar la lectura")
+
+
+def render_batch_response(results: list[tuple[str, _BatchOutcome]]) -> bytes:
+    """Compone el documento insertando los cuerpos JSON ya serializados sin decodificarlos."""
+    entries: list[bytes] = []
+    for key, outcome in results:
+        fields = [b'"estado":%d' % outcome.status]
+        if outcome.body is not None:
+            fields.append(b'"datos":' + outcome.body)
+        if outcome.detail is not None:
+            fields.append(b'"detalle":' + json.dumps(outcome.detail).encode("ascii"))
+        if outcome.stale_age is not None:
+            fields.append(b'"antiguedad":%d' % outcome.stale_age)
+        entries.append(json.dumps(key).encode("ascii") + b":{" + b",".join(fields) + b"}")
+    return b'{"resultados":{' + b",".join(entries) + b"}}"
+
+
+@router.post("/batch", response_model=schemas.BatchResponse)
+async def read_batch(
+    lote: schemas.BatchRequest,
+    token_verification: None = Depends(verify_token),  # Verifica el token temporal
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Resuelve varias lecturas de blog y charcutería en una sola petición.
+
+    Las lecturas se ejecutan en orden sobre la sesión de la petición: una
+    ``AsyncSession`` no admite consultas simultáneas y, con la caché de contenido
+    llena, ninguna de ellas llega a MySQL. Un fallo en una lectura no impide
+    responder a las demás, salvo que la sesión quede inutilizable: entonces esa
+    lectura y las pendientes responden 503 sin volver a usarla.
+
+    Args:
+        lote (schemas.BatchRequest): Lecturas solicitadas.
+        token_verification (None): Verificación del token proporcionado.
+        db (AsyncSession): Sesión de base de datos compartida por todas las lecturas.
+
+    Raises:
+        HTTPException:
+            - 401: Si no se proporciona token.
+            - 403: Si el token proporcionado es inválido.
+            - 422: Si el lote no tiene un formato válido.
+
+    Returns:
+        schemas.BatchResponse: Resultado de cada lectura indexado por su clave.
+    """
+    results: list[tuple[str, _BatchOutcome]] = []
+    for index, operation in enumerate(lote.operaciones):
+        try:
+            outcome = await _run_read(operation, db)
+        except _BrokenSessionError:
+            unavailable = _BatchOutcome(status=503, detail=_SERVICE_UNAVAILABLE_DETAIL)
+            results.extend((pending.clave, unavailable) for pending in lote.operaciones[index:])
+            break
+        results.append((operation.clave, outcome))
+    return Response(content=render_batch_response(results), media_type="application/json")
@@ -6,10 +6,19 @@ routers/blog.py
 Router para manejar las publicaciones del blog.
 
 Este módulo define los endpoints para:
-- Obtener una lista de publicaciones de blog.
+- Obtener una lista de publicaciones de blog, completa o paginada mediante cursor,
+  opcionalmente con solo los campos indicados en ``fields``.
+- Obtener resúmenes del listado sin el contenido completo de cada publicación.
+- Buscar publicaciones por texto con un índice en memoria ordenado por relevancia.
+- Obtener el slug de cada publicación en todos sus idiomas para enlazar traducciones.
 - Recuperar publicaciones individuales por su slug o ID.
 - Gestionar las publicaciones de blog con filtrado por idioma.
 
+Las lecturas devuelven el JSON que prepara ``BlogService`` y que se conserva en la
+caché de contenido; ``response_model`` solo documenta el contrato en OpenAPI. Si
+MySQL no responde, el listado completo y las publicaciones individuales se sirven
+desde la última copia válida con la cabecera ``X-Content-Stale``.
+
 Dependencias:
 - FastAPI: Para definir los endpoints y manejar las solicitudes.
 - SQLAlchemy: Para interactuar con la base de datos.
@@ -19,14 +28,26 @@ Dependencias:
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import DBAPIError, TimeoutError as SQLAlchemyTimeoutError
-from typing import List, Literal
+from typing import Annotated, Dict, List, Literal, Optional
 from ..core.blog_slug import normalize_blog_slug
+from ..core.content_cache import StaleContent, content_cache, stale_content_headers
 from ..models import schemas
 from ..dependencies import verify_token, get_db
-from ..services.blog_service import BlogService
+from ..services.blog_service import (
+    BLOG_LIST_ADAPTER,
+    MAX_BLOG_CURSOR_LENGTH,
+    BlogService,
+    InvalidBlogCursorError,
+)
+from ..services.field_projection import (
+    MAX_FIELDS_PARAMETER_LENGTH,
+    InvalidFieldSelectionError,
+    parse_field_selection,
+)
 
 # Inicializa el router para los endpoints relacionados con el blog
 router = APIRouter()
@@ -35,6 +56,29 @@ logger = logging.getLogger(__name__)
 # Idiomas disponibles en el frontend y almacenados en la base de datos.
 SupportedLanguage = Literal["es", "en", "de", "fr"]
 
+# Tamaño máximo de página admitido en el listado paginado.
+MAX_BLOG_PAGE_SIZE = 100
+# Longitud admitida de la consulta y número de resultados de la búsqueda.
+MIN_BLOG_SEARCH_LENGTH = 2
+MAX_BLOG_SEARCH_LENGTH = 100
+DEFAULT_BLOG_SEARCH_RESULTS = 10
+MAX_BLOG_SEARCH_RESULTS = 50
+# Cabecera con el cursor de la página siguiente; se omite en la última página.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+BLOG_SUMMARY_LIST_ADAPTER = TypeAdapter(List[schemas.BlogSummary])
+
+
+def _json_response(body: bytes, headers: dict[str, str] | None = None) -> Response:
+    """Envía un cuerpo JSON ya serializado sin volver a pasar por ``response_model``."""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _stale_response(stale: StaleContent[bytes] | None) -> Response | None:
+    """Construye la respuesta con la última copia válida, si existe."""
+    if stale is None:
+        return None
+    return _json_response(stale.value, stale_content_headers(stale))
+
 
 def _is_valid_blog_slug(slug: str) -> bool:
     """Valida el mismo slug canónico usado por el frontend y el sitemap."""
@@ -45,33 +89,91 @@ def _is_valid_blog_slug(slug: str) -> bool:
 async def get_blog_posts(
     idioma: SupportedLanguage = Query("es"),
     token_verification: None = Depends(verify_token),  # Verifica el token temporal
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_BLOG_PAGE_SIZE)] = None,
+    cursor: Annotated[
+        Optional[str],
+        Query(min_length=1, max_length=MAX_BLOG_CURSOR_LENGTH),
+    ] = None,
+    fields: Annotated[
+        Optional[str],
+        Query(min_length=1, max_length=MAX_FIELDS_PARAMETER_LENGTH),
+    ] = None,
 ):
     """
     Obtiene una lista de publicaciones de blog filtradas por idioma y ordenadas por fecha.
 
-    Este endpoint permite consultar todas las publicaciones de un idioma específico,
-    ordenándolas por la fecha de publicación más reciente.
+    Sin ``limit`` devuelve todas las publicaciones del idioma, como hasta ahora. Con
+    ``limit`` devuelve una página y, si hay más, el cursor opaco de la siguiente en
+    la cabecera ``X-Next-Cursor``, que se envía después como parámetro ``cursor``.
+    Con ``fields=slug,titulo,imagen_url`` cada publicación solo incluye esos campos
+    y MySQL solo lee esas columnas.
 
     Args:
         idioma (str, optional): Idioma de las publicaciones. Por defecto "es".
         token_verification (None): Verificación del token proporcionado.
         db (AsyncSession): Sesión de base de datos proporcionada por la dependencia.
+        limit (Optional[int]): Tamaño de página entre 1 y 100.
+        cursor (Optional[str]): Cursor devuelto por la página anterior.
+        fields (Optional[str]): Campos de ``schemas.Blog`` separados por comas.
 
     Raises:
         HTTPException:
             - 401: Si no se proporciona token.
             - 403: Si el token proporcionado es inválido.
+            - 422: Si el cursor no es válido, se envía sin ``limit`` o ``fields``
+              contiene campos desconocidos.
             - 503: Si la base de datos no está disponible temporalmente.
             - 500: Si ocurre algún error interno.
 
     Returns:
         List[schemas.Blog]: Lista de publicaciones de blog.
     """
+    if cursor is not None and limit is None:
+        raise HTTPException(status_code=422, detail="El cursor requiere el parámetro limit")
     try:
-        blog_service = BlogService(db)
-        return await blog_service.get_all_posts(idioma)
+        selected_fields = parse_field_selection(fields, schemas.Blog) if fields is not None else None
+    except InvalidFieldSelectionError as error:
+        raise HTTPException(status_code=422, detail=str(error)) from None
+
+    blog_service = BlogService(db)
+
+    def stale_listing() -> StaleContent[bytes] | None:
+        if selected_fields is not None:
+            return blog_service.stale_projected_posts_json(idioma, selected_fields)
+        return blog_service.stale_all_posts_json(idioma)
+
+    try:
+        if limit is None:
+            # Tras un fallo reciente de MySQL se responde con la copia válida sin
+            # esperar de nuevo al timeout del pool.
+            if not content_cache.source_available():
+                stale_response = _stale_response(stale_listing())
+                if stale_response is not None:
+                    return stale_response
+            if selected_fields is None:
+                return _json_response(await blog_service.get_all_posts_json(idioma))
+
+        if selected_fields is not None:
+            body, next_cursor = await blog_service.get_projected_posts_json(
+                idioma, selected_fields, limit, cursor
+            )
+            headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+            return _json_response(body, headers)
+
+        page = await blog_service.get_posts_page(idioma, limit, cursor)
+        headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+        return _json_response(BLOG_LIST_ADAPTER.dump_json(list(page.posts)), headers)
+    except InvalidBlogCursorError:
+        raise HTTPException(status_code=422, detail="Cursor de paginación no válido") from None
     except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        stale_response = _stale_response(stale_listing()) if limit is None else None
+        if stale_response is not None:
+            logger.warning(
+                "Base de datos no disponible; se sirve la última copia válida del listado del blog"
+            )
+            return stale_response
         logger.exception("Base de datos no disponible al obtener la lista de publicaciones del blog")
         raise HTTPException(
             status_code=503,
@@ -85,6 +187,179 @@ async def get_blog_posts(
         ) from None
 
 
+# Debe declararse antes de ``/blog/{slug}`` para que "summaries" no se trate como slug.
+@router.get("/blog/summaries", response_model=List[schemas.BlogSummary])
+async def get_blog_summaries(
+    idioma: SupportedLanguage = Query("es"),
+    token_verification: None = Depends(verify_token),  # Verifica el token temporal
+    db: AsyncSession = Depends(get_db),
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_BLOG_PAGE_SIZE)] = None,
+    cursor: Annotated[
+        Optional[str],
+        Query(min_length=1, max_length=MAX_BLOG_CURSOR_LENGTH),
+    ] = None,
+):
+    """
+    Obtiene los resúmenes del listado del blog sin el contenido completo.
+
+    Cada resumen incluye los campos de la tarjeta del listado y un extracto corto
+    del comienzo del contenido. Admite la misma paginación que ``/blog``.
+
+    Args:
+        idioma (str, optional): Idioma de las publicaciones. Por defecto "es".
+        token_verification (None): Verificación del token proporcionado.
+        db (AsyncSession): Sesión de base de datos proporcionada por la dependencia.
+        limit (Optional[int]): Tamaño de página entre 1 y 100.
+        cursor (Optional[str]): Cursor devuelto por la página anterior.
+
+    Raises:
+        HTTPException:
+            - 401: Si no se proporciona token.
+            - 403: Si el token proporcionado es inválido.
+            - 422: Si el cursor no es válido o se envía sin ``limit``.
+            - 503: Si la base de datos no está disponible temporalmente.
+            - 500: Si ocurre algún error interno.
+
+    Returns:
+        List[schemas.BlogSummary]: Resúmenes de las publicaciones.
+    """
+    if cursor is not None and limit is None:
+        raise HTTPException(status_code=422, detail="El cursor requiere el parámetro limit")
+
+    try:
+        page = await BlogService(db).get_post_summaries(idioma, limit, cursor)
+        headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+        return _json_response(BLOG_SUMMARY_LIST_ADAPTER.dump_json(list(page.posts)), headers)
+    except InvalidBlogCursorError:
+        raise HTTPException(status_code=422, detail="Cursor de paginación no válido") from None
+    except (DBAPIError, SQLAlchemyTimeoutError):
+        logger.exception("Base de datos no disponible al obtener los resúmenes del blog")
+        raise HTTPException(
+            status_code=503,
+            detail="Servicio de datos temporalmente no disponible",
+        ) from None
+    except Exception:
+        logger.exception("Error inesperado al obtener los resúmenes del blog")
+        raise HTTPException(
+            status_code=500,
+            detail="Error interno al obtener los resúmenes del blog",
+        ) from None
+
+
+# También se declara antes de ``/blog/{slug}``.
+@router.get("/blog/search", response_model=List[schemas.BlogSearchResult])
+async def search_blog_posts(
+    q: Annotated[
+        str,
+        Query(min_length=MIN_BLOG_SEARCH_LENGTH, max_length=MAX_BLOG_SEARCH_LENGTH),
+    ],
+    idioma: SupportedLanguage = Query("es"),
+    limit: Annotated[int, Query(ge=1, le=MAX_BLOG_SEARCH_RESULTS)] = DEFAULT_BLOG_SEARCH_RESULTS,
+    token_verification: None = Depends(verify_token),  # Verifica el token temporal
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Busca publicaciones por texto en el título y el contenido.
+
+    Ignora mayúsculas, tildes y palabras vacías del idioma, y ordena los resultados
+    por relevancia BM25. Si MySQL no responde se busca en el último índice válido
+    con ``X-Content-Stale``.
+
+    Args:
+        q (str): Texto de búsqueda.
+        idioma (str, optional): Idioma de las publicaciones. Por defecto "es".
+        limit (int): Número máximo de resultados, entre 1 y 50.
+        token_verification (None): Verificación del token proporcionado.
+        db (AsyncSession): Sesión de base de datos proporcionada por la dependencia.
+
+    Raises:
+        HTTPException:
+            - 401: Si no se proporciona token.
+            - 403: Si el token proporcionado es inválido.
+            - 503: Si la base de datos no está disponible temporalmente.
+            - 500: Si ocurre algún error interno.
+
+    Returns:
+        List[schemas.BlogSearchResult]: Resúmenes encontrados con su puntuación.
+    """
+    blog_service = BlogService(db)
+    try:
+        if not content_cache.source_available():
+            stale_response = _stale_response(blog_service.stale_search_posts_json(idioma, q, limit))
+            if stale_response is not None:
+                return stale_response
+        return _json_response(await blog_service.search_posts_json(idioma, q, limit))
+    except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        stale_response = _stale_response(blog_service.stale_search_posts_json(idioma, q, limit))
+        if stale_response is not None:
+            logger.warning("Base de datos no disponible; se busca en el último índice válido")
+            return stale_response
+        logger.exception("Base de datos no disponible al buscar en el blog")
+        raise HTTPException(
+            status_code=503,
+            detail="Servicio de datos temporalmente no disponible",
+        ) from None
+    except Exception:
+        logger.exception("Error inesperado al buscar en el blog")
+        raise HTTPException(
+            status_code=500,
+            detail="Error interno al buscar en el blog",
+        ) from None
+
+
+@router.get("/blog/translations", response_model=Dict[int, Dict[str, str]])
+async def get_blog_translations(
+    token_verification: None = Depends(verify_token),  # Verifica el token temporal
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Obtiene el slug de cada publicación en todos los idiomas en que existe.
+
+    El frontend cambia de idioma un artículo, y genera sus enlaces hreflang, con
+    este mapa sin consultar cada traducción por separado. Si MySQL no responde se
+    sirve el último mapa válido con ``X-Content-Stale``.
+
+    Args:
+        token_verification (None): Verificación del token proporcionado.
+        db (AsyncSession): Sesión de base de datos proporcionada por la dependencia.
+
+    Raises:
+        HTTPException:
+            - 401: Si no se proporciona token.
+            - 403: Si el token proporcionado es inválido.
+            - 503: Si la base de datos no está disponible temporalmente.
+            - 500: Si ocurre algún error interno.
+
+    Returns:
+        Dict[int, Dict[str, str]]: ``{id_noticia: {idioma: slug}}``.
+    """
+    blog_service = BlogService(db)
+    try:
+        if not content_cache.source_available():
+            stale_response = _stale_response(blog_service.stale_translations_json())
+            if stale_response is not None:
+                return stale_response
+        return _json_response(await blog_service.get_translations_json())
+    except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        stale_response = _stale_response(blog_service.stale_translations_json())
+        if stale_response is not None:
+            logger.warning("Base de datos no disponible; se sirve el último mapa de traducciones")
+            return stale_response
+        logger.exception("Base de datos no disponible al obtener las traducciones del blog")
+        raise HTTPException(
+            status_code=503,
+            detail="Servicio de datos temporalmente no disponible",
+        ) from None
+    except Exception:
+        logger.exception("Error inesperado al obtener las traducciones del blog")
+        raise HTTPException(
+            status_code=500,
+            detail="Error interno al obtener las traducciones del blog",
+        ) from None
+
+
 @router.get("/blog/{slug}", response_model=schemas.Blog)
 async def get_blog_post_by_slug(
     slug: str = Path(..., min_length=1, max_length=150),
@@ -124,14 +399,32 @@ async def get_blog_post_by_slug(
             raise HTTPException(status_code=422, detail="Slug de blog no válido")
 
         blog_service = BlogService(db)
-        post = await blog_service.get_post_by_slug(normalized_slug, idioma)
-        
-        if post is None:
+        if not content_cache.source_available():
+            stale_response = _stale_response(
+                blog_service.stale_post_by_slug_json(normalized_slug, idioma)
+            )
+            if stale_response is not None:
+                return stale_response
+        body = await blog_service.get_post_by_slug_json(normalized_slug, idioma)
+
+        if body is None:
             raise HTTPException(status_code=404, detail="Blog no encontrado")
-        return post
+        return _json_response(body)
     except HTTPException:
         raise
     except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        normalized_slug = normalize_blog_slug(slug)
+        stale_response = (
+            _stale_response(BlogService(db).stale_post_by_slug_json(normalized_slug, idioma))
+            if normalized_slug is not None
+            else None
+        )
+        if stale_response is not None:
+            logger.warning(
+                "Base de datos no disponible; se sirve la última copia válida de una publicación"
+            )
+            return stale_response
         logger.exception("Base de datos no disponible al obtener una publicación del blog por slug")
         raise HTTPException(
             status_code=503,
@@ -177,16 +470,29 @@ async def get_blog_post_by_id(
     Returns:
         schemas.Blog: La publicación de blog encontrada.
     """
+    blog_service = BlogService(db)
     try:
-        blog_service = BlogService(db)
-        post = await blog_service.get_post_by_id(id_noticia, idioma)
-        
-        if post is None:
+        if not content_cache.source_available():
+            stale_response = _stale_response(
+                blog_service.stale_post_by_id_json(id_noticia, idioma)
+            )
+            if stale_response is not None:
+                return stale_response
+        body = await blog_service.get_post_by_id_json(id_noticia, idioma)
+
+        if body is None:
             raise HTTPException(status_code=404, detail="Blog no encontrado")
-        return post
+        return _json_response(body)
     except HTTPException:
         raise
     except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        stale_response = _stale_response(blog_service.stale_post_by_id_json(id_noticia, idioma))
+        if stale_response is not None:
+            logger.warning(
+                "Base de datos no disponible; se sirve la última copia válida de una publicación"
+            )
+            return stale_response
         logger.exception("Base de datos no disponible al obtener una publicación del blog por ID")
         raise HTTPException(
             status_code=503,
@@ -6,7 +6,10 @@ routers/charcuteria.py
 Router para manejar los productos de charcutería.
 
 Este módulo define los endpoints para:
-- Obtener una lista de productos de charcutería filtrados por idioma.
+- Obtener una lista de productos de charcutería filtrados por idioma, opcionalmente
+  con solo los campos indicados en ``fields``.
+- Obtener el catálogo agrupado por categoría, con recuentos y filtros opcionales.
+- Autocompletar nombres de productos sin descargar el listado completo.
 
 Dependencias:
 - FastAPI: Para definir los endpoints y manejar las solicitudes.
@@ -17,13 +20,20 @@ Dependencias:
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import DBAPIError, TimeoutError as SQLAlchemyTimeoutError
-from typing import List, Literal
+from typing import Annotated, List, Literal, Optional
+from ..core.content_cache import content_cache, stale_content_headers
 from ..models import schemas
 from ..dependencies import verify_token, get_db
 from ..services.charcuteria_service import CharcuteriaService
+from ..services.charcuteria_suggest import MAX_SUGGESTIONS
+from ..services.field_projection import (
+    MAX_FIELDS_PARAMETER_LENGTH,
+    InvalidFieldSelectionError,
+    parse_field_selection,
+)
 
 # Inicializa el router para los endpoints relacionados con charcutería
 router = APIRouter()
@@ -32,9 +42,19 @@ logger = logging.getLogger(__name__)
 # Idiomas disponibles en el frontend y almacenados en la base de datos.
 SupportedLanguage = Literal["es", "en", "de", "fr"]
 
+# Longitudes de las columnas filtrables; valores más largos no pueden existir.
+MAX_CATEGORY_FILTER_LENGTH = 50
+MAX_COMPANY_FILTER_LENGTH = 200
+# Longitud admitida del texto a autocompletar.
+MAX_SUGGEST_QUERY_LENGTH = 100
+
 @router.get("/charcuteria", response_model=List[schemas.Charcuteria])
 async def get_charcuteria_products(
     idioma: SupportedLanguage = Query("es"),  # Parámetro de idioma con valor predeterminado "es"
+    fields: Annotated[
+        Optional[str],
+        Query(min_length=1, max_length=MAX_FIELDS_PARAMETER_LENGTH),
+    ] = None,
     token_verification: None = Depends(verify_token),  # Verifica el token temporal
     db: AsyncSession = Depends(get_db)  # Luego obtiene la conexión a BD
 ):
@@ -42,9 +62,13 @@ async def get_charcuteria_products(
     Obtiene una lista de productos de charcutería filtrados por idioma.
 
     Los productos están ordenados por categoría y luego por nombre en orden alfabético.
+    Con ``fields=nombre,imagen_url`` cada producto solo incluye esos campos y MySQL
+    solo lee esas columnas. Si MySQL no responde se sirve la última copia válida con
+    ``X-Content-Stale``.
 
     Args:
         idioma (str, optional): Idioma de los productos. Por defecto "es".
+        fields (Optional[str]): Campos de ``schemas.Charcuteria`` separados por comas.
         token_verification (None): Verificación del token proporcionado.
         db (AsyncSession): Sesión de base de datos proporcionada por la dependencia.
 
@@ -52,6 +76,7 @@ async def get_charcuteria_products(
         HTTPException:
             - 401: Si no se proporciona token.
             - 403: Si el token proporcionado es inválido.
+            - 422: Si ``fields`` contiene campos desconocidos.
             - 503: Si la base de datos no está disponible temporalmente.
             - 500: Si ocurre un error interno del servidor.
 
@@ -59,9 +84,54 @@ async def get_charcuteria_products(
         List[schemas.Charcuteria]: Lista de productos de charcutería en el idioma solicitado.
     """
     try:
-        charcuteria_service = CharcuteriaService(db)
-        return await charcuteria_service.get_all_products(idioma)
+        selected_fields = (
+            parse_field_selection(fields, schemas.Charcuteria) if fields is not None else None
+        )
+    except InvalidFieldSelectionError as error:
+        raise HTTPException(status_code=422, detail=str(error)) from None
+
+    charcuteria_service = CharcuteriaService(db)
+
+    def stale_listing():
+        if selected_fields is not None:
+            return charcuteria_service.stale_projected_products_json(idioma, selected_fields)
+        return charcuteria_service.stale_all_products_json(idioma)
+
+    try:
+        # Tras un fallo reciente de MySQL se responde con la copia válida sin esperar
+        # de nuevo al timeout del pool.
+        if not content_cache.source_available():
+            stale = stale_listing()
+            if stale is not None:
+                return Response(
+                    content=stale.value,
+                    media_type="application/json",
+                    headers=stale_content_headers(stale),
+                )
+        if selected_fields is not None:
+            return Response(
+                content=await charcuteria_service.get_projected_products_json(
+                    idioma, selected_fields
+                ),
+                media_type="application/json",
+            )
+        # El cuerpo ya validado y serializado se conserva en la caché de contenido.
+        return Response(
+            content=await charcuteria_service.get_all_products_json(idioma),
+            media_type="application/json",
+        )
     except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        stale = stale_listing()
+        if stale is not None:
+            logger.warning(
+                "Base de datos no disponible; se sirve la última copia válida de charcutería"
+            )
+            return Response(
+                content=stale.value,
+                media_type="application/json",
+                headers=stale_content_headers(stale),
+            )
         logger.exception(
             "Error de conexión con la base de datos al obtener productos de charcutería"
         )
@@ -77,3 +147,159 @@ async def get_charcuteria_products(
             status_code=500,
             detail="Error interno del servidor",
         ) from None
+
+
+@router.get("/charcuteria/catalogo", response_model=schemas.CharcuteriaCatalog)
+async def get_charcuteria_catalog(
+    idioma: SupportedLanguage = Query("es"),
+    categoria: Annotated[
+        Optional[str],
+        Query(min_length=1, max_length=MAX_CATEGORY_FILTER_LENGTH),
+    ] = None,
+    empresa: Annotated[
+        Optional[str],
+        Query(min_length=1, max_length=MAX_COMPANY_FILTER_LENGTH),
+    ] = None,
+    token_verification: None = Depends(verify_token),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Obtiene el catálogo de charcutería agrupado por categoría.
+
+    Cada categoría incluye su recuento y sus productos ordenados por nombre. Los
+    filtros ``categoria`` y ``empresa`` comparan el valor exacto y permiten que una
+    página de categoría descargue solo su parte del catálogo. Si MySQL no responde
+    se construye con la última copia válida del listado y ``X-Content-Stale``.
+
+    Args:
+        idioma (str, optional): Idioma de los productos. Por defecto "es".
+        categoria (Optional[str]): Categoría exacta por la que filtrar.
+        empresa (Optional[str]): Empresa exacta por la que filtrar.
+        token_verification (None): Verificación del token proporcionado.
+        db (AsyncSession): Sesión de base de datos proporcionada por la dependencia.
+
+    Raises:
+        HTTPException:
+            - 401: Si no se proporciona token.
+            - 403: Si el token proporcionado es inválido.
+            - 503: Si la base de datos no está disponible temporalmente.
+            - 500: Si ocurre un error interno del servidor.
+
+    Returns:
+        schemas.CharcuteriaCatalog: Catálogo agrupado con recuentos por faceta.
+    """
+    charcuteria_service = CharcuteriaService(db)
+    try:
+        if not content_cache.source_available():
+            stale = charcuteria_service.stale_catalog_json(idioma, categoria, empresa)
+            if stale is not None:
+                return Response(
+                    content=stale.value,
+                    media_type="application/json",
+                    headers=stale_content_headers(stale),
+                )
+        return Response(
+            content=await charcuteria_service.get_catalog_json(idioma, categoria, empresa),
+            media_type="application/json",
+        )
+    except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        stale = charcuteria_service.stale_catalog_json(idioma, categoria, empresa)
+        if stale is not None:
+            logger.warning(
+                "Base de datos no disponible; se sirve el catálogo con la última copia válida"
+            )
+            return Response(
+                content=stale.value,
+                media_type="application/json",
+                headers=stale_content_headers(stale),
+            )
+        logger.exception(
+            "Error de conexión con la base de datos al obtener el catálogo de charcutería"
+        )
+        raise HTTPException(
+            status_code=503,
+            detail="Servicio de datos temporalmente no disponible",
+        ) from None
+    except Exception:
+        logger.exception(
+            "Error inesperado al obtener el catálogo de charcutería"
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Error interno del servidor",
+        ) from None
+
+
+@router.get("/charcuteria/suggest", response_model=List[schemas.CharcuteriaSuggestion])
+async def suggest_charcuteria_products(
+    q: Annotated[str, Query(min_length=1, max_length=MAX_SUGGEST_QUERY_LENGTH)],
+    idioma: SupportedLanguage = Query("es"),
+    limit: Annotated[int, Query(ge=1, le=MAX_SUGGESTIONS)] = MAX_SUGGESTIONS,
+    token_verification: None = Depends(verify_token),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Sugiere productos cuyo nombre o empresa tiene una palabra que empieza por ``q``.
+
+    La comparación ignora mayúsculas y tildes. Si MySQL no responde se usa el
+    último árbol válido con ``X-Content-Stale``.
+
+    Args:
+        q (str): Texto escrito por el usuario.
+        idioma (str, optional): Idioma de los productos. Por defecto "es".
+        limit (int): Número máximo de sugerencias, entre 1 y 10.
+        token_verification (None): Verificación del token proporcionado.
+        db (AsyncSession): Sesión de base de datos proporcionada por la dependencia.
+
+    Raises:
+        HTTPException:
+            - 401: Si no se proporciona token.
+            - 403: Si el token proporcionado es inválido.
+            - 503: Si la base de datos no está disponible temporalmente.
+            - 500: Si ocurre un error interno del servidor.
+
+    Returns:
+        List[schemas.CharcuteriaSuggestion]: Productos sugeridos.
+    """
+    charcuteria_service = CharcuteriaService(db)
+    try:
+        if not content_cache.source_available():
+            stale = charcuteria_service.stale_suggest_products_json(idioma, q, limit)
+            if stale is not None:
+                return Response(
+                    content=stale.value,
+                    media_type="application/json",
+                    headers=stale_content_headers(stale),
+                )
+        return Response(
+            content=await charcuteria_service.suggest_products_json(idioma, q, limit),
+            media_type="application/json",
+        )
+    except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        stale = charcuteria_service.stale_suggest_products_json(idioma, q, limit)
+        if stale is not None:
+            logger.warning(
+                "Base de datos no disponible; se sugieren productos con la última copia válida"
+            )
+            return Response(
+                content=stale.value,
+                media_type="application/json",
+                headers=stale_content_headers(stale),
+            )
+        logger.exception(
+            "Error de conexión con la base de datos al sugerir productos de charcutería"
+        )
+        raise HTTPException(
+            status_code=503,
+            detail="Servicio de datos temporalmente no disponible",
+        ) from None
+    except Exception:
+        logger.exception(
+            "Error inesperado al sugerir productos de charcutería"
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Error interno del servidor",
+        ) from None
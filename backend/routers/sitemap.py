@@ -1,18 +1,58 @@
 """Endpoint mínimo protegido utilizado por el sitemap dinámico del frontend."""
 
 import logging
+import zlib
+from collections.abc import AsyncIterator
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import DBAPIError, TimeoutError as SQLAlchemyTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.config import settings
+from ..core.content_cache import content_cache, stale_content_headers
+from ..database import async_session
 from ..dependencies import get_db, verify_local_request, verify_token
 from ..models import schemas
-from ..services.sitemap_service import SitemapService
+from ..services.sitemap_service import (
+    GZIP_WBITS,
+    MAX_SITEMAP_CURSOR_LENGTH,
+    InvalidSitemapCursorError,
+    SitemapService,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+SITEMAP_XML_MEDIA_TYPE = "application/xml"
+SITEMAP_XML_CHUNK_SIZE = 64 * 1024
+NO_STORE_HEADERS = {"Cache-Control": "no-store, max-age=0", "Pragma": "no-cache"}
+
+
+async def _decompressed_chunks(document: bytes) -> AsyncIterator[bytes]:
+    """Descomprime por fragmentos el documento cacheado para clientes sin gzip."""
+    decompressor = zlib.decompressobj(wbits=GZIP_WBITS)
+    for start in range(0, len(document), SITEMAP_XML_CHUNK_SIZE):
+        chunk = decompressor.decompress(document[start:start + SITEMAP_XML_CHUNK_SIZE])
+        if chunk:
+            yield chunk
+    tail = decompressor.flush()
+    if tail:
+        yield tail
+
+
+async def _closing_session(
+    chunks: AsyncIterator[bytes],
+    session: AsyncSession,
+) -> AsyncIterator[bytes]:
+    """Mantiene abierta la sesión del cursor hasta terminar o cortar el envío."""
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await session.close()
+
 
 @router.get("/sitemap/blog", response_model=list[schemas.SitemapBlogEntry])
 async def get_sitemap_blog_entries(
@@ -25,9 +65,21 @@ async def get_sitemap_blog_entries(
     response.headers["Cache-Control"] = "no-store, max-age=0"
     response.headers["Pragma"] = "no-cache"
 
+    sitemap_service = SitemapService(db)
     try:
-        return await SitemapService(db).get_blog_entries()
+        if not content_cache.source_available():
+            stale = sitemap_service.stale_blog_entries()
+            if stale is not None:
+                response.headers.update(stale_content_headers(stale))
+                return stale.value
+        return await sitemap_service.get_blog_entries()
     except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        stale = sitemap_service.stale_blog_entries()
+        if stale is not None:
+            logger.warning("Base de datos no disponible; se sirve la última copia válida del sitemap")
+            response.headers.update(stale_content_headers(stale))
+            return stale.value
         logger.exception("Base de datos no disponible al generar las entradas del sitemap")
         raise HTTPException(
             status_code=503,
@@ -39,3 +91,97 @@ async def get_sitemap_blog_entries(
             status_code=500,
             detail="Error interno al generar el sitemap",
         ) from None
+
+
+@router.get("/sitemap/blog/changes", response_model=schemas.SitemapBlogChanges)
+async def get_sitemap_blog_changes(
+    response: Response,
+    since: Annotated[
+        Optional[str],
+        Query(min_length=1, max_length=MAX_SITEMAP_CURSOR_LENGTH),
+    ] = None,
+    token_verification: None = Depends(verify_token),
+    local_verification: None = Depends(verify_local_request),
+    db: AsyncSession = Depends(get_db),
+) -> schemas.SitemapBlogChanges:
+    """Devuelve solo los cambios del sitemap desde el cursor ``since``.
+
+    Sin cursor, o si el estado del cursor ya no se conserva, la respuesta incluye el
+    sitemap completo con ``completo=True``. Si MySQL no responde se devuelve 503:
+    el cliente conserva su copia y reintenta con el mismo cursor.
+    """
+    response.headers["Cache-Control"] = "no-store, max-age=0"
+    response.headers["Pragma"] = "no-cache"
+
+    try:
+        return await SitemapService(db).get_blog_changes(since)
+    except InvalidSitemapCursorError:
+        raise HTTPException(status_code=400, detail="Cursor del sitemap no válido") from None
+    except (DBAPIError, SQLAlchemyTimeoutError):
+        content_cache.mark_source_unavailable()
+        logger.exception("Base de datos no disponible al calcular los cambios del sitemap")
+        raise HTTPException(
+            status_code=503,
+            detail="Sitemap temporalmente no disponible",
+        ) from None
+    except Exception:
+        logger.exception("Error inesperado al calcular los cambios del sitemap")
+        raise HTTPException(
+            status_code=500,
+            detail="Error interno al generar el sitemap",
+        ) from None
+
+
+@router.get("/sitemap/blog.xml", response_class=Response)
+async def get_sitemap_blog_xml(
+    request: Request,
+    token_verification: None = Depends(verify_token),
+    local_verification: None = Depends(verify_local_request),
+) -> Response:
+    """Genera en streaming el sitemap XML de los artículos con alternativas hreflang.
+
+    El documento terminado se conserva comprimido con gzip hasta que cambia la
+    versión de contenido. Desde la caché se envía tal cual a los clientes que
+    aceptan gzip y descomprimido por fragmentos al resto.
+    """
+    accepts_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    # La sesión no conecta hasta la primera consulta y la cierra el propio streaming.
+    session = async_session()
+    sitemap_service = SitemapService(session)
+    try:
+        cached = await sitemap_service.get_cached_blog_xml()
+        if cached is None:
+            chunks = await sitemap_service.stream_blog_xml(settings.SITEMAP_PUBLIC_SITE_URL)
+            return StreamingResponse(
+                _closing_session(chunks, session),
+                media_type=SITEMAP_XML_MEDIA_TYPE,
+                headers=NO_STORE_HEADERS,
+            )
+    except (DBAPIError, SQLAlchemyTimeoutError):
+        await session.close()
+        content_cache.mark_source_unavailable()
+        logger.exception("Base de datos no disponible al generar el sitemap XML")
+        raise HTTPException(
+            status_code=503,
+            detail="Sitemap temporalmente no disponible",
+        ) from None
+    except Exception:
+        await session.close()
+        logger.exception("Error inesperado al generar el sitemap XML")
+        raise HTTPException(
+            status_code=500,
+            detail="Error interno al generar el sitemap",
+        ) from None
+
+    await session.close()
+    if accepts_gzip:
+        return Response(
+            content=cached,
+            media_type=SITEMAP_XML_MEDIA_TYPE,
+            headers={**NO_STORE_HEADERS, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return StreamingResponse(
+        _decompressed_chunks(cached),
+        media_type=SITEMAP_XML_MEDIA_TYPE,
+        headers={**NO_STORE_HEADERS, "Vary": "Accept-Encoding"},
+    )
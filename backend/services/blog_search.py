@@ -0,0 +1,217 @@
+"""
+services/blog_search.py
+
+Índice invertido en memoria para la búsqueda de texto completo del blog.
+
+Este módulo incluye:
+- La tokenización de títulos, contenidos y consultas con el mismo plegado de
+  mayúsculas y diacríticos que se usa al comparar slugs.
+- Listas de palabras vacías para los idiomas publicados (es, en, de, fr).
+- Un índice inmutable por idioma con puntuación BM25, que se reconstruye de forma
+  incremental reutilizando los documentos que no han cambiado.
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from ..core.blog_slug import blog_slug_lookup_key
+from ..models import schemas
+
+# Parámetros habituales de BM25: saturación de frecuencia y normalización por longitud.
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Una aparición en el título cuenta como varias en el contenido.
+TITLE_WEIGHT = 3
+MAX_QUERY_TERMS = 10
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# Palabras vacías ya plegadas (sin tildes y en minúsculas), como los tokens.
+SEARCH_STOPWORDS: dict[str, frozenset[str]] = {
+    "es": frozenset(
+        """
+        a al algo algunas algunos ante antes como con contra cual cuando de del desde
+        donde durante e el ella ellas ellos en entre era es esa esas ese eso esos esta
+        estas este esto estos fue ha hay la las le les lo los mas me mi muy nada ni no
+        nos o os otra otro para pero poco por porque que se sea ser si sin sobre son su
+        sus tambien te tiene todo todos tu un una unas uno unos y ya
+        """.split()
+    ),
+    "en": frozenset(
+        """
+        a about after all also an and any are as at be been but by can for from had has
+        have he her his how if in into is it its more my no not of on or our out she so
+        than that the their them then there these they this to up was we were what when
+        which who will with you your
+        """.split()
+    ),
+    "de": frozenset(
+        """
+        aber alle als am an auch auf aus bei bin bis das dass dem den der des die doch
+        du durch ein eine einem einen einer eines er es fur hat hatte ich ihr im in ist
+        ja kann mit nach nicht noch nur oder sich sie sind so uber um und uns von vor
+        war was wie wir wird zu zum zur
+        """.split()
+    ),
+    "fr": frozenset(
+        """
+        a au aux avec ce ces dans de des du elle en est et il ils je la le les leur lui
+        mais me mes mon ne nos notre nous on ou par pas pour qu que qui sa se ses son
+        sur ta te tes ton tu un une vos votre vous y
+        """.split()
+    ),
+}
+
+
+def tokenize_search_text(text: str, idioma: str) -> list[str]:
+    """Divide un texto en términos plegados, sin palabras vacías del idioma."""
+    # NFC primero, como ``normalize_blog_slug``, y después el plegado de la colación.
+    folded = blog_slug_lookup_key(unicodedata.normalize("NFC", text))
+    stopwords = SEARCH_STOPWORDS.get(idioma, frozenset())
+    return [token for token in _TOKEN_PATTERN.findall(folded) if token not in stopwords]
+
+
+@dataclass(frozen=True)
+class IndexedPost:
+    """Publicación analizada: frecuencias ponderadas de sus términos y su longitud."""
+
+    post: schemas.Blog
+    fingerprint: tuple[str, str, Optional[datetime]]
+    term_frequencies: dict[str, int]
+    length: int
+
+
+def _fingerprint(post: schemas.Blog) -> tuple[str, str, Optional[datetime]]:
+    """Campos que determinan los términos; se comparan completos, no por su hash."""
+    return (post.titulo, post.contenido, post.fecha_actualizacion)
+
+
+def analyze_post(post: schemas.Blog) -> IndexedPost:
+    """Tokeniza título y contenido de una publicación para el índice."""
+    frequencies: Counter[str] = Counter(tokenize_search_text(post.contenido, post.idioma))
+    for token in tokenize_search_text(post.titulo, post.idioma):
+        frequencies[token] += TITLE_WEIGHT
+    return IndexedPost(
+        post=post,
+        fingerprint=_fingerprint(post),
+        term_frequencies=dict(frequencies),
+        length=sum(frequencies.values()),
+    )
+
+
+@dataclass(frozen=True)
+class BlogSearchHit:
+    """Publicación encontrada y su puntuación BM25."""
+
+    post: schemas.Blog
+    score: float
+
+
+class BlogSearchIndex:
+    """Índice invertido inmutable de las publicaciones de un idioma.
+
+    Se construye una vez por versión de contenido y se comparte entre peticiones
+    del worker; las búsquedas solo leen sus estructuras.
+    """
+
+    def __init__(self, idioma: str, documents: Sequence[IndexedPost]) -> None:
+        self.idioma = idioma
+        self._documents = tuple(documents)
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for position, document in enumerate(self._documents):
+            for term, frequency in document.term_frequencies.items():
+                postings.setdefault(term, []).append((position, frequency))
+        self._postings = {term: tuple(entries) for term, entries in postings.items()}
+        total_length = sum(document.length for document in self._documents)
+        self._average_length = total_length / len(self._documents) if self._documents else 0.0
+
+    @classmethod
+    def build(
+        cls,
+        idioma: str,
+        posts: Iterable[schemas.Blog],
+        previous: Optional["BlogSearchIndex"] = None,
+    ) -> "BlogSearchIndex":
+        """
+        Construye el índice reutilizando el análisis de las publicaciones sin cambios.
+
+        Args:
+            idioma (str): Idioma de las publicaciones.
+            posts (Iterable[schemas.Blog]): Publicaciones en el orden del listado.
+            previous (Optional[BlogSearchIndex]): Índice de la versión anterior.
+
+        Returns:
+            BlogSearchIndex: Índice nuevo.
+        """
+        reusable = (
+            {document.post.id_noticia: document for document in previous._documents}
+            if previous is not None
+            else {}
+        )
+        documents: list[IndexedPost] = []
+        for post in posts:
+            document = reusable.get(post.id_noticia)
+            fingerprint = _fingerprint(post)
+            if document is None or document.fingerprint != fingerprint:
+                document = analyze_post(post)
+            elif document.post is not post:
+                # Mismo texto: se reutilizan los términos con los metadatos vigentes.
+                document = IndexedPost(
+                    post=post,
+                    fingerprint=fingerprint,
+                    term_frequencies=document.term_frequencies,
+                    length=document.length,
+                )
+            documents.append(document)
+        return cls(idioma, documents)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def search(self, query: str, limit: int) -> list[BlogSearchHit]:
+        """
+        Devuelve las publicaciones más relevantes para la consulta.
+
+        Los empates se resuelven con el orden del listado, que muestra primero las
+        publicaciones más recientes.
+
+        Args:
+            query (str): Texto de búsqueda.
+            limit (int): Número máximo de resultados.
+
+        Returns:
+            list[BlogSearchHit]: Resultados ordenados por puntuación descendente.
+        """
+        terms = list(dict.fromkeys(tokenize_search_text(query, self.idioma)))[:MAX_QUERY_TERMS]
+        if not terms or not self._documents:
+            return []
+
+        total_documents = len(self._documents)
+        scores: dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            document_frequency = len(postings)
+            idf = math.log(
+                1 + (total_documents - document_frequency + 0.5) / (document_frequency + 0.5)
+            )
+            for position, frequency in postings:
+                length_ratio = self._documents[position].length / self._average_length
+                saturation = frequency * (BM25_K1 + 1) / (
+                    frequency + BM25_K1 * (1 - BM25_B + BM25_B * length_ratio)
+                )
+                scores[position] = scores.get(position, 0.0) + idf * saturation
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [
+            BlogSearchHit(post=self._documents[position].post, score=score)
+            for position, score in best
+        ]
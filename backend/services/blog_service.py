@@ -8,27 +8,168 @@ Este módulo separa la lógica de acceso a la base de datos de la capa HTTP, per
 un manejo más estructurado y reutilizable.
 
 Funcionalidades principales:
-- Obtener todas las publicaciones en un idioma específico.
-- Buscar publicaciones por su slug.
+- Obtener todas las publicaciones en un idioma específico, reutilizando la caché
+  de contenido del worker mientras no cambie la versión publicada.
+- Paginar el listado mediante un cursor opaco (keyset) sin usar OFFSET.
+- Leer solo los campos pedidos con ``fields=`` y validarlos con un modelo parcial.
+- Obtener resúmenes del listado sin transferir el contenido completo desde MySQL.
+- Buscar publicaciones por su slug mediante un índice local (slug, idioma) -> id,
+  descartando sin consultar MySQL los slugs que no existen en el sitemap.
 - Buscar publicaciones por su ID y idioma.
+- Construir el mapa de traducciones ``id_noticia -> {idioma: slug}`` con las
+  publicaciones que superan el contrato público.
+- Buscar texto en títulos y contenidos con un índice invertido BM25 por idioma,
+  construido a partir del listado cacheado y sin consultas propias.
+- Entregar esas lecturas como JSON ya serializado y conservado en la caché.
+- Servir la última copia válida del listado cuando MySQL no está disponible.
+- Con ``CONTENT_VALIDATED_ON_WRITE``, leer solo las filas marcadas como válidas
+  al escribir y construir las respuestas sin validarlas de nuevo.
 
 Dependencias:
 - SQLAlchemy: Para consultas y operaciones en la base de datos.
 - Models: Modelos de datos definidos en la capa ORM.
 """
 
+import base64
+import binascii
+import json
 import logging
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
 
-from pydantic import ValidationError
-from sqlalchemy import func
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import and_, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from ..core.blog_slug import blog_slug_lookup_key, normalize_blog_slug
+from ..core.content_cache import ContentCache, StaleContent, content_cache
+from ..database import async_session
 from ..models import models, schemas
+from .blog_search import BlogSearchIndex
+from .field_projection import build_projection, projection_list_adapter, projection_model
+from .public_content import construct_public, only_public_rows, validated_on_write
+from .sitemap_service import SUPPORTED_LANGUAGES, SitemapService
 
 logger = logging.getLogger(__name__)
 
+MAX_BLOG_CURSOR_LENGTH = 200
+# Longitud máxima del extracto de los resúmenes y caracteres leídos para calcularlo.
+BLOG_EXCERPT_LENGTH = 200
+BLOG_EXCERPT_SOURCE_LENGTH = 400
+
+PostT = TypeVar("PostT", schemas.Blog, schemas.BlogSummary)
+
+BLOG_ADAPTER = TypeAdapter(schemas.Blog)
+BLOG_LIST_ADAPTER = TypeAdapter(List[schemas.Blog])
+BLOG_SEARCH_ADAPTER = TypeAdapter(List[schemas.BlogSearchResult])
+BLOG_TRANSLATIONS_ADAPTER = TypeAdapter(Dict[int, Dict[str, str]])
+# Columnas que necesita el cursor keyset aunque la proyección no las incluya.
+BLOG_KEYSET_COLUMNS = ("id_noticia", "fecha_publicacion", "fecha_actualizacion")
+
+
+class InvalidBlogCursorError(ValueError):
+    """Indica que el cursor recibido no procede de una página anterior del listado."""
+
+
+@dataclass(frozen=True)
+class BlogPage(Generic[PostT]):
+    """Página del listado y cursor opaco de la siguiente, si existe."""
+
+    posts: tuple[PostT, ...]
+    next_cursor: str | None
+
+
+def _editorial_date():
+    """Fecha usada para ordenar: la de actualización o, si falta, la de publicación."""
+    return func.coalesce(
+        models.Blog.fecha_actualizacion,
+        models.Blog.fecha_publicacion,
+    )
+
+
+def _is_found(value: object) -> bool:
+    """Indica si una búsqueda individual encontró publicación y puede conservarse."""
+    return value is not None
+
+
+def _after_position(query, position: tuple[datetime, int] | None):
+    """Aplica la condición keyset que continúa tras la última fila de la página anterior."""
+    if position is None:
+        return query
+
+    last_date, last_id = position
+    editorial_date = _editorial_date()
+    return query.where(
+        or_(
+            editorial_date < last_date,
+            and_(editorial_date == last_date, models.Blog.id_noticia < last_id),
+        )
+    )
+
+
+def _next_cursor(rows, limit: int) -> str | None:
+    """Calcula el cursor siguiente a partir de ``limit + 1`` filas leídas.
+
+    Se usa la última fila leída y no la última válida: una fila dañada omitida no
+    debe acortar la paginación ni provocar que se repitan filas.
+    """
+    if len(rows) <= limit or limit < 1:
+        return None
+
+    last_row = rows[limit - 1]
+    last_date = last_row.fecha_actualizacion or last_row.fecha_publicacion
+    # Sin fecha la fila queda al final del orden descendente y no es pública.
+    if last_date is None:
+        return None
+    return encode_blog_cursor(last_date, last_row.id_noticia)
+
+
+def build_blog_excerpt(content: str | None, max_length: int = BLOG_EXCERPT_LENGTH) -> str | None:
+    """Compacta los espacios del comienzo del contenido y lo recorta entre palabras."""
+    if content is None:
+        return None
+
+    compact = " ".join(content.split())
+    if len(compact) <= max_length:
+        return compact
+
+    # Cortar en un espacio evita separar una letra de sus marcas combinantes.
+    cut = compact.rfind(" ", 0, max_length)
+    if cut <= 0:
+        cut = max_length
+    return compact[:cut].rstrip() + "…"
+
+
+def encode_blog_cursor(editorial_date: datetime, id_noticia: int) -> str:
+    """Codifica la posición ``(fecha editorial, id_noticia)`` de la última fila servida."""
+    payload = json.dumps(
+        [editorial_date.isoformat(), id_noticia],
+        separators=(",", ":"),
+    ).encode("ascii")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_blog_cursor(cursor: str) -> tuple[datetime, int]:
+    """Recupera la posición codificada o lanza ``InvalidBlogCursorError``."""
+    if not cursor or len(cursor) > MAX_BLOG_CURSOR_LENGTH:
+        raise InvalidBlogCursorError("Cursor de paginación no válido")
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_date, id_noticia = json.loads(
+            base64.urlsafe_b64decode(padded.encode("ascii"))
+        )
+        editorial_date = datetime.fromisoformat(raw_date)
+    except (binascii.Error, TypeError, ValueError, UnicodeError) as error:
+        raise InvalidBlogCursorError("Cursor de paginación no válido") from error
+
+    # ``bool`` es subclase de ``int`` y no representa un identificador real.
+    if not isinstance(id_noticia, int) or isinstance(id_noticia, bool) or id_noticia < 1:
+        raise InvalidBlogCursorError("Cursor de paginación no válido")
+    return editorial_date, id_noticia
+
 
 class BlogService:
     """
@@ -38,18 +179,22 @@ class BlogService:
     del blog, interactuando con la base de datos a través de SQLAlchemy.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: ContentCache | None = None):
         """
         Inicializa el servicio con una sesión de base de datos.
 
         Args:
             db (AsyncSession): Sesión de base de datos asíncrona.
+            cache (ContentCache | None): Caché alternativa para pruebas aisladas.
         """
         self.db = db
+        self._cache = cache if cache is not None else content_cache
 
     @staticmethod
     def _validate_public_post(post: models.Blog) -> schemas.Blog | None:
         """Convierte una fila ORM en una respuesta pública o la omite si está dañada."""
+        if validated_on_write():
+            return construct_public(schemas.Blog, post)
         try:
             return schemas.Blog.model_validate(post)
         except ValidationError:
@@ -73,14 +218,41 @@ class BlogService:
         Returns:
             List[schemas.Blog]: Publicaciones válidas del blog en el idioma solicitado.
         """
+        # Una respuesta en caché no ejecuta ninguna consulta, por lo que la sesión
+        # recibida nunca llega a solicitar una conexión al pool.
+        posts = await self._cache.get_or_load(
+            ("blog", "posts", idioma),
+            lambda: self._load_all_posts(idioma),
+            keep_snapshot=True,
+        )
+        return list(posts)
+
+    async def get_all_posts_json(self, idioma: str) -> bytes:
+        """
+        Obtiene el listado completo de un idioma como cuerpo JSON listo para enviar.
+
+        Los bytes se conservan en la caché de contenido, de modo que un acierto no
+        valida ni serializa ningún modelo.
+
+        Args:
+            idioma (str): Idioma de las publicaciones a obtener.
+
+        Returns:
+            bytes: Array JSON con las publicaciones válidas.
+        """
+
+        async def load() -> bytes:
+            return BLOG_LIST_ADAPTER.dump_json(await self.get_all_posts(idioma))
+
+        return await self._cache.get_or_load(("blog", "posts-json", idioma), load)
+
+    async def _load_all_posts(self, idioma: str) -> tuple[schemas.Blog, ...]:
+        """Consulta y valida el listado completo de un idioma."""
         result = await self.db.execute(
-            select(models.Blog)
+            only_public_rows(select(models.Blog), models.Blog)
             .where(models.Blog.idioma == idioma)
             .order_by(
-                func.coalesce(
-                    models.Blog.fecha_actualizacion,
-                    models.Blog.fecha_publicacion,
-                ).desc(),
+                _editorial_date().desc(),
                 models.Blog.id_noticia.desc(),
             )
         )
@@ -90,7 +262,311 @@ class BlogService:
             validated_post = self._validate_public_post(row)
             if validated_post is not None:
                 posts.append(validated_post)
-        return posts
+        return tuple(posts)
+
+    async def get_posts_page(
+        self,
+        idioma: str,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> BlogPage[schemas.Blog]:
+        """
+        Obtiene una página del listado con el mismo orden que ``get_all_posts``.
+
+        La posición se expresa mediante ``(fecha editorial, id_noticia)`` y se filtra
+        con una condición keyset, de modo que cualquier página cuesta lo mismo que
+        la primera, con independencia del tamaño del archivo. Las páginas con cursor
+        se guardan en el LRU de páginas de la caché, separadas de la primera.
+
+        Args:
+            idioma (str): Idioma de las publicaciones a obtener.
+            limit (int): Número máximo de filas de la página.
+            cursor (Optional[str]): Cursor devuelto por la página anterior.
+
+        Raises:
+            InvalidBlogCursorError: Si el cursor no tiene un formato válido.
+
+        Returns:
+            BlogPage[schemas.Blog]: Publicaciones válidas y cursor de la página siguiente.
+        """
+        position = decode_blog_cursor(cursor) if cursor is not None else None
+        return await self._cache.get_or_load(
+            ("blog", "page", idioma, limit, position),
+            lambda: self._load_posts_page(idioma, limit, position),
+            paged=position is not None,
+        )
+
+    async def _load_posts_page(
+        self,
+        idioma: str,
+        limit: int,
+        position: tuple[datetime, int] | None,
+    ) -> BlogPage[schemas.Blog]:
+        """Consulta ``limit + 1`` filas para saber si existe una página posterior."""
+        query = _after_position(
+            only_public_rows(select(models.Blog), models.Blog).where(models.Blog.idioma == idioma),
+            position,
+        ).order_by(
+            _editorial_date().desc(),
+            models.Blog.id_noticia.desc(),
+        ).limit(limit + 1)
+
+        result = await self.db.execute(query)
+        rows = result.scalars().all()
+
+        posts: list[schemas.Blog] = []
+        for row in rows[:limit]:
+            validated_post = self._validate_public_post(row)
+            if validated_post is not None:
+                posts.append(validated_post)
+
+        return BlogPage(posts=tuple(posts), next_cursor=_next_cursor(rows, limit))
+
+    async def get_projected_posts_json(
+        self,
+        idioma: str,
+        fields: tuple[str, ...],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> tuple[bytes, str | None]:
+        """
+        Obtiene el listado, completo o paginado, con solo los campos seleccionados.
+
+        La consulta lee únicamente esas columnas (más las del cursor si se pagina) y
+        cada fila se valida con el modelo parcial de la selección, de modo que la
+        lectura, la validación y el JSON se reducen con la proyección.
+
+        Args:
+            idioma (str): Idioma de las publicaciones a obtener.
+            fields (tuple[str, ...]): Campos de ``schemas.Blog`` en su orden declarado.
+            limit (Optional[int]): Tamaño de página; ``None`` devuelve el listado completo.
+            cursor (Optional[str]): Cursor devuelto por la página anterior.
+
+        Raises:
+            InvalidBlogCursorError: Si el cursor no tiene un formato válido.
+
+        Returns:
+            tuple[bytes, str | None]: Array JSON y cursor de la página siguiente.
+        """
+        position = decode_blog_cursor(cursor) if cursor is not None else None
+        return await self._cache.get_or_load(
+            ("blog", "projected-json", idioma, fields, limit, position),
+            lambda: self._load_projected_posts_json(idioma, fields, limit, position),
+            paged=True,
+        )
+
+    async def _load_projected_posts_json(
+        self,
+        idioma: str,
+        fields: tuple[str, ...],
+        limit: Optional[int],
+        position: tuple[datetime, int] | None,
+    ) -> tuple[bytes, str | None]:
+        """Consulta solo las columnas seleccionadas con el orden del listado completo."""
+        columns = fields if limit is None else tuple(dict.fromkeys((*fields, *BLOG_KEYSET_COLUMNS)))
+        query = _after_position(
+            only_public_rows(
+                select(*(getattr(models.Blog, column) for column in columns)),
+                models.Blog,
+            ).where(models.Blog.idioma == idioma),
+            position,
+        ).order_by(
+            _editorial_date().desc(),
+            models.Blog.id_noticia.desc(),
+        )
+        if limit is not None:
+            query = query.limit(limit + 1)
+
+        result = await self.db.execute(query)
+        rows = result.all()
+        page_rows = rows if limit is None else rows[:limit]
+
+        model = projection_model(schemas.Blog, fields)
+        posts = [
+            post
+            for post in (build_projection(model, row._mapping) for row in page_rows)
+            if post is not None
+        ]
+        next_cursor = _next_cursor(rows, limit) if limit is not None else None
+        return projection_list_adapter(schemas.Blog, fields).dump_json(posts), next_cursor
+
+    def stale_projected_posts_json(
+        self,
+        idioma: str,
+        fields: tuple[str, ...],
+    ) -> StaleContent[bytes] | None:
+        """Proyecta la última copia válida del listado completo si MySQL no responde."""
+        stale = self._stale_posts(idioma)
+        if stale is None:
+            return None
+        return StaleContent(
+            BLOG_LIST_ADAPTER.dump_json(list(stale.value), include={"__all__": set(fields)}),
+            stale.age_seconds,
+        )
+
+    async def get_post_summaries(
+        self,
+        idioma: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> BlogPage[schemas.BlogSummary]:
+        """
+        Obtiene resúmenes de las publicaciones sin leer el contenido completo.
+
+        La consulta solo selecciona las columnas del resumen y los primeros caracteres
+        del contenido para el extracto, con el mismo orden y la misma paginación keyset
+        que el listado completo. El resto del artículo no sale de MySQL.
+
+        Con ``CONTENT_VALIDATED_ON_WRITE`` los resúmenes excluyen las mismas filas que
+        el listado completo, porque ambos filtran por ``publicamente_valido``. Sin la
+        marca solo se valida el comienzo del contenido: una publicación dañada más
+        allá de ``BLOG_EXCERPT_SOURCE_LENGTH`` caracteres aparece en los resúmenes
+        aunque el listado completo la omita. Las reglas de texto público dependen de
+        categorías Unicode que MySQL no puede comprobar sin leer todo el artículo.
+
+        Args:
+            idioma (str): Idioma de las publicaciones a obtener.
+            limit (Optional[int]): Tamaño de página; ``None`` devuelve todos los resúmenes.
+            cursor (Optional[str]): Cursor devuelto por la página anterior.
+
+        Raises:
+            InvalidBlogCursorError: Si el cursor no tiene un formato válido.
+
+        Returns:
+            BlogPage[schemas.BlogSummary]: Resúmenes válidos y cursor de la página siguiente.
+        """
+        position = decode_blog_cursor(cursor) if cursor is not None else None
+        return await self._cache.get_or_load(
+            ("blog", "summaries", idioma, limit, position),
+            lambda: self._load_post_summaries(idioma, limit, position),
+            paged=position is not None,
+        )
+
+    async def _load_post_summaries(
+        self,
+        idioma: str,
+        limit: Optional[int],
+        position: tuple[datetime, int] | None,
+    ) -> BlogPage[schemas.BlogSummary]:
+        """Ejecuta la proyección del resumen y valida cada fila con el contrato público."""
+        summary_query = select(
+            models.Blog.id_noticia,
+            models.Blog.idioma,
+            models.Blog.slug,
+            models.Blog.titulo,
+            models.Blog.autor,
+            models.Blog.imagen_url,
+            models.Blog.imagen_url_2,
+            models.Blog.fecha_publicacion,
+            models.Blog.fecha_actualizacion,
+            func.substring(
+                models.Blog.contenido,
+                1,
+                BLOG_EXCERPT_SOURCE_LENGTH,
+            ).label("inicio_contenido"),
+        ).where(models.Blog.idioma == idioma)
+        query = _after_position(
+            only_public_rows(summary_query, models.Blog),
+            position,
+        ).order_by(
+            _editorial_date().desc(),
+            models.Blog.id_noticia.desc(),
+        )
+        if limit is not None:
+            query = query.limit(limit + 1)
+
+        result = await self.db.execute(query)
+        rows = result.all()
+        page_rows = rows if limit is None else rows[:limit]
+
+        summaries: list[schemas.BlogSummary] = []
+        for row in page_rows:
+            values = dict(row._mapping)
+            values["extracto"] = build_blog_excerpt(values.pop("inicio_contenido"))
+            if validated_on_write():
+                summaries.append(construct_public(schemas.BlogSummary, values))
+                continue
+            try:
+                summaries.append(schemas.BlogSummary.model_validate(values))
+            except ValidationError:
+                logger.warning(
+                    "Resumen omitido por datos públicos no válidos: id=%s idioma=%s",
+                    values.get("id_noticia"),
+                    values.get("idioma"),
+                )
+
+        next_cursor = _next_cursor(rows, limit) if limit is not None else None
+        return BlogPage(posts=tuple(summaries), next_cursor=next_cursor)
+
+    async def search_posts_json(self, idioma: str, query: str, limit: int) -> bytes:
+        """
+        Busca publicaciones de un idioma y devuelve los resultados como JSON.
+
+        El índice se construye a partir del listado cacheado una vez por versión de
+        contenido, reutilizando el análisis de las publicaciones que no cambiaron;
+        mientras la versión no cambie, una búsqueda no consulta MySQL.
+
+        Args:
+            idioma (str): Idioma de las publicaciones.
+            query (str): Texto de búsqueda.
+            limit (int): Número máximo de resultados.
+
+        Returns:
+            bytes: Array JSON de resultados ordenados por relevancia.
+        """
+        key = ("blog", "search-index", idioma)
+
+        async def load() -> BlogSearchIndex:
+            posts = await self.get_all_posts(idioma)
+            previous = self._cache.stale(key)
+            return BlogSearchIndex.build(
+                idioma,
+                posts,
+                previous.value if previous is not None else None,
+            )
+
+        index = await self._cache.get_or_load(key, load, keep_snapshot=True)
+        return BLOG_SEARCH_ADAPTER.dump_json(self._search_results(index, query, limit))
+
+    def stale_search_posts_json(
+        self,
+        idioma: str,
+        query: str,
+        limit: int,
+    ) -> StaleContent[bytes] | None:
+        """Busca en el último índice válido del idioma cuando MySQL no responde."""
+        stale = self._cache.stale(("blog", "search-index", idioma))
+        if stale is None:
+            return None
+        # Al recuperarse el listado, la siguiente búsqueda reconstruye el índice.
+        self._stale_posts(idioma)
+        return StaleContent(
+            BLOG_SEARCH_ADAPTER.dump_json(self._search_results(stale.value, query, limit)),
+            stale.age_seconds,
+        )
+
+    @staticmethod
+    def _search_results(
+        index: BlogSearchIndex,
+        query: str,
+        limit: int,
+    ) -> list[schemas.BlogSearchResult]:
+        return [
+            schemas.BlogSearchResult(
+                id_noticia=hit.post.id_noticia,
+                idioma=hit.post.idioma,
+                slug=hit.post.slug,
+                titulo=hit.post.titulo,
+                autor=hit.post.autor,
+                imagen_url=hit.post.imagen_url,
+                imagen_url_2=hit.post.imagen_url_2,
+                extracto=build_blog_excerpt(hit.post.contenido, BLOG_EXCERPT_LENGTH),
+                fecha_publicacion=hit.post.fecha_publicacion,
+                fecha_actualizacion=hit.post.fecha_actualizacion,
+                puntuacion=round(hit.score, 4),
+            )
+            for hit in index.search(query, limit)
+        ]
 
     async def get_post_by_slug(
         self,
@@ -100,6 +576,13 @@ class BlogService:
         """
         Obtiene una publicación específica por su slug y opcionalmente por idioma.
 
+        Con idioma y caché activa, un slug ausente del conjunto de slugs publicados
+        devuelve None sin abrir una conexión. Si existe, se resuelve el identificador
+        en el índice local de slugs y la lectura es una consulta por clave primaria.
+        Si el slug no está en el índice o la fila indexada ya no es válida, se usa la
+        búsqueda completa: la colación de MySQL puede aceptar variantes que el índice
+        no contiene.
+
         Args:
             slug (str): Slug único de la publicación.
             idioma (Optional[str]): Idioma de la publicación. Si no se especifica,
@@ -108,7 +591,98 @@ class BlogService:
         Returns:
             Optional[schemas.Blog]: Primera publicación válida o None si no existe.
         """
-        query = select(models.Blog).where(models.Blog.slug == slug)
+        if idioma and await self._cache.current_version() is not None:
+            known_slugs = await self._cache.get_or_load(
+                ("blog", "known-slugs"),
+                self._load_known_slugs,
+            )
+            if blog_slug_lookup_key(slug) not in known_slugs.get(idioma, frozenset()):
+                return None
+
+            slug_index = await self._cache.get_or_load(
+                ("blog", "slug-index"),
+                self._load_slug_index,
+            )
+            id_noticia = slug_index.get((slug, idioma))
+            if id_noticia is not None:
+                post = await self.get_post_by_id(id_noticia, idioma)
+                if post is not None and post.slug == slug:
+                    return post
+
+        return await self._find_post_by_slug(slug, idioma)
+
+    async def get_post_by_slug_json(self, slug: str, idioma: str) -> bytes | None:
+        """
+        Obtiene una publicación por slug como JSON ya serializado.
+
+        Solo se conservan las publicaciones encontradas: las búsquedas sin resultado
+        no deben ocupar la caché.
+
+        Args:
+            slug (str): Slug normalizado de la publicación.
+            idioma (str): Idioma de la publicación.
+
+        Returns:
+            bytes | None: Objeto JSON de la publicación o None si no existe.
+        """
+
+        async def load() -> bytes | None:
+            post = await self.get_post_by_slug(slug, idioma)
+            return BLOG_ADAPTER.dump_json(post) if post is not None else None
+
+        return await self._cache.get_or_load(
+            ("blog", "post-json", idioma, slug),
+            load,
+            should_store=_is_found,
+        )
+
+    async def _load_known_slugs(self) -> dict[str, frozenset[str]]:
+        """
+        Agrupa por idioma las claves de los slugs publicados en el sitemap.
+
+        Las claves pliegan mayúsculas y diacríticos para no descartar variantes que
+        la colación de MySQL aceptaría. El conjunto es exacto: sin falsos negativos
+        y con un tamaño acotado por el número de artículos.
+        """
+        entries = await SitemapService(self.db, cache=self._cache).get_blog_entries()
+        known_slugs: dict[str, set[str]] = {}
+        for entry in entries:
+            known_slugs.setdefault(entry.idioma, set()).add(blog_slug_lookup_key(entry.slug))
+        return {idioma: frozenset(slugs) for idioma, slugs in known_slugs.items()}
+
+    async def _load_slug_index(self) -> dict[tuple[str, str], int]:
+        """
+        Construye el índice ``(slug normalizado, idioma) -> id_noticia``.
+
+        Solo lee las columnas necesarias y recorre las filas en el mismo orden que
+        ``_find_post_by_slug``, de modo que cada slug apunta a la copia que elegiría
+        la búsqueda completa.
+        """
+        result = await self.db.execute(
+            select(
+                models.Blog.id_noticia,
+                models.Blog.idioma,
+                models.Blog.slug,
+            ).order_by(
+                _editorial_date().desc(),
+                models.Blog.id_noticia.asc(),
+            )
+        )
+
+        slug_index: dict[tuple[str, str], int] = {}
+        for id_noticia, idioma, raw_slug in result.all():
+            normalized_slug = normalize_blog_slug(raw_slug)
+            if normalized_slug is not None:
+                slug_index.setdefault((normalized_slug, idioma), id_noticia)
+        return slug_index
+
+    async def _find_post_by_slug(
+        self,
+        slug: str,
+        idioma: Optional[str],
+    ) -> Optional[schemas.Blog]:
+        """Recorre las coincidencias del slug hasta encontrar una publicación válida."""
+        query = only_public_rows(select(models.Blog), models.Blog).where(models.Blog.slug == slug)
         if idioma:
             query = query.where(models.Blog.idioma == idioma)
 
@@ -116,10 +690,7 @@ class BlogService:
         # las coincidencias por orden editorial para que una fila dañada no oculte una
         # copia válida posterior ni convierta la lectura pública en un error 500.
         query = query.order_by(
-            func.coalesce(
-                models.Blog.fecha_actualizacion,
-                models.Blog.fecha_publicacion,
-            ).desc(),
+            _editorial_date().desc(),
             models.Blog.id_noticia.asc(),
         )
 
@@ -146,10 +717,148 @@ class BlogService:
             Optional[schemas.Blog]: Publicación válida o None si no existe o está dañada.
         """
         result = await self.db.execute(
-            select(models.Blog).where(
+            only_public_rows(select(models.Blog), models.Blog).where(
                 models.Blog.id_noticia == id_noticia,
                 models.Blog.idioma == idioma,
             )
         )
         post = result.scalar_one_or_none()
         return self._validate_public_post(post) if post is not None else None
+
+    async def get_post_by_id_json(self, id_noticia: int, idioma: str) -> bytes | None:
+        """
+        Obtiene una publicación por ID e idioma como JSON ya serializado.
+
+        Args:
+            id_noticia (int): ID único de la noticia.
+            idioma (str): Idioma de la publicación.
+
+        Returns:
+            bytes | None: Objeto JSON de la publicación o None si no existe o está dañada.
+        """
+
+        async def load() -> bytes | None:
+            post = await self.get_post_by_id(id_noticia, idioma)
+            return BLOG_ADAPTER.dump_json(post) if post is not None else None
+
+        return await self._cache.get_or_load(
+            ("blog", "post-id-json", idioma, id_noticia),
+            load,
+            should_store=_is_found,
+        )
+
+    async def get_translations_json(self) -> bytes:
+        """
+        Obtiene el slug de cada publicación en todos sus idiomas como JSON.
+
+        El mapa se construye una vez por versión de contenido, de modo que el
+        selector de idioma de un artículo no necesita peticiones adicionales.
+
+        Returns:
+            bytes: Objeto JSON ``{id_noticia: {idioma: slug}}``.
+        """
+        return await self._cache.get_or_load(
+            ("blog", "translations-json"),
+            self._load_translations_json,
+            keep_snapshot=True,
+        )
+
+    async def _load_translations_json(self) -> bytes:
+        """
+        Construye el mapa con las publicaciones que ``/api/blog/{slug}`` serviría.
+
+        Con ``CONTENT_VALIDATED_ON_WRITE`` basta leer identificador, idioma y slug de
+        las filas marcadas. Sin la marca, una fila con cualquier otro campo dañado
+        enlazaría a un 404: el mapa se construye entonces con las entradas del
+        sitemap, que ya superan el contrato público completo y comparten su caché.
+        """
+        if validated_on_write():
+            result = await self.db.execute(
+                only_public_rows(
+                    select(models.Blog.id_noticia, models.Blog.idioma, models.Blog.slug),
+                    models.Blog,
+                )
+                .where(models.Blog.idioma.in_(SUPPORTED_LANGUAGES))
+                .order_by(models.Blog.id_noticia.asc(), models.Blog.idioma.asc())
+            )
+            rows = result.all()
+        else:
+            entries = await SitemapService(self.db, cache=self._cache).get_blog_entries()
+            rows = [(entry.id_noticia, entry.idioma, entry.slug) for entry in entries]
+
+        translations: dict[int, dict[str, str]] = {}
+        for id_noticia, idioma, raw_slug in rows:
+            slug = normalize_blog_slug(raw_slug)
+            if slug is None:
+                # El frontend no puede enlazar una traducción con un slug no canónico.
+                continue
+            translations.setdefault(id_noticia, {})[idioma] = slug
+        return BLOG_TRANSLATIONS_ADAPTER.dump_json(translations)
+
+    def stale_translations_json(self) -> StaleContent[bytes] | None:
+        """Devuelve el último mapa de traducciones válido si MySQL no responde."""
+        key = ("blog", "translations-json")
+        stale = self._cache.stale(key)
+        if stale is not None:
+            self._refresh_in_background(key, lambda service: service._load_translations_json())
+        return stale
+
+    def stale_all_posts_json(self, idioma: str) -> StaleContent[bytes] | None:
+        """
+        Devuelve la última copia válida del listado de un idioma, si existe.
+
+        Se usa cuando MySQL no responde. Programa además un intento de recuperación
+        en segundo plano con una sesión propia.
+
+        Args:
+            idioma (str): Idioma de las publicaciones.
+
+        Returns:
+            StaleContent[bytes] | None: Array JSON obsoleto y su antigüedad.
+        """
+        stale = self._stale_posts(idioma)
+        if stale is None:
+            return None
+        return StaleContent(BLOG_LIST_ADAPTER.dump_json(list(stale.value)), stale.age_seconds)
+
+    def stale_post_by_slug_json(self, slug: str, idioma: str) -> StaleContent[bytes] | None:
+        """Busca una publicación por slug en la última copia válida del listado."""
+        return self._stale_post(idioma, lambda post: post.slug == slug)
+
+    def stale_post_by_id_json(self, id_noticia: int, idioma: str) -> StaleContent[bytes] | None:
+        """Busca una publicación por ID en la última copia válida del listado."""
+        return self._stale_post(idioma, lambda post: post.id_noticia == id_noticia)
+
+    def _stale_post(
+        self,
+        idioma: str,
+        matches: Callable[[schemas.Blog], bool],
+    ) -> StaleContent[bytes] | None:
+        stale = self._stale_posts(idioma)
+        if stale is None:
+            return None
+        for post in stale.value:
+            if matches(post):
+                return StaleContent(BLOG_ADAPTER.dump_json(post), stale.age_seconds)
+        return None
+
+    def _stale_posts(self, idioma: str) -> StaleContent[tuple[schemas.Blog, ...]] | None:
+        key = ("blog", "posts", idioma)
+        stale = self._cache.stale(key)
+        if stale is not None:
+            self._refresh_in_background(key, lambda service: service._load_all_posts(idioma))
+        return stale
+
+    def _refresh_in_background(
+        self,
+        key: tuple[str, ...],
+        load: Callable[["BlogService"], Awaitable[Any]],
+    ) -> None:
+        """Programa la recarga con una sesión propia: la de la petición se cierra antes."""
+        cache = self._cache
+
+        async def refresh() -> Any:
+            async with async_session() as session:
+                return await load(BlogService(session, cache=cache))
+
+        cache.schedule_refresh(key, refresh)
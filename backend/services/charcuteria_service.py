@@ -9,7 +9,16 @@ Este módulo separa la lógica de acceso a la base de datos de la capa HTTP, per
 un manejo más estructurado y reutilizable.
 
 Funcionalidades principales:
-- Obtener todos los productos de charcutería filtrados por idioma.
+- Obtener todos los productos de charcutería filtrados por idioma, reutilizando
+  la caché de contenido del worker mientras no cambie la versión publicada.
+- Entregar ese listado como JSON ya serializado.
+- Leer solo los campos pedidos con ``fields=`` y validarlos con un modelo parcial.
+- Construir el catálogo agrupado por categoría, con recuentos por faceta y filtros
+  opcionales por categoría y empresa, a partir del listado ya cacheado.
+- Autocompletar nombres de productos con un árbol de prefijos por idioma.
+- Servir la última copia válida del listado cuando MySQL no está disponible.
+- Con ``CONTENT_VALIDATED_ON_WRITE``, leer solo los productos marcados como válidos
+  al escribir y construir las respuestas sin validarlos de nuevo.
 
 Dependencias:
 - SQLAlchemy: Para consultas y operaciones en la base de datos.
@@ -17,16 +26,81 @@ Dependencias:
 """
 
 import logging
-from typing import List
+from typing import Any, List, Optional, Sequence
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from ..core.content_cache import ContentCache, StaleContent, content_cache
+from ..database import async_session
 from ..models import models, schemas
+from .charcuteria_suggest import CharcuteriaSuggestIndex
+from .field_projection import build_projection, projection_list_adapter, projection_model
+from .public_content import construct_public, only_public_rows, validated_on_write
 
 logger = logging.getLogger(__name__)
 
+CHARCUTERIA_LIST_ADAPTER = TypeAdapter(List[schemas.Charcuteria])
+CHARCUTERIA_SUGGESTION_LIST_ADAPTER = TypeAdapter(List[schemas.CharcuteriaSuggestion])
+
+
+def build_charcuteria_catalog(
+    idioma: str,
+    products: Sequence[schemas.Charcuteria],
+    categoria: Optional[str] = None,
+    empresa: Optional[str] = None,
+) -> schemas.CharcuteriaCatalog:
+    """
+    Agrupa un listado ordenado por categoría y nombre en un catálogo con facetas.
+
+    Los grupos conservan el orden del listado. La faceta de categorías aplica solo
+    el filtro de empresa y la de empresas solo el de categoría, para que cada una
+    muestre las alternativas disponibles con el otro filtro fijado.
+
+    Args:
+        idioma (str): Idioma del listado.
+        products (Sequence[schemas.Charcuteria]): Productos ordenados por categoría.
+        categoria (Optional[str]): Categoría exacta a la que limitar el catálogo.
+        empresa (Optional[str]): Empresa exacta a la que limitar el catálogo.
+
+    Returns:
+        schemas.CharcuteriaCatalog: Catálogo agrupado y sus recuentos.
+    """
+    groups: dict[str, list[schemas.Charcuteria]] = {}
+    category_counts: dict[str, int] = {}
+    company_counts: dict[str, int] = {}
+    for product in products:
+        matches_category = categoria is None or product.categoria == categoria
+        matches_company = empresa is None or product.empresa == empresa
+        if matches_company:
+            category_counts[product.categoria] = category_counts.get(product.categoria, 0) + 1
+        if matches_category and product.empresa is not None:
+            company_counts[product.empresa] = company_counts.get(product.empresa, 0) + 1
+        if matches_category and matches_company:
+            groups.setdefault(product.categoria, []).append(product)
+
+    return schemas.CharcuteriaCatalog(
+        idioma=idioma,
+        total=sum(len(group) for group in groups.values()),
+        categorias=[
+            schemas.CharcuteriaCategoryGroup(
+                categoria=name,
+                total=len(group),
+                productos=group,
+            )
+            for name, group in groups.items()
+        ],
+        facetas_categoria=[
+            schemas.CharcuteriaFacetCount(valor=name, total=total)
+            for name, total in category_counts.items()
+        ],
+        facetas_empresa=[
+            schemas.CharcuteriaFacetCount(valor=name, total=total)
+            for name, total in sorted(company_counts.items())
+        ],
+    )
+
 
 class CharcuteriaService:
     """
@@ -36,20 +110,24 @@ class CharcuteriaService:
     de charcutería, interactuando con la base de datos a través de SQLAlchemy.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: ContentCache | None = None):
         """
         Inicializa el servicio con una sesión de base de datos.
 
         Args:
             db (AsyncSession): Sesión de base de datos asíncrona.
+            cache (ContentCache | None): Caché de contenido; por defecto la del worker.
         """
         self.db = db
+        self._cache = cache if cache is not None else content_cache
 
     @staticmethod
     def _validate_public_product(
         product: models.Charcuteria,
     ) -> schemas.Charcuteria | None:
         """Convierte una fila ORM en una respuesta pública o la omite si está dañada."""
+        if validated_on_write():
+            return construct_public(schemas.Charcuteria, product)
         try:
             return schemas.Charcuteria.model_validate(product)
         except ValidationError:
@@ -73,8 +151,183 @@ class CharcuteriaService:
         Returns:
             List[schemas.Charcuteria]: Productos válidos del idioma solicitado.
         """
+        products = await self._cache.get_or_load(
+            ("charcuteria", "products", idioma),
+            lambda: self._load_all_products(idioma),
+            keep_snapshot=True,
+        )
+        return list(products)
+
+    async def get_all_products_json(self, idioma: str) -> bytes:
+        """
+        Obtiene el listado de un idioma como cuerpo JSON listo para enviar.
+
+        Args:
+            idioma (str): Idioma de los productos a obtener.
+
+        Returns:
+            bytes: Array JSON con los productos válidos.
+        """
+
+        async def load() -> bytes:
+            return CHARCUTERIA_LIST_ADAPTER.dump_json(await self.get_all_products(idioma))
+
+        return await self._cache.get_or_load(("charcuteria", "products-json", idioma), load)
+
+    async def get_projected_products_json(self, idioma: str, fields: tuple[str, ...]) -> bytes:
+        """
+        Obtiene el listado de un idioma con solo los campos seleccionados.
+
+        La consulta lee únicamente esas columnas y cada fila se valida con el modelo
+        parcial de la selección; el JSON resultante se conserva en el LRU de páginas
+        de la caché, porque las combinaciones de campos no están acotadas.
+
+        Args:
+            idioma (str): Idioma de los productos a obtener.
+            fields (tuple[str, ...]): Campos de ``schemas.Charcuteria`` en su orden declarado.
+
+        Returns:
+            bytes: Array JSON con los campos seleccionados de los productos válidos.
+        """
+        return await self._cache.get_or_load(
+            ("charcuteria", "projected-json", idioma, fields),
+            lambda: self._load_projected_products_json(idioma, fields),
+            paged=True,
+        )
+
+    async def _load_projected_products_json(self, idioma: str, fields: tuple[str, ...]) -> bytes:
+        """Consulta solo las columnas seleccionadas con el orden del listado completo."""
+        result = await self.db.execute(
+            only_public_rows(
+                select(*(getattr(models.Charcuteria, column) for column in fields)),
+                models.Charcuteria,
+            )
+            .where(models.Charcuteria.idioma == idioma)
+            .order_by(
+                models.Charcuteria.categoria.asc(),
+                models.Charcuteria.nombre.asc(),
+                models.Charcuteria.id_producto.asc(),
+            )
+        )
+
+        model = projection_model(schemas.Charcuteria, fields)
+        products = [
+            product
+            for product in (build_projection(model, row._mapping) for row in result.all())
+            if product is not None
+        ]
+        return projection_list_adapter(schemas.Charcuteria, fields).dump_json(products)
+
+    def stale_projected_products_json(
+        self,
+        idioma: str,
+        fields: tuple[str, ...],
+    ) -> StaleContent[bytes] | None:
+        """Proyecta la última copia válida del listado si MySQL no responde."""
+        stale = self._stale_products(idioma)
+        if stale is None:
+            return None
+        return StaleContent(
+            CHARCUTERIA_LIST_ADAPTER.dump_json(list(stale.value), include={"__all__": set(fields)}),
+            stale.age_seconds,
+        )
+
+    async def get_catalog_json(
+        self,
+        idioma: str,
+        categoria: Optional[str] = None,
+        empresa: Optional[str] = None,
+    ) -> bytes:
+        """
+        Obtiene el catálogo agrupado de un idioma como cuerpo JSON listo para enviar.
+
+        Se calcula a partir del listado cacheado del idioma, sin consultas propias.
+        Solo se conservan en caché las combinaciones cuyos filtros existen en el
+        catálogo: valores arbitrarios de la query no pueden desplazar entradas útiles.
+
+        Args:
+            idioma (str): Idioma de los productos.
+            categoria (Optional[str]): Categoría exacta por la que filtrar.
+            empresa (Optional[str]): Empresa exacta por la que filtrar.
+
+        Returns:
+            bytes: Objeto JSON con el catálogo agrupado.
+        """
+        products = await self.get_all_products(idioma)
+        known_filters = (
+            categoria is None or any(product.categoria == categoria for product in products)
+        ) and (empresa is None or any(product.empresa == empresa for product in products))
+
+        async def load() -> bytes:
+            return build_charcuteria_catalog(
+                idioma, products, categoria, empresa
+            ).model_dump_json().encode("utf-8")
+
+        return await self._cache.get_or_load(
+            ("charcuteria", "catalog-json", idioma, categoria, empresa),
+            load,
+            should_store=lambda _body: known_filters,
+        )
+
+    async def suggest_products_json(self, idioma: str, query: str, limit: int) -> bytes:
+        """
+        Sugiere productos cuyo nombre o empresa empieza por el texto escrito.
+
+        El árbol de prefijos se construye a partir del listado cacheado una vez por
+        versión de contenido; las consultas posteriores no acceden a MySQL.
+
+        Args:
+            idioma (str): Idioma de los productos.
+            query (str): Prefijo escrito por el usuario.
+            limit (int): Número máximo de sugerencias.
+
+        Returns:
+            bytes: Array JSON con las sugerencias ordenadas.
+        """
+
+        async def load() -> CharcuteriaSuggestIndex:
+            return CharcuteriaSuggestIndex(await self.get_all_products(idioma))
+
+        index = await self._cache.get_or_load(
+            ("charcuteria", "suggest-index", idioma),
+            load,
+            keep_snapshot=True,
+        )
+        return self._suggestions_json(index, query, limit)
+
+    def stale_suggest_products_json(
+        self,
+        idioma: str,
+        query: str,
+        limit: int,
+    ) -> StaleContent[bytes] | None:
+        """Sugiere productos con el último árbol válido cuando MySQL no responde."""
+        stale = self._cache.stale(("charcuteria", "suggest-index", idioma))
+        if stale is None:
+            return None
+        # Al recuperarse el listado, la siguiente consulta reconstruye el árbol.
+        self._stale_products(idioma)
+        return StaleContent(self._suggestions_json(stale.value, query, limit), stale.age_seconds)
+
+    @staticmethod
+    def _suggestions_json(index: CharcuteriaSuggestIndex, query: str, limit: int) -> bytes:
+        return CHARCUTERIA_SUGGESTION_LIST_ADAPTER.dump_json(
+            [
+                schemas.CharcuteriaSuggestion(
+                    id_producto=product.id_producto,
+                    nombre=product.nombre,
+                    empresa=product.empresa,
+                    categoria=product.categoria,
+                    imagen_url=product.imagen_url,
+                )
+                for product in index.suggest(query, limit)
+            ]
+        )
+
+    async def _load_all_products(self, idioma: str) -> tuple[schemas.Charcuteria, ...]:
+        """Consulta y valida el listado completo de un idioma."""
         result = await self.db.execute(
-            select(models.Charcuteria)
+            only_public_rows(select(models.Charcuteria), models.Charcuteria)
             .where(models.Charcuteria.idioma == idioma)
             .order_by(
                 models.Charcuteria.categoria.asc(),
@@ -88,4 +341,66 @@ class CharcuteriaService:
             validated_product = self._validate_public_product(row)
             if validated_product is not None:
                 products.append(validated_product)
-        return products
+        return tuple(products)
+
+    def stale_all_products_json(self, idioma: str) -> StaleContent[bytes] | None:
+        """
+        Devuelve la última copia válida del listado de un idioma, si existe.
+
+        Se usa cuando MySQL no responde y programa un intento de recuperación en
+        segundo plano con una sesión propia.
+
+        Args:
+            idioma (str): Idioma de los productos.
+
+        Returns:
+            StaleContent[bytes] | None: Array JSON obsoleto y su antigüedad.
+        """
+        stale = self._stale_products(idioma)
+        if stale is None:
+            return None
+        return StaleContent(
+            CHARCUTERIA_LIST_ADAPTER.dump_json(list(stale.value)),
+            stale.age_seconds,
+        )
+
+    def stale_catalog_json(
+        self,
+        idioma: str,
+        categoria: Optional[str] = None,
+        empresa: Optional[str] = None,
+    ) -> StaleContent[bytes] | None:
+        """
+        Construye el catálogo a partir de la última copia válida del listado.
+
+        Args:
+            idioma (str): Idioma de los productos.
+            categoria (Optional[str]): Categoría exacta por la que filtrar.
+            empresa (Optional[str]): Empresa exacta por la que filtrar.
+
+        Returns:
+            StaleContent[bytes] | None: Catálogo obsoleto y su antigüedad.
+        """
+        stale = self._stale_products(idioma)
+        if stale is None:
+            return None
+        catalog = build_charcuteria_catalog(idioma, stale.value, categoria, empresa)
+        return StaleContent(catalog.model_dump_json().encode("utf-8"), stale.age_seconds)
+
+    def _stale_products(
+        self, idioma: str
+    ) -> StaleContent[tuple[schemas.Charcuteria, ...]] | None:
+        """Recupera la copia del listado y programa su recuperación en segundo plano."""
+        key = ("charcuteria", "products", idioma)
+        stale = self._cache.stale(key)
+        if stale is None:
+            return None
+
+        cache = self._cache
+
+        async def refresh() -> Any:
+            async with async_session() as session:
+                return await CharcuteriaService(session, cache=cache)._load_all_products(idioma)
+
+        cache.schedule_refresh(key, refresh)
+        return stale
@@ -0,0 +1,115 @@
+"""
+services/charcuteria_suggest.py
+
+Árbol de prefijos para autocompletar nombres de productos de charcutería.
+
+Este módulo incluye:
+- El plegado de mayúsculas y diacríticos de nombres, empresas y consultas, el
+  mismo que se usa al comparar slugs del blog.
+- Un trie inmutable por idioma en el que cada nodo guarda ya ordenados sus mejores
+  candidatos, de modo que una consulta solo recorre tantos nodos como caracteres
+  tiene y no ordena nada.
+"""
+
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from ..core.blog_slug import blog_slug_lookup_key
+from ..models import schemas
+
+# Candidatos conservados en cada nodo; es también el máximo de sugerencias.
+MAX_SUGGESTIONS = 10
+
+# Orden de preferencia según dónde coincide el prefijo.
+_MATCH_NAME_START = 0
+_MATCH_NAME_WORD = 1
+_MATCH_COMPANY = 2
+
+
+def fold_suggest_text(text: str) -> str:
+    """Pliega un texto y compacta sus espacios para compararlo por prefijo."""
+    return " ".join(blog_slug_lookup_key(unicodedata.normalize("NFC", text)).split())
+
+
+@dataclass
+class _Node:
+    children: dict[str, "_Node"] = field(default_factory=dict)
+    # Durante la construcción: (clave de orden, posición); después, posiciones.
+    candidates: list = field(default_factory=list)
+
+
+def _word_suffixes(folded: str) -> list[str]:
+    """Devuelve el texto desde el comienzo de cada palabra."""
+    suffixes = [folded]
+    for position, character in enumerate(folded):
+        if character == " " and position + 1 < len(folded):
+            suffixes.append(folded[position + 1:])
+    return suffixes
+
+
+class CharcuteriaSuggestIndex:
+    """Trie de nombres y empresas de los productos de un idioma."""
+
+    def __init__(self, products: Iterable[schemas.Charcuteria]) -> None:
+        self._products = tuple(products)
+        self._root = _Node()
+        for position, product in enumerate(self._products):
+            folded_name = fold_suggest_text(product.nombre)
+            name_rank = (len(folded_name), folded_name, product.id_producto)
+            for index, suffix in enumerate(_word_suffixes(folded_name)):
+                kind = _MATCH_NAME_START if index == 0 else _MATCH_NAME_WORD
+                self._insert(suffix, ((kind, *name_rank), position))
+            if product.empresa:
+                for suffix in _word_suffixes(fold_suggest_text(product.empresa)):
+                    self._insert(suffix, ((_MATCH_COMPANY, *name_rank), position))
+        self._finalize(self._root)
+
+    def _insert(self, text: str, candidate: tuple) -> None:
+        node = self._root
+        for character in text:
+            node = node.children.setdefault(character, _Node())
+            node.candidates.append(candidate)
+
+    @staticmethod
+    def _finalize(root: _Node) -> None:
+        """Ordena cada nodo una vez y conserva sus mejores productos distintos."""
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            best: list[int] = []
+            for _rank, position in sorted(node.candidates):
+                if position not in best:
+                    best.append(position)
+                    if len(best) == MAX_SUGGESTIONS:
+                        break
+            node.candidates = best
+            pending.extend(node.children.values())
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def suggest(self, query: str, limit: int = MAX_SUGGESTIONS) -> list[schemas.Charcuteria]:
+        """
+        Devuelve los productos cuyo nombre o empresa tiene una palabra con ese prefijo.
+
+        Primero los que empiezan por el prefijo, después los que lo contienen al
+        comienzo de otra palabra y por último los que coinciden por empresa; dentro
+        de cada grupo, los nombres más cortos.
+
+        Args:
+            query (str): Prefijo escrito por el usuario.
+            limit (int): Número máximo de sugerencias.
+
+        Returns:
+            list[schemas.Charcuteria]: Productos sugeridos.
+        """
+        node = self._root
+        for character in fold_suggest_text(query):
+            child = node.children.get(character)
+            if child is None:
+                return []
+            node = child
+        if node is self._root:
+            return []
+        return [self._products[position] for position in node.candidates[:limit]]
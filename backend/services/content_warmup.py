@@ -0,0 +1,83 @@
+# backend/services/content_warmup.py
+
+"""
+services/content_warmup.py
+
+Precarga opcional de la caché de contenido durante el arranque del worker.
+
+Tras un despliegue, los primeros visitantes de cada idioma pagarían la consulta y
+la validación del listado del blog, de charcutería y del sitemap. Este módulo
+ejecuta esas lecturas una vez, en paralelo y con sesiones propias, para que las
+primeras peticiones ya encuentren la caché llena.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import async_session
+from .blog_service import BlogService
+from .charcuteria_service import CharcuteriaService
+from .sitemap_service import SitemapService
+
+logger = logging.getLogger(__name__)
+
+# Idiomas publicados por el frontend.
+WARMUP_LANGUAGES: tuple[str, ...] = ("es", "en", "de", "fr")
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    """Lecturas precargadas y lecturas que fallaron durante la precarga."""
+
+    loaded: int
+    failed: int
+
+
+async def warm_up_content_cache(
+    session_factory: Callable[[], AsyncSession] = async_session,
+    languages: tuple[str, ...] = WARMUP_LANGUAGES,
+    max_concurrency: int = 1,
+) -> WarmupResult:
+    """
+    Llena la caché con los listados de cada idioma y las entradas del sitemap.
+
+    Cada lectura usa su propia sesión, porque una ``AsyncSession`` no admite
+    consultas concurrentes. ``max_concurrency`` limita las conexiones simultáneas
+    para no agotar el pool del worker durante el arranque.
+
+    Args:
+        session_factory (Callable[[], AsyncSession]): Fábrica de sesiones.
+        languages (tuple[str, ...]): Idiomas a precargar.
+        max_concurrency (int): Lecturas simultáneas como máximo.
+
+    Returns:
+        WarmupResult: Número de lecturas completadas y fallidas.
+    """
+    reads: list[Callable[[AsyncSession], Awaitable[object]]] = [
+        lambda session: SitemapService(session).get_blog_entries(),
+    ]
+    for idioma in languages:
+        reads.append(lambda session, idioma=idioma: BlogService(session).get_all_posts_json(idioma))
+        reads.append(
+            lambda session, idioma=idioma: CharcuteriaService(session).get_all_products_json(idioma)
+        )
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(read: Callable[[AsyncSession], Awaitable[object]]) -> None:
+        async with semaphore:
+            async with session_factory() as session:
+                await read(session)
+
+    results = await asyncio.gather(*(run(read) for read in reads), return_exceptions=True)
+    failures = [result for result in results if isinstance(result, BaseException)]
+    for failure in failures:
+        logger.warning(
+            "Una lectura de la precarga de contenido ha fallado: %s",
+            type(failure).__name__,
+        )
+    return WarmupResult(loaded=len(results) - len(failures), failed=len(failures))
@@ -0,0 +1,110 @@
+"""
+services/field_projection.py
+
+Selección de campos (``fields=``) para los listados de blog y charcutería.
+
+Este módulo incluye:
+- La validación del parámetro contra los campos del esquema público completo.
+- Modelos de respuesta parciales creados con ``create_model`` a partir de los
+  mismos campos y validadores públicos, conservados en caché por combinación.
+- La validación de las filas proyectadas, o su construcción directa cuando el
+  contenido se valida al escribir.
+"""
+
+import logging
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, List
+
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
+
+from ..models import schemas
+from .public_content import construct_public, validated_on_write
+
+logger = logging.getLogger(__name__)
+
+# Base de cada esquema con sus validadores públicos declarados con ``check_fields=False``.
+PROJECTION_BASES: dict[type[BaseModel], type[BaseModel]] = {
+    schemas.Blog: schemas.BlogPublicValidators,
+    schemas.Charcuteria: schemas.CharcuteriaPublicValidators,
+}
+MAX_FIELDS_PARAMETER_LENGTH = 300
+# Combinaciones de campos distintas conservadas por esquema.
+MAX_CACHED_PROJECTIONS = 256
+
+
+class InvalidFieldSelectionError(ValueError):
+    """El parámetro ``fields`` contiene nombres vacíos o que el esquema no define."""
+
+
+def parse_field_selection(raw_fields: str, schema: type[BaseModel]) -> tuple[str, ...]:
+    """
+    Convierte ``fields=slug,titulo`` en los campos del esquema en su orden declarado.
+
+    El orden canónico hace que ``titulo,slug`` y ``slug,titulo`` compartan modelo y
+    entrada de caché.
+
+    Args:
+        raw_fields (str): Nombres separados por comas.
+        schema (type[BaseModel]): Esquema público completo.
+
+    Raises:
+        InvalidFieldSelectionError: Si algún nombre está vacío o no existe.
+
+    Returns:
+        tuple[str, ...]: Campos seleccionados sin duplicados.
+    """
+    names = {name.strip() for name in raw_fields.split(",")}
+    if "" in names:
+        raise InvalidFieldSelectionError("fields contiene un nombre de campo vacío")
+    unknown = sorted(names - schema.model_fields.keys())
+    if unknown:
+        raise InvalidFieldSelectionError(f"Campos desconocidos en fields: {', '.join(unknown)}")
+    return tuple(name for name in schema.model_fields if name in names)
+
+
+@lru_cache(maxsize=MAX_CACHED_PROJECTIONS)
+def projection_model(schema: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """Crea el modelo parcial con los tipos, restricciones y validadores del esquema."""
+    definitions = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name])
+        for name in fields
+    }
+    return create_model(  # type: ignore[call-overload]
+        f"{schema.__name__}Proyeccion",
+        __base__=PROJECTION_BASES[schema],
+        **definitions,
+    )
+
+
+@lru_cache(maxsize=MAX_CACHED_PROJECTIONS)
+def projection_list_adapter(schema: type[BaseModel], fields: tuple[str, ...]) -> TypeAdapter:
+    """Serializador de listas del modelo parcial."""
+    return TypeAdapter(List[projection_model(schema, fields)])  # type: ignore[misc]
+
+
+def build_projection(model: type[BaseModel], values: Mapping[str, Any]) -> BaseModel | None:
+    """
+    Valida una fila proyectada o la omite si alguno de sus campos está dañado.
+
+    Solo se comprueban los campos seleccionados: una fila con otro campo dañado
+    aparece en la proyección aunque falte en el listado completo, salvo que la
+    marca de validación en escritura ya la excluya de la consulta.
+
+    Args:
+        model (type[BaseModel]): Modelo parcial de ``projection_model``.
+        values (Mapping[str, Any]): Columnas leídas de MySQL.
+
+    Returns:
+        BaseModel | None: Fila proyectada o None si no es válida.
+    """
+    if validated_on_write():
+        return construct_public(model, values)
+    try:
+        return model.model_validate({name: values[name] for name in model.model_fields})
+    except ValidationError:
+        logger.warning(
+            "Fila omitida de una proyección por datos públicos no válidos: modelo=%s",
+            model.__name__,
+        )
+        return None
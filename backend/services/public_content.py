@@ -0,0 +1,224 @@
+"""
+services/public_content.py
+
+Validación en escritura del contrato público del blog y de charcutería.
+
+Este módulo incluye:
+- El filtro de las lecturas públicas por la marca ``publicamente_valido`` cuando
+  ``CONTENT_VALIDATED_ON_WRITE`` está activo.
+- La construcción de respuestas a partir de filas ya marcadas, sin volver a
+  ejecutar los validadores de Pydantic en cada petición.
+- La revisión por lotes de las filas existentes: guarda la forma normalizada de
+  las válidas, actualiza su marca e informa una sola vez de las dañadas.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Table, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..core.config import settings
+from ..models import models, schemas
+
+DEFAULT_VALIDATION_BATCH_SIZE = 500
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+def validated_on_write() -> bool:
+    """Indica si las lecturas públicas confían en la marca de cada fila."""
+    return settings.CONTENT_VALIDATED_ON_WRITE
+
+
+def only_public_rows(query, model):
+    """Limita la consulta a las filas marcadas cuando la validación se hace al escribir."""
+    if not validated_on_write():
+        return query
+    return query.where(model.publicamente_valido.is_(True))
+
+
+def construct_public(schema: type[SchemaT], row: Any) -> SchemaT:
+    """
+    Construye la respuesta de una fila marcada sin ejecutar los validadores.
+
+    La revisión ya guardó la forma normalizada de la fila, de modo que el resultado
+    coincide con el que produciría ``model_validate``.
+
+    Args:
+        schema (type[SchemaT]): Esquema público de la respuesta.
+        row (Any): Fila ORM o diccionario con las columnas del esquema.
+
+    Returns:
+        SchemaT: Respuesta construida con los valores almacenados.
+    """
+    if isinstance(row, Mapping):
+        values = {name: row[name] for name in schema.model_fields if name in row}
+    else:
+        values = {name: getattr(row, name) for name in schema.model_fields}
+    return schema.model_construct(**values)
+
+
+@dataclass(frozen=True)
+class PublicTable:
+    """Tabla con contenido público, su esquema y las columnas que normaliza."""
+
+    table: Table
+    schema: type[BaseModel]
+    key_columns: tuple[str, str]
+    content_columns: tuple[str, ...]
+
+
+PUBLIC_TABLES: dict[str, PublicTable] = {
+    "blog": PublicTable(
+        table=models.Blog.__table__,
+        schema=schemas.Blog,
+        key_columns=("id_noticia", "idioma"),
+        content_columns=("slug", "titulo", "contenido", "autor", "imagen_url", "imagen_url_2"),
+    ),
+    "charcuteria": PublicTable(
+        table=models.Charcuteria.__table__,
+        schema=schemas.Charcuteria,
+        key_columns=("id_producto", "idioma"),
+        content_columns=("nombre", "empresa", "descripcion", "imagen_url", "categoria"),
+    ),
+}
+
+
+@dataclass(frozen=True)
+class PublicRowReview:
+    """Resultado de validar una fila: validez, columnas que normalizar y motivo."""
+
+    valid: bool
+    changes: dict[str, Any]
+    detail: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class InvalidPublicRow:
+    """Fila que no cumple el contrato público y queda fuera de las lecturas."""
+
+    table: str
+    key: tuple[Any, ...]
+    detail: str
+
+    def __str__(self) -> str:
+        key = ", ".join(str(part) for part in self.key)
+        return f"{self.table} ({key}): {self.detail}"
+
+
+@dataclass
+class PublicValidationReport:
+    """Resumen de la revisión de una tabla."""
+
+    checked: int = 0
+    marked: int = 0
+    normalized: int = 0
+    invalid: list[InvalidPublicRow] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        """Indica si la revisión modificó filas y debe publicarse otra versión."""
+        return bool(self.marked or self.normalized)
+
+
+def review_public_row(target: PublicTable, values: Mapping[str, Any]) -> PublicRowReview:
+    """
+    Valida una fila con el esquema público y calcula su forma normalizada.
+
+    Args:
+        target (PublicTable): Tabla a la que pertenece la fila.
+        values (Mapping[str, Any]): Columnas almacenadas.
+
+    Returns:
+        PublicRowReview: Si es válida y qué columnas cambian al normalizarla.
+    """
+    try:
+        validated = target.schema.model_validate(dict(values))
+    except ValidationError as error:
+        detail = "; ".join(
+            f"{'.'.join(str(part) for part in item['loc']) or 'fila'}: {item['msg']}"
+            for item in error.errors()
+        )
+        return PublicRowReview(valid=False, changes={}, detail=detail)
+
+    normalized = validated.model_dump(include=set(target.content_columns))
+    changes = {
+        column: value
+        for column, value in normalized.items()
+        if values.get(column) != value
+    }
+    return PublicRowReview(valid=True, changes=changes)
+
+
+def _preserved_columns(table: Table) -> dict[str, Any]:
+    """Columnas con ``onupdate`` que la revisión no debe modificar."""
+    return {column.name: column for column in table.columns if column.onupdate is not None}
+
+
+async def validate_public_table(
+    engine: AsyncEngine,
+    table_name: str,
+    batch_size: int = DEFAULT_VALIDATION_BATCH_SIZE,
+) -> PublicValidationReport:
+    """
+    Revisa todas las filas de una tabla por lotes y actualiza su marca.
+
+    Cada lote se lee por clave primaria (keyset) y se confirma en su propia
+    transacción, de modo que la revisión de una tabla grande no mantiene bloqueos
+    largos. Solo se escriben las marcas que cambian y las filas que necesitan
+    normalizarse; las fechas de actualización se conservan.
+
+    Args:
+        engine (AsyncEngine): Motor de la base de datos.
+        table_name (str): ``blog`` o ``charcuteria``.
+        batch_size (int): Filas leídas por lote.
+
+    Returns:
+        PublicValidationReport: Filas revisadas, cambios y filas no válidas.
+    """
+    target = PUBLIC_TABLES[table_name]
+    table = target.table
+    key_columns = tuple(table.c[name] for name in target.key_columns)
+    preserved = _preserved_columns(table)
+    report = PublicValidationReport()
+    last_key: Optional[tuple[Any, ...]] = None
+
+    while True:
+        query = select(*table.c).order_by(*key_columns).limit(batch_size)
+        if last_key is not None:
+            query = query.where(tuple_(*key_columns) > tuple_(*last_key))
+
+        async with engine.begin() as connection:
+            rows = (await connection.execute(query)).mappings().all()
+            marks: dict[bool, list[tuple[Any, ...]]] = {True: [], False: []}
+            for row in rows:
+                key = tuple(row[name] for name in target.key_columns)
+                review = review_public_row(target, row)
+                if not review.valid:
+                    report.invalid.append(InvalidPublicRow(table_name, key, review.detail or ""))
+                if review.changes:
+                    await connection.execute(
+                        update(table)
+                        .where(tuple_(*key_columns) == tuple_(*key))
+                        .values(**review.changes, **preserved)
+                    )
+                    report.normalized += 1
+                if bool(row["publicamente_valido"]) != review.valid:
+                    marks[review.valid].append(key)
+
+            for valid, keys in marks.items():
+                if keys:
+                    await connection.execute(
+                        update(table)
+                        .where(tuple_(*key_columns).in_(keys))
+                        .values(publicamente_valido=valid, **preserved)
+                    )
+                    report.marked += len(keys)
+
+        report.checked += len(rows)
+        if len(rows) < batch_size:
+            return report
+        last_key = tuple(rows[-1][name] for name in target.key_columns)
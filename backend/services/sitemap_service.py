@@ -1,47 +1,378 @@
 """Servicio de lectura validada para generar el sitemap público."""
 
+import base64
+import binascii
+import hashlib
+import json
 import logging
+import unicodedata
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from urllib.parse import quote
+from xml.sax.saxutils import escape, quoteattr
+
 from pydantic import ValidationError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.config import settings
+from ..core.content_cache import ContentCache, StaleContent, content_cache
+from ..database import async_session
 from ..models import models, schemas
+from .public_content import only_public_rows, validated_on_write
 
 logger = logging.getLogger(__name__)
 SUPPORTED_LANGUAGES = {"es", "en", "de", "fr"}
+MAX_SITEMAP_CURSOR_LENGTH = 200
+DEFAULT_SITEMAP_LANGUAGE = "es"
+SITEMAP_XML_BATCH_SIZE = 200
+# Espera máxima a que otra petición termine el sitemap XML antes de generarlo de nuevo.
+SITEMAP_XML_WAIT_SECONDS = 30.0
+BLOG_XML_CACHE_KEY = ("sitemap", "blog-xml")
+# ``wbits`` de zlib que producen un flujo gzip completo, con cabecera y CRC.
+GZIP_WBITS = 31
+SITEMAP_XML_HEADER = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+    b'xmlns:xhtml="http://www.w3.org/1999/xhtml">\n'
+)
+SITEMAP_XML_FOOTER = b"</urlset>\n"
+
+
+class InvalidSitemapCursorError(ValueError):
+    """El cursor del sitemap incremental está dañado o no lo generó esta API."""
+
+
+@dataclass(frozen=True)
+class _KeySnapshot:
+    """Conjunto de URLs publicado en una versión y la fecha más reciente que contiene."""
+
+    digest: str
+    watermark: Optional[datetime]
+    keys: frozenset[str]
+
+
+def _entry_key(entry: schemas.SitemapBlogEntry) -> str:
+    # El slug forma parte de la clave: un cambio de URL sin nueva fecha de
+    # actualización también debe llegar al cliente.
+    return f"{entry.id_noticia}\t{entry.idioma}\t{entry.slug}"
+
+
+def _removal_key(key: str) -> tuple[int, str]:
+    id_noticia, idioma, _slug = key.split("\t", 2)
+    return int(id_noticia), idioma
+
+
+def blog_post_url(site_url: str, entry: schemas.SitemapBlogEntry) -> str:
+    """URL pública de un artículo con el mismo esquema de rutas que el frontend."""
+    # Equivale a ``encodeURIComponent`` sobre el slug en NFC.
+    slug = quote(unicodedata.normalize("NFC", entry.slug), safe="!*'()")
+    prefix = "" if entry.idioma == DEFAULT_SITEMAP_LANGUAGE else f"/{entry.idioma}"
+    return f"{site_url}{prefix}/blog/{slug}"
+
+
+def render_blog_url_group(
+    site_url: str,
+    translations: Sequence[schemas.SitemapBlogEntry],
+) -> bytes:
+    """
+    Genera los elementos ``<url>`` de una publicación y sus traducciones.
+
+    Cada traducción enlaza a todas las demás con ``hreflang`` y a la versión en
+    español, o a la primera disponible, como ``x-default``.
+    """
+    urls = [(entry.idioma, blog_post_url(site_url, entry)) for entry in translations]
+    default_url = next(
+        (url for idioma, url in urls if idioma == DEFAULT_SITEMAP_LANGUAGE),
+        urls[0][1],
+    )
+    alternates = "".join(
+        f'<xhtml:link rel="alternate" hreflang={quoteattr(idioma)} href={quoteattr(url)}/>'
+        for idioma, url in [*urls, ("x-default", default_url)]
+    )
+    return "".join(
+        f"<url><loc>{escape(url)}</loc>"
+        f"<lastmod>{entry.lastmod.isoformat()}</lastmod>{alternates}</url>\n"
+        for entry, (_idioma, url) in zip(translations, urls)
+    ).encode("utf-8")
+
+
+def encode_sitemap_cursor(watermark: Optional[datetime], digest: str) -> str:
+    """Codifica la fecha más reciente servida y el resumen del conjunto de URLs."""
+    payload = json.dumps(
+        [watermark.isoformat() if watermark is not None else None, digest],
+        separators=(",", ":"),
+    ).encode("ascii")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_sitemap_cursor(cursor: str) -> tuple[Optional[datetime], str]:
+    """Recupera el estado codificado o lanza ``InvalidSitemapCursorError``."""
+    if not cursor or len(cursor) > MAX_SITEMAP_CURSOR_LENGTH:
+        raise InvalidSitemapCursorError("Cursor del sitemap no válido")
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_watermark, digest = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        watermark = None if raw_watermark is None else datetime.fromisoformat(raw_watermark)
+    except (binascii.Error, TypeError, ValueError, UnicodeError) as error:
+        raise InvalidSitemapCursorError("Cursor del sitemap no válido") from error
+
+    if not isinstance(digest, str) or len(digest) != 32:
+        raise InvalidSitemapCursorError("Cursor del sitemap no válido")
+    return watermark, digest
+
+
 class SitemapService:
     """Obtiene únicamente las publicaciones que también son accesibles públicamente."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: ContentCache | None = None):
         self.db = db
+        self._cache = cache if cache is not None else content_cache
 
     async def get_blog_entries(self) -> list[schemas.SitemapBlogEntry]:
         """Lista URLs de artículos que superan el mismo contrato que la API pública."""
+        return list(
+            await self._cache.get_or_load(
+                ("sitemap", "blog"),
+                self._load_blog_entries,
+                keep_snapshot=True,
+            )
+        )
+
+    async def get_blog_changes(self, since: Optional[str] = None) -> schemas.SitemapBlogChanges:
+        """
+        Devuelve los cambios del sitemap desde el cursor ``since``.
+
+        Son cambios las entradas cuya fecha de actualización o publicación es igual
+        o posterior a la más reciente del cursor, y las entradas nuevas o con otro
+        slug. Las eliminadas se obtienen comparando con el conjunto de URLs que
+        tenía el cliente, guardado en Redis durante
+        ``SITEMAP_CHANGES_RETENTION_SECONDS``. Sin cursor, o si ese conjunto ya no
+        está disponible, se devuelve el sitemap completo con ``completo=True``.
+
+        Raises:
+            InvalidSitemapCursorError: Si el cursor no es válido.
+        """
+        previous = decode_sitemap_cursor(since) if since is not None else None
+        entries = await self.get_blog_entries()
+        snapshot = await self._cache.get_or_load(
+            ("sitemap", "key-snapshot"),
+            lambda: self._publish_key_snapshot(entries),
+        )
+        cursor = encode_sitemap_cursor(snapshot.watermark, snapshot.digest)
+
+        if previous is None:
+            return self._full_changes(entries, cursor)
+        watermark, digest = previous
+
+        if digest == snapshot.digest:
+            previous_keys = snapshot.keys
+        else:
+            payload = await self._cache.load_shared(f"sitemap-keys:{digest}")
+            if payload is None:
+                return self._full_changes(entries, cursor)
+            try:
+                previous_keys = frozenset(zlib.decompress(payload).decode("utf-8").split("\n"))
+            except (zlib.error, UnicodeDecodeError):
+                logger.warning("Instantánea del sitemap dañada en Redis; se envía completo")
+                return self._full_changes(entries, cursor)
+
+        try:
+            changed = [
+                entry
+                for entry in entries
+                if _entry_key(entry) not in previous_keys
+                or (watermark is not None and entry.lastmod >= watermark)
+            ]
+        except TypeError:
+            # Fechas con y sin zona horaria no son comparables: se resincroniza.
+            return self._full_changes(entries, cursor)
+
+        current_pairs = {(entry.id_noticia, entry.idioma) for entry in entries}
+        removed = sorted(
+            pair
+            for pair in {_removal_key(key) for key in previous_keys if key}
+            if pair not in current_pairs
+        )
+        return schemas.SitemapBlogChanges(
+            completo=False,
+            cursor=cursor,
+            entradas=changed,
+            eliminadas=[
+                schemas.SitemapBlogRemoval(id_noticia=id_noticia, idioma=idioma)
+                for id_noticia, idioma in removed
+            ],
+        )
+
+    async def _publish_key_snapshot(
+        self, entries: list[schemas.SitemapBlogEntry]
+    ) -> _KeySnapshot:
+        """Resume el conjunto de URLs vigente y lo comparte con los demás workers."""
+        keys = frozenset(_entry_key(entry) for entry in entries)
+        serialized = "\n".join(sorted(keys)).encode("utf-8")
+        digest = hashlib.sha256(serialized).hexdigest()[:32]
+        await self._cache.store_shared(
+            f"sitemap-keys:{digest}",
+            zlib.compress(serialized),
+            settings.SITEMAP_CHANGES_RETENTION_SECONDS,
+        )
+        watermark = max((entry.lastmod for entry in entries), default=None)
+        return _KeySnapshot(digest=digest, watermark=watermark, keys=keys)
+
+    @staticmethod
+    def _full_changes(
+        entries: list[schemas.SitemapBlogEntry], cursor: str
+    ) -> schemas.SitemapBlogChanges:
+        return schemas.SitemapBlogChanges(
+            completo=True,
+            cursor=cursor,
+            entradas=entries,
+            eliminadas=[],
+        )
+
+    def stale_blog_entries(self) -> StaleContent[list[schemas.SitemapBlogEntry]] | None:
+        """Última copia válida de las entradas, usada si MySQL no responde."""
+        key = ("sitemap", "blog")
+        stale = self._cache.stale(key)
+        if stale is None:
+            return None
+
+        cache = self._cache
+
+        async def refresh() -> tuple[schemas.SitemapBlogEntry, ...]:
+            async with async_session() as session:
+                return await SitemapService(session, cache=cache)._load_blog_entries()
+
+        cache.schedule_refresh(key, refresh)
+        return StaleContent(list(stale.value), stale.age_seconds)
+
+    async def _load_blog_entries(self) -> tuple[schemas.SitemapBlogEntry, ...]:
+        """Consulta y valida las entradas; la tupla evita mutaciones de la copia en caché."""
         result = await self.db.execute(
-            select(models.Blog)
+            only_public_rows(select(models.Blog), models.Blog)
             .where(models.Blog.idioma.in_(SUPPORTED_LANGUAGES))
             .order_by(models.Blog.id_noticia, models.Blog.idioma)
         )
 
         entries: list[schemas.SitemapBlogEntry] = []
         for row in result.scalars().all():
+            entry = self._to_sitemap_entry(row)
+            if entry is not None:
+                entries.append(entry)
+
+        return tuple(entries)
+
+    async def get_cached_blog_xml(self) -> bytes | None:
+        """
+        Documento XML comprimido con gzip de la versión vigente, si ya se generó.
+
+        Si otra petición lo está generando, espera a que termine en lugar de repetir
+        la consulta y la compresión del sitemap completo.
+        """
+        return await self._cache.wait_for_load(BLOG_XML_CACHE_KEY, SITEMAP_XML_WAIT_SECONDS)
+
+    async def stream_blog_xml(self, site_url: str) -> AsyncIterator[bytes]:
+        """
+        Abre la consulta del sitemap XML y devuelve el generador de su contenido.
+
+        Las filas se leen con un cursor del servidor por lotes de
+        ``SITEMAP_XML_BATCH_SIZE`` y solo se conserva en memoria la publicación en
+        curso con sus traducciones. Mientras se envía, el documento se comprime con
+        gzip y, al terminar, se guarda en la caché si la versión no ha cambiado.
+
+        La consulta se abre antes de devolver el generador para que un fallo de MySQL
+        pueda responderse con 503 en lugar de cortar una respuesta ya iniciada.
+
+        La generación se anuncia en la caché: las peticiones que llegan mientras tanto
+        esperan el documento en ``get_cached_blog_xml``. Si el envío no termina, o
+        tarda más de ``SITEMAP_XML_WAIT_SECONDS``, generan el suyo.
+
+        Args:
+            site_url (str): Origen público del frontend, sin barra final.
+
+        Returns:
+            AsyncIterator[bytes]: Fragmentos del documento XML.
+        """
+        version = await self._cache.current_version()
+        loading = self._cache.begin_load(BLOG_XML_CACHE_KEY, version)
+        try:
+            result = await self.db.stream(
+                only_public_rows(select(models.Blog), models.Blog)
+                .where(models.Blog.idioma.in_(SUPPORTED_LANGUAGES))
+                .order_by(models.Blog.id_noticia, models.Blog.idioma)
+                .execution_options(yield_per=SITEMAP_XML_BATCH_SIZE)
+            )
+        except BaseException:
+            if loading is not None:
+                loading.cancel()
+            raise
+
+        async def generate() -> AsyncIterator[bytes]:
+            compressor = zlib.compressobj(wbits=GZIP_WBITS)
+            compressed: list[bytes] = []
+            translations: list[schemas.SitemapBlogEntry] = []
+
+            def emit(chunk: bytes) -> bytes:
+                compressed.append(compressor.compress(chunk))
+                return chunk
+
             try:
-                post = schemas.Blog.model_validate(row)
-            except ValidationError:
-                logger.warning(
-                    "Entrada de blog omitida del sitemap por datos no válidos: id=%s idioma=%s",
-                    getattr(row, "id_noticia", None),
-                    getattr(row, "idioma", None),
-                )
-                continue
-
-            entries.append(
-                schemas.SitemapBlogEntry(
-                    id_noticia=post.id_noticia,
-                    idioma=post.idioma,
-                    slug=post.slug,
-                    lastmod=post.fecha_actualizacion or post.fecha_publicacion,
-                )
+                try:
+                    yield emit(SITEMAP_XML_HEADER)
+                    async for row in result.scalars():
+                        entry = self._to_sitemap_entry(row)
+                        if entry is None:
+                            continue
+                        if translations and translations[0].id_noticia != entry.id_noticia:
+                            yield emit(render_blog_url_group(site_url, translations))
+                            translations = []
+                        translations.append(entry)
+                    if translations:
+                        yield emit(render_blog_url_group(site_url, translations))
+                    yield emit(SITEMAP_XML_FOOTER)
+                finally:
+                    await result.close()
+            except BaseException:
+                # Envío cortado o fallo de MySQL: quien espera genera su propio documento.
+                if loading is not None:
+                    loading.cancel()
+                raise
+
+            compressed.append(compressor.flush())
+            document = b"".join(compressed)
+            self._cache.put(BLOG_XML_CACHE_KEY, document, version)
+            if loading is not None:
+                loading.set_result(document)
+
+        return generate()
+
+    @staticmethod
+    def _to_sitemap_entry(row: models.Blog) -> schemas.SitemapBlogEntry | None:
+        """Valida una fila con el contrato público o la omite si está dañada."""
+        if validated_on_write():
+            return schemas.SitemapBlogEntry.model_construct(
+                id_noticia=row.id_noticia,
+                idioma=row.idioma,
+                slug=row.slug,
+                lastmod=row.fecha_actualizacion or row.fecha_publicacion,
+            )
+        try:
+            post = schemas.Blog.model_validate(row)
+        except ValidationError:
+            logger.warning(
+                "Entrada de blog omitida del sitemap por datos no válidos: id=%s idioma=%s",
+                getattr(row, "id_noticia", None),
+                getattr(row, "idioma", None),
             )
+            return None
 
-        return entries
+        return schemas.SitemapBlogEntry(
+            id_noticia=post.id_noticia,
+            idioma=post.idioma,
+            slug=post.slug,
+            lastmod=post.fecha_actualizacion or post.fecha_publicacion,
+        )
@@ -0,0 +1,27 @@
+"""Caché de contenido propia para las pruebas que recorren routers y servicios."""
+
+import unittest
+from unittest.mock import patch
+
+from backend import main
+from backend.core.content_cache import ContentCache
+from backend.routers import batch, blog, charcuteria, sitemap
+from backend.services import blog_service, charcuteria_service, sitemap_service
+
+# Módulos que importan la instancia compartida ``content_cache``.
+_MODULES = (main, batch, blog, charcuteria, sitemap, blog_service, charcuteria_service, sitemap_service)
+
+
+def use_isolated_content_cache(test: unittest.TestCase) -> ContentCache:
+    """Sustituye la caché compartida durante la prueba para que no herede copias de otras."""
+    cache = ContentCache(
+        enabled=True,
+        version_key="tests:content-version",
+        poll_interval_seconds=5,
+        max_entries=16,
+    )
+    for module in _MODULES:
+        patcher = patch.object(module, "content_cache", cache)
+        patcher.start()
+        test.addCleanup(patcher.stop)
+    return cache
@@ -0,0 +1,109 @@
+"""Filas, sesiones de resultado y cachés compartidas por las pruebas de consultas."""
+
+from typing import Any, cast
+
+from redis.asyncio import Redis
+
+from backend.core.content_cache import ContentCache
+
+
+class ResultRow:
+    """Fila con acceso por atributo y por ``_mapping``, como ``sqlalchemy.Row``."""
+
+    def __init__(self, values: dict[str, Any]) -> None:
+        self._mapping = dict(values)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._mapping[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class CapturingRowSession:
+    """Guarda la última sentencia ejecutada y devuelve las filas indicadas con ``all()``."""
+
+    def __init__(self, rows: list[dict[str, Any]] | None = None) -> None:
+        self.rows = [ResultRow(values) for values in rows or []]
+        self.statement: Any | None = None
+
+    async def execute(self, statement):
+        self.statement = statement
+        rows = self.rows
+
+        class _Result:
+            @staticmethod
+            def all():
+                return rows
+
+        return _Result()
+
+
+class VersionRedis:
+    """Redis mínimo que solo devuelve la versión de contenido vigente."""
+
+    def __init__(self, version: bytes = b"1") -> None:
+        self.version = version
+
+    async def get(self, key: str) -> bytes:
+        return self.version
+
+
+class RowsResult:
+    """Resultado que devuelve las mismas filas con ``all()`` y con ``scalars().all()``."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+
+    def scalars(self) -> "RowsResult":
+        return self
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+    def scalar_one_or_none(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+
+class RecordingSession:
+    """Devuelve siempre ``rows``, que puede cambiarse entre consultas, y guarda cada sentencia."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+        self.statements: list[Any] = []
+
+    @property
+    def execute_calls(self) -> int:
+        return len(self.statements)
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return RowsResult(list(self.rows))
+
+
+class ScriptedSession:
+    """Devuelve los resultados en el orden de las consultas y guarda cada sentencia."""
+
+    def __init__(self, *results: list[Any]) -> None:
+        self._results = list(results)
+        self.statements: list[Any] = []
+
+    @property
+    def execute_calls(self) -> int:
+        return len(self.statements)
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return RowsResult(self._results.pop(0))
+
+
+def bound_content_cache(redis: object | None = None) -> ContentCache:
+    """Caché activa que relee la versión de ``redis``, por defecto un ``VersionRedis``."""
+    cache = ContentCache(
+        enabled=True,
+        version_key="tests:content-version",
+        poll_interval_seconds=0.000001,
+        max_entries=16,
+    )
+    cache.bind(cast(Redis, redis or VersionRedis()))
+    return cache
@@ -0,0 +1,146 @@
+"""Pruebas del endpoint de lecturas por lotes."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+from pydantic import ValidationError
+from sqlalchemy.exc import InterfaceError
+
+from backend.models import schemas
+from backend.routers import batch
+from backend.tests._content_cache import use_isolated_content_cache
+from backend.tests._rows import RowsResult
+
+
+def _blog_row(id_noticia: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_noticia=id_noticia,
+        idioma="es",
+        slug=f"articulo-{id_noticia}",
+        titulo="Título",
+        contenido="Contenido",
+        autor="Autor",
+        imagen_url="articulos/imagen.webp",
+        imagen_url_2=None,
+        fecha_publicacion=datetime(2026, 7, 15, 9, 0, 0),
+        fecha_actualizacion=None,
+    )
+
+
+def _product_row(id_producto: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_producto=id_producto,
+        idioma="es",
+        nombre="Jamón ibérico",
+        empresa=None,
+        descripcion="Descripción",
+        imagen_url="charcuteria/jamon.webp",
+        categoria="Jamones",
+        fecha=None,
+    )
+
+
+def _request(*operations: dict[str, Any]) -> schemas.BatchRequest:
+    return schemas.BatchRequest.model_validate({"operaciones": list(operations)})
+
+
+class BatchRequestValidationTests(unittest.TestCase):
+    def test_rechaza_claves_repetidas(self) -> None:
+        with self.assertRaises(ValidationError):
+            _request(
+                {"clave": "a", "recurso": "blog"},
+                {"clave": "a", "recurso": "charcuteria"},
+            )
+
+    def test_el_slug_solo_se_admite_en_blog_slug(self) -> None:
+        with self.assertRaises(ValidationError):
+            _request({"clave": "a", "recurso": "blog-slug"})
+        with self.assertRaises(ValidationError):
+            _request({"clave": "a", "recurso": "blog", "slug": "articulo-1"})
+
+    def test_limita_el_numero_de_operaciones(self) -> None:
+        with self.assertRaises(ValidationError):
+            _request(
+                *(
+                    {"clave": f"op{number}", "recurso": "blog"}
+                    for number in range(schemas.MAX_BATCH_OPERATIONS + 1)
+                )
+            )
+
+
+class BatchEndpointTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.cache = use_isolated_content_cache(self)
+
+    async def test_combina_los_cuerpos_de_cada_lectura(self) -> None:
+        db = AsyncMock()
+        db.execute.side_effect = [RowsResult([_blog_row(1)]), RowsResult([_product_row(7)])]
+
+        response = await batch.read_batch(
+            lote=_request(
+                {"clave": "posts", "recurso": "blog"},
+                {"clave": "productos", "recurso": "charcuteria"},
+                {"clave": "roto", "recurso": "blog-slug", "slug": "-no-valido"},
+            ),
+            token_verification=None,
+            db=db,
+        )
+
+        document = json.loads(response.body)["resultados"]
+        self.assertEqual(document["posts"]["estado"], 200)
+        self.assertEqual([post["id_noticia"] for post in document["posts"]["datos"]], [1])
+        self.assertEqual(document["productos"]["datos"][0]["id_producto"], 7)
+        self.assertEqual(document["roto"], {"estado": 422, "detalle": "Slug de blog no válido"})
+        self.assertEqual(db.execute.await_count, 2)
+
+    async def test_un_fallo_de_mysql_no_impide_las_demas_lecturas(self) -> None:
+        db = AsyncMock()
+        db.execute.side_effect = [
+            InterfaceError("SELECT 1", {}, Exception("conexión cerrada")),
+            RowsResult([_product_row(7)]),
+        ]
+
+        response = await batch.read_batch(
+            lote=_request(
+                {"clave": "posts", "recurso": "blog"},
+                {"clave": "productos", "recurso": "charcuteria"},
+            ),
+            token_verification=None,
+            db=db,
+        )
+
+        document = json.loads(response.body)["resultados"]
+        self.assertEqual(document["posts"]["estado"], 503)
+        self.assertEqual(document["productos"]["estado"], 200)
+        db.rollback.assert_awaited_once()
+        self.assertFalse(self.cache.source_available())
+
+    async def test_un_rollback_fallido_detiene_el_lote(self) -> None:
+        db = AsyncMock()
+        db.execute.side_effect = InterfaceError("SELECT 1", {}, Exception("conexión cerrada"))
+        db.rollback.side_effect = InterfaceError("ROLLBACK", {}, Exception("conexión cerrada"))
+
+        with self.assertLogs(batch.logger, level="ERROR"):
+            response = await batch.read_batch(
+                lote=_request(
+                    {"clave": "posts", "recurso": "blog"},
+                    {"clave": "productos", "recurso": "charcuteria"},
+                ),
+                token_verification=None,
+                db=db,
+            )
+
+        document = json.loads(response.body)["resultados"]
+        self.assertEqual(document["posts"]["estado"], 503)
+        self.assertEqual(document["productos"]["estado"], 503)
+        self.assertEqual(db.execute.await_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""Pruebas de la paginación keyset del listado del blog."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import base64
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.routers import blog
+from backend.services.blog_service import (
+    BlogPage,
+    BlogService,
+    InvalidBlogCursorError,
+    decode_blog_cursor,
+    encode_blog_cursor,
+)
+
+
+class _CapturingSession:
+    def __init__(self, rows: list[SimpleNamespace] | None = None) -> None:
+        self.rows = rows or []
+        self.statement: Any | None = None
+
+    async def execute(self, statement):
+        self.statement = statement
+        rows = self.rows
+
+        class _Result:
+            @staticmethod
+            def scalars():
+                class _Scalars:
+                    @staticmethod
+                    def all():
+                        return rows
+
+                return _Scalars()
+
+        return _Result()
+
+
+def _blog_row(id_noticia: int, **overrides) -> SimpleNamespace:
+    values = {
+        "id_noticia": id_noticia,
+        "idioma": "es",
+        "slug": f"articulo-{id_noticia}",
+        "titulo": "Título",
+        "contenido": "Contenido",
+        "autor": "Autor",
+        "imagen_url": "articulos/imagen.webp",
+        "imagen_url_2": None,
+        "fecha_publicacion": datetime(2026, 7, id_noticia, 9, 0, 0),
+        "fecha_actualizacion": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _compile(statement: Any) -> str:
+    return str(
+        statement.compile(
+            dialect=mysql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+class BlogCursorTests(unittest.TestCase):
+    def test_el_cursor_conserva_fecha_e_identificador(self) -> None:
+        cursor = encode_blog_cursor(datetime(2026, 7, 15, 9, 30), 42)
+
+        self.assertEqual(decode_blog_cursor(cursor), (datetime(2026, 7, 15, 9, 30), 42))
+
+    def test_rechaza_cursores_manipulados(self) -> None:
+        not_json = base64.urlsafe_b64encode(b"hola").decode().rstrip("=")
+        for cursor in ("", "no-es-base64", "cursor!", not_json, "a" * 201):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidBlogCursorError):
+                    decode_blog_cursor(cursor)
+
+    def test_rechaza_identificadores_no_positivos(self) -> None:
+        for id_noticia in (0, -1, True):
+            with self.subTest(id_noticia=id_noticia):
+                payload = json.dumps(["2026-07-15T00:00:00", id_noticia])
+                cursor = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+                with self.assertRaises(InvalidBlogCursorError):
+                    decode_blog_cursor(cursor)
+
+
+class BlogKeysetPaginationTests(unittest.IsolatedAsyncioTestCase):
+    async def test_la_primera_pagina_lee_una_fila_extra_sin_offset(self) -> None:
+        session = _CapturingSession()
+
+        await BlogService(cast(AsyncSession, session)).get_posts_page("es", 2)
+
+        sql = _compile(session.statement)
+        self.assertIn("LIMIT 3", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    async def test_las_paginas_siguientes_filtran_por_la_posicion_del_cursor(self) -> None:
+        session = _CapturingSession()
+        cursor = encode_blog_cursor(datetime(2026, 7, 15, 9, 0), 7)
+
+        await BlogService(cast(AsyncSession, session)).get_posts_page("es", 2, cursor)
+
+        sql = _compile(session.statement)
+        self.assertIn("blog.id_noticia < 7", sql)
+        self.assertIn("'2026-07-15 09:00:00'", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    async def test_el_cursor_avanza_aunque_la_ultima_fila_este_danada(self) -> None:
+        rows = [_blog_row(3), _blog_row(2, titulo="   "), _blog_row(1)]
+
+        with self.assertLogs("backend.services.blog_service", level="WARNING"):
+            page = await BlogService(
+                cast(AsyncSession, _CapturingSession(rows))
+            ).get_posts_page("es", 2)
+
+        self.assertEqual([post.id_noticia for post in page.posts], [3])
+        self.assertEqual(page.next_cursor, encode_blog_cursor(datetime(2026, 7, 2, 9, 0), 2))
+
+    async def test_la_ultima_pagina_no_devuelve_cursor(self) -> None:
+        page = await BlogService(
+            cast(AsyncSession, _CapturingSession([_blog_row(1)]))
+        ).get_posts_page("es", 2)
+
+        self.assertIsNone(page.next_cursor)
+
+
+class BlogPaginationEndpointTests(unittest.IsolatedAsyncioTestCase):
+    async def test_devuelve_el_cursor_siguiente_en_una_cabecera(self) -> None:
+        page = BlogPage(posts=(), next_cursor="siguiente")
+        with patch.object(blog.BlogService, "get_posts_page", new=AsyncMock(return_value=page)):
+            response = await blog.get_blog_posts(
+                idioma="es",
+                token_verification=None,
+                db=AsyncMock(),
+                limit=10,
+            )
+
+        self.assertEqual(response.headers[blog.NEXT_CURSOR_HEADER], "siguiente")
+        self.assertEqual(json.loads(response.body), [])
+
+    async def test_cursor_invalido_devuelve_422(self) -> None:
+        with self.assertRaises(HTTPException) as raised:
+            await blog.get_blog_posts(
+                idioma="es",
+                token_verification=None,
+                db=AsyncMock(),
+                limit=10,
+                cursor="no-es-un-cursor",
+            )
+
+        self.assertEqual(raised.exception.status_code, 422)
+
+    async def test_cursor_sin_limite_devuelve_422(self) -> None:
+        with self.assertRaises(HTTPException) as raised:
+            await blog.get_blog_posts(
+                idioma="es",
+                token_verification=None,
+                db=AsyncMock(),
+                cursor=encode_blog_cursor(datetime(2026, 7, 15), 1),
+            )
+
+        self.assertEqual(raised.exception.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
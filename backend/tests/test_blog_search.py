@@ -0,0 +1,124 @@
+"""Pruebas de la búsqueda de texto completo del blog con índice BM25 en memoria."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import patch
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import schemas
+from backend.services import blog_search
+from backend.services.blog_search import BlogSearchIndex, tokenize_search_text
+from backend.services.blog_service import BlogService
+from backend.tests._rows import RecordingSession, VersionRedis, bound_content_cache
+
+
+def _blog_row(id_noticia: int, titulo: str, contenido: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_noticia=id_noticia,
+        idioma="es",
+        slug=f"articulo-{id_noticia}",
+        titulo=titulo,
+        contenido=contenido,
+        autor="Autor",
+        imagen_url="articulos/imagen.webp",
+        imagen_url_2=None,
+        fecha_publicacion=datetime(2026, 7, id_noticia, 9, 0, 0),
+        fecha_actualizacion=None,
+    )
+
+
+ROWS = [
+    _blog_row(1, "Jamón ibérico de bellota", "La dehesa y el cerdo ibérico."),
+    _blog_row(2, "Quesos curados", "Un queso curado acompaña bien al jamón."),
+    _blog_row(3, "Vinos de Madrid", "Maridajes para una tarde en la taberna."),
+]
+
+
+def _posts() -> list[schemas.Blog]:
+    return [schemas.Blog.model_validate(row) for row in ROWS]
+
+
+class TokenizeSearchTextTests(unittest.TestCase):
+    def test_pliega_tildes_y_mayusculas_y_omite_palabras_vacias(self) -> None:
+        self.assertEqual(
+            tokenize_search_text("El Jamón de la DEHESA", "es"),
+            ["jamon", "dehesa"],
+        )
+
+    def test_las_palabras_vacias_dependen_del_idioma(self) -> None:
+        self.assertEqual(tokenize_search_text("über den Schinken", "de"), ["schinken"])
+        self.assertEqual(tokenize_search_text("über den Schinken", "es"), ["uber", "den", "schinken"])
+
+
+class BlogSearchIndexTests(unittest.TestCase):
+    def test_el_titulo_pesa_mas_que_el_contenido(self) -> None:
+        index = BlogSearchIndex.build("es", _posts())
+
+        hits = index.search("jamon", limit=10)
+
+        self.assertEqual([hit.post.id_noticia for hit in hits], [1, 2])
+        self.assertGreater(hits[0].score, hits[1].score)
+
+    def test_consulta_solo_con_palabras_vacias_no_devuelve_resultados(self) -> None:
+        index = BlogSearchIndex.build("es", _posts())
+
+        self.assertEqual(index.search("de la", limit=10), [])
+
+    def test_la_reconstruccion_solo_analiza_las_publicaciones_cambiadas(self) -> None:
+        previous = BlogSearchIndex.build("es", _posts())
+        changed = _posts()
+        changed[2] = changed[2].model_copy(update={"contenido": "Vermut y jamón en la taberna."})
+
+        with patch.object(blog_search, "analyze_post", wraps=blog_search.analyze_post) as analyze:
+            index = BlogSearchIndex.build("es", changed, previous)
+
+        self.assertEqual(analyze.call_count, 1)
+        self.assertIn(3, [hit.post.id_noticia for hit in index.search("jamon", limit=10)])
+
+    def test_una_colision_de_hash_no_conserva_terminos_antiguos(self) -> None:
+        changed = _posts()
+        changed[2] = changed[2].model_copy(update={"contenido": "Vermut y jamón en la taberna."})
+
+        # Con todas las huellas en colisión, solo la comparación completa detecta el cambio.
+        with patch("builtins.hash", return_value=0):
+            previous = BlogSearchIndex.build("es", _posts())
+            index = BlogSearchIndex.build("es", changed, previous)
+
+        self.assertIn(3, [hit.post.id_noticia for hit in index.search("vermut", limit=10)])
+
+
+class BlogSearchServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_las_busquedas_no_consultan_mysql_con_el_indice_construido(self) -> None:
+        session = RecordingSession(ROWS)
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        first = json.loads(await service.search_posts_json("es", "jamón", 10))
+        second = json.loads(await service.search_posts_json("es", "queso", 10))
+
+        self.assertEqual([result["id_noticia"] for result in first], [1, 2])
+        self.assertEqual([result["id_noticia"] for result in second], [2])
+        self.assertIn("puntuacion", first[0])
+        self.assertNotIn("contenido", first[0])
+        self.assertEqual(session.execute_calls, 1)
+
+    async def test_un_cambio_de_version_reconstruye_el_indice(self) -> None:
+        redis = VersionRedis()
+        session = RecordingSession(ROWS)
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache(redis))
+        await service.search_posts_json("es", "jamon", 10)
+
+        session.rows = [*ROWS, _blog_row(4, "Lomo embuchado", "Curación lenta.")]
+        redis.version = b"2"
+        results = json.loads(await service.search_posts_json("es", "lomo", 10))
+
+        self.assertEqual([result["id_noticia"] for result in results], [4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Pruebas del índice local de slugs del blog."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, cast
+
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import models
+from backend.services.blog_service import BlogService
+from backend.tests._rows import ScriptedSession, bound_content_cache
+
+
+def _blog_row(id_noticia: int, slug: str, **overrides) -> SimpleNamespace:
+    values = {
+        "id_noticia": id_noticia,
+        "idioma": "es",
+        "slug": slug,
+        "titulo": "Título",
+        "contenido": "Contenido",
+        "autor": "Autor",
+        "imagen_url": "articulos/imagen.webp",
+        "imagen_url_2": None,
+        "fecha_publicacion": datetime(2026, 7, 15, 9, 0, 0),
+        "fecha_actualizacion": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _compile(statement: Any) -> str:
+    return str(
+        statement.compile(
+            dialect=mysql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+class BlogSlugIndexTests(unittest.IsolatedAsyncioTestCase):
+    async def test_un_acierto_del_indice_lee_por_clave_primaria(self) -> None:
+        session = ScriptedSession(
+            [_blog_row(7, "jamon-iberico")],
+            [(7, "es", "jamon-iberico"), (8, "en", "iberian-ham")],
+            [_blog_row(7, "jamon-iberico")],
+        )
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        post = await service.get_post_by_slug("jamon-iberico", "es")
+
+        assert post is not None
+        self.assertEqual(post.id_noticia, 7)
+        index_sql, lookup_sql = (_compile(statement) for statement in session.statements[1:])
+        self.assertNotIn("blog.contenido", index_sql)
+        self.assertIn("blog.id_noticia = 7", lookup_sql)
+        self.assertNotIn("blog.slug =", lookup_sql)
+
+    async def test_el_indice_se_reutiliza_entre_peticiones(self) -> None:
+        session = ScriptedSession(
+            [_blog_row(7, "jamon-iberico")],
+            [(7, "es", "jamon-iberico")],
+            [_blog_row(7, "jamon-iberico")],
+            [_blog_row(7, "jamon-iberico")],
+        )
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        await service.get_post_by_slug("jamon-iberico", "es")
+        await service.get_post_by_slug("jamon-iberico", "es")
+
+        self.assertEqual(len(session.statements), 4)
+
+    async def test_una_fila_indexada_danada_usa_la_busqueda_completa(self) -> None:
+        session = ScriptedSession(
+            [_blog_row(3, "jamon-iberico")],
+            [(7, "es", "jamon-iberico")],
+            [_blog_row(7, "jamon-iberico", titulo="   ")],
+            [_blog_row(7, "jamon-iberico", titulo="   "), _blog_row(3, "jamon-iberico")],
+        )
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        with self.assertLogs("backend.services.blog_service", level="WARNING"):
+            post = await service.get_post_by_slug("jamon-iberico", "es")
+
+        assert post is not None
+        self.assertEqual(post.id_noticia, 3)
+        self.assertIn("blog.slug = 'jamon-iberico'", _compile(session.statements[-1]))
+
+    async def test_sin_cache_activa_conserva_la_busqueda_completa(self) -> None:
+        session = ScriptedSession([_blog_row(7, "jamon-iberico")])
+
+        post = await BlogService(cast(AsyncSession, session)).get_post_by_slug(
+            "jamon-iberico",
+            "es",
+        )
+
+        assert post is not None
+        self.assertEqual(len(session.statements), 1)
+
+    def test_el_modelo_declara_el_indice_de_la_migracion(self) -> None:
+        indexes = {
+            index.name: [column.name for column in index.columns]
+            for index in models.Blog.__table__.indexes
+        }
+
+        self.assertEqual(indexes.get("ix_blog_slug_idioma"), ["slug", "idioma"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Pruebas de la proyección de resúmenes del listado del blog."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import json
+import unittest
+from datetime import datetime
+from typing import Any, cast
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.routers import blog
+from backend.services.blog_service import (
+    BLOG_EXCERPT_LENGTH,
+    BlogPage,
+    BlogService,
+    build_blog_excerpt,
+    encode_blog_cursor,
+)
+from backend.tests._rows import CapturingRowSession
+
+
+def _summary_row(id_noticia: int, **overrides) -> dict[str, Any]:
+    values = {
+        "id_noticia": id_noticia,
+        "idioma": "es",
+        "slug": f"articulo-{id_noticia}",
+        "titulo": "Título",
+        "autor": "Autor",
+        "imagen_url": "articulos/imagen.webp",
+        "imagen_url_2": None,
+        "fecha_publicacion": datetime(2026, 7, id_noticia, 9, 0, 0),
+        "fecha_actualizacion": None,
+        "inicio_contenido": "Primer párrafo\n\ndel artículo.",
+    }
+    values.update(overrides)
+    return values
+
+
+def _compile(statement: Any) -> str:
+    return str(
+        statement.compile(
+            dialect=mysql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+class BlogExcerptTests(unittest.TestCase):
+    def test_compacta_espacios_y_saltos_de_linea(self) -> None:
+        self.assertEqual(build_blog_excerpt("Hola\n\n  mundo\t"), "Hola mundo")
+
+    def test_recorta_en_un_limite_de_palabra(self) -> None:
+        excerpt = build_blog_excerpt("palabra " * 60)
+
+        assert excerpt is not None
+        self.assertLessEqual(len(excerpt), BLOG_EXCERPT_LENGTH + 1)
+        self.assertTrue(excerpt.endswith("palabra…"))
+
+
+class BlogSummaryQueryTests(unittest.IsolatedAsyncioTestCase):
+    async def test_no_selecciona_el_contenido_completo(self) -> None:
+        session = CapturingRowSession()
+
+        await BlogService(cast(AsyncSession, session)).get_post_summaries("es")
+
+        sql = _compile(session.statement)
+        self.assertIn("substring(blog.contenido, 1, 400)", sql.lower())
+        self.assertEqual(sql.count("blog.contenido"), 1)
+        self.assertNotIn("LIMIT", sql)
+
+    async def test_pagina_con_el_mismo_cursor_que_el_listado(self) -> None:
+        session = CapturingRowSession([_summary_row(3), _summary_row(2), _summary_row(1)])
+        cursor = encode_blog_cursor(datetime(2026, 7, 15, 9, 0), 7)
+
+        page = await BlogService(cast(AsyncSession, session)).get_post_summaries(
+            "es",
+            2,
+            cursor,
+        )
+
+        sql = _compile(session.statement)
+        self.assertIn("LIMIT 3", sql)
+        self.assertIn("blog.id_noticia < 7", sql)
+        self.assertEqual([summary.id_noticia for summary in page.posts], [3, 2])
+        self.assertEqual(page.posts[0].extracto, "Primer párrafo del artículo.")
+        self.assertEqual(page.next_cursor, encode_blog_cursor(datetime(2026, 7, 2, 9, 0), 2))
+
+    async def test_omite_resumenes_con_datos_publicos_no_validos(self) -> None:
+        session = CapturingRowSession([_summary_row(2, titulo="   "), _summary_row(1)])
+
+        with self.assertLogs("backend.services.blog_service", level="WARNING"):
+            page = await BlogService(cast(AsyncSession, session)).get_post_summaries("es")
+
+        self.assertEqual([summary.id_noticia for summary in page.posts], [1])
+
+    async def test_sin_marca_solo_se_valida_el_comienzo_del_contenido(self) -> None:
+        # Divergencia documentada: el listado completo omitiría esta publicación.
+        damaged = "Texto. " * 60 + "\x00"
+        session = CapturingRowSession([_summary_row(1, inicio_contenido=damaged[:400])])
+
+        page = await BlogService(cast(AsyncSession, session)).get_post_summaries("es")
+
+        self.assertEqual([summary.id_noticia for summary in page.posts], [1])
+        self.assertNotIn("publicamente_valido", _compile(session.statement))
+
+    async def test_con_la_marca_excluye_las_mismas_filas_que_el_listado(self) -> None:
+        session = CapturingRowSession()
+
+        with patch.object(settings, "CONTENT_VALIDATED_ON_WRITE", True):
+            await BlogService(cast(AsyncSession, session)).get_post_summaries("es")
+
+        self.assertIn("blog.publicamente_valido IS true", _compile(session.statement))
+
+
+class BlogSummaryEndpointTests(unittest.IsolatedAsyncioTestCase):
+    async def test_la_ruta_de_resumenes_precede_a_la_ruta_por_slug(self) -> None:
+        paths = [route.path for route in blog.router.routes]
+
+        self.assertLess(paths.index("/blog/summaries"), paths.index("/blog/{slug}"))
+
+    async def test_devuelve_resumenes_y_cursor_siguiente(self) -> None:
+        page = BlogPage(posts=(), next_cursor="siguiente")
+        with patch.object(
+            blog.BlogService,
+            "get_post_summaries",
+            new=AsyncMock(return_value=page),
+        ):
+            response = await blog.get_blog_summaries(
+                idioma="es",
+                token_verification=None,
+                db=AsyncMock(),
+                limit=10,
+            )
+
+        self.assertEqual(response.headers[blog.NEXT_CURSOR_HEADER], "siguiente")
+        self.assertEqual(json.loads(response.body), [])
+
+    async def test_cursor_sin_limite_devuelve_422(self) -> None:
+        with self.assertRaises(HTTPException) as raised:
+            await blog.get_blog_summaries(
+                idioma="es",
+                token_verification=None,
+                db=AsyncMock(),
+                cursor=encode_blog_cursor(datetime(2026, 7, 15), 1),
+            )
+
+        self.assertEqual(raised.exception.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
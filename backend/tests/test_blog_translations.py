@@ -0,0 +1,124 @@
+"""Pruebas del mapa de traducciones del blog para los enlaces hreflang."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import Mock, patch
+
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.services.blog_service import BlogService
+from backend.services.sitemap_service import SitemapService
+from backend.tests._rows import RecordingSession, VersionRedis, bound_content_cache
+
+
+ROWS = [
+    (1, "de", "iberischer-schinken"),
+    (1, "en", "iberian-ham"),
+    (1, "es", "jamon-iberico"),
+    (2, "es", "quesos-curados"),
+    (3, "es", "-slug-danado"),
+]
+
+
+def _blog_row(id_noticia: int, idioma: str, slug: str, **overrides) -> SimpleNamespace:
+    values = {
+        "id_noticia": id_noticia,
+        "idioma": idioma,
+        "slug": slug,
+        "titulo": "Título",
+        "contenido": "Contenido",
+        "autor": "Autor",
+        "imagen_url": "articulos/imagen.webp",
+        "imagen_url_2": None,
+        "fecha_publicacion": datetime(2026, 7, 15, 9, 0, 0),
+        "fecha_actualizacion": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+FULL_ROWS = [
+    _blog_row(1, "en", "iberian-ham"),
+    _blog_row(1, "es", "jamon-iberico"),
+    _blog_row(2, "es", "quesos-curados", titulo="   "),
+]
+
+
+class BlogTranslationsTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        validated_on_write = patch.object(settings, "CONTENT_VALIDATED_ON_WRITE", True)
+        validated_on_write.start()
+        self.addCleanup(validated_on_write.stop)
+
+    async def test_agrupa_los_slugs_por_publicacion_e_idioma(self) -> None:
+        session = RecordingSession(ROWS)
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        translations = json.loads(await service.get_translations_json())
+
+        self.assertEqual(
+            translations,
+            {
+                "1": {"de": "iberischer-schinken", "en": "iberian-ham", "es": "jamon-iberico"},
+                "2": {"es": "quesos-curados"},
+            },
+        )
+
+    async def test_una_sola_consulta_de_tres_columnas_por_version(self) -> None:
+        redis = VersionRedis()
+        session = RecordingSession(ROWS)
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache(redis))
+
+        await service.get_translations_json()
+        await service.get_translations_json()
+        self.assertEqual(len(session.statements), 1)
+        sql = str(session.statements[0].compile(dialect=mysql.dialect()))
+        self.assertNotIn("contenido", sql)
+        self.assertNotIn("titulo", sql)
+
+        redis.version = b"2"
+        await service.get_translations_json()
+        self.assertEqual(len(session.statements), 2)
+
+    async def test_sirve_el_ultimo_mapa_si_mysql_no_responde(self) -> None:
+        cache = bound_content_cache()
+        service = BlogService(cast(AsyncSession, RecordingSession(ROWS)), cache=cache)
+        body = await service.get_translations_json()
+        cache.schedule_refresh = Mock()  # type: ignore[method-assign]
+
+        stale = BlogService(cast(AsyncSession, RecordingSession([])), cache=cache).stale_translations_json()
+
+        self.assertIsNotNone(stale)
+        self.assertEqual(stale.value, body)
+        cache.schedule_refresh.assert_called_once()
+
+
+class UnmarkedBlogTranslationsTests(unittest.IsolatedAsyncioTestCase):
+    async def test_omite_las_publicaciones_que_la_api_publica_rechaza(self) -> None:
+        session = RecordingSession(FULL_ROWS)
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        with self.assertLogs("backend.services.sitemap_service", level="WARNING"):
+            translations = json.loads(await service.get_translations_json())
+
+        self.assertEqual(translations, {"1": {"en": "iberian-ham", "es": "jamon-iberico"}})
+
+    async def test_reutiliza_las_entradas_del_sitemap_en_cache(self) -> None:
+        cache = bound_content_cache()
+        session = RecordingSession(FULL_ROWS[:2])
+        await SitemapService(cast(AsyncSession, session), cache=cache).get_blog_entries()
+
+        await BlogService(cast(AsyncSession, session), cache=cache).get_translations_json()
+
+        self.assertEqual(len(session.statements), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
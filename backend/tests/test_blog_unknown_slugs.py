@@ -0,0 +1,96 @@
+"""Pruebas del descarte de slugs desconocidos sin consultar la base de datos."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.blog_slug import blog_slug_lookup_key
+from backend.services.blog_service import BlogService
+from backend.tests._rows import ScriptedSession, VersionRedis, bound_content_cache
+
+
+def _blog_row(id_noticia: int, slug: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_noticia=id_noticia,
+        idioma="es",
+        slug=slug,
+        titulo="Título",
+        contenido="Contenido",
+        autor="Autor",
+        imagen_url="articulos/imagen.webp",
+        imagen_url_2=None,
+        fecha_publicacion=datetime(2026, 7, 15, 9, 0, 0),
+        fecha_actualizacion=None,
+    )
+
+
+class BlogSlugLookupKeyTests(unittest.TestCase):
+    def test_pliega_mayusculas_y_diacriticos(self) -> None:
+        self.assertEqual(blog_slug_lookup_key("Jamón-Ibérico"), "jamon-iberico")
+
+
+class UnknownBlogSlugTests(unittest.IsolatedAsyncioTestCase):
+    async def test_un_slug_desconocido_no_consulta_la_base_de_datos(self) -> None:
+        # Slugs publicados, índice de slugs y lectura por clave primaria.
+        session = ScriptedSession(
+            [_blog_row(7, "jamon-iberico")],
+            [(7, "es", "jamon-iberico")],
+            [_blog_row(7, "jamon-iberico")],
+        )
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        post = await service.get_post_by_slug("jamon-iberico", "es")
+        assert post is not None
+        self.assertEqual(post.id_noticia, 7)
+        self.assertEqual(session.execute_calls, 3)
+
+        for slug in ("wp-login", "xmlrpc", "jamon-iberico-2"):
+            self.assertIsNone(await service.get_post_by_slug(slug, "es"))
+
+        self.assertEqual(session.execute_calls, 3)
+
+    async def test_el_idioma_forma_parte_del_filtro(self) -> None:
+        session = ScriptedSession([_blog_row(7, "jamon-iberico")])
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        self.assertIsNone(await service.get_post_by_slug("jamon-iberico", "en"))
+        self.assertEqual(session.execute_calls, 1)
+
+    async def test_variantes_aceptadas_por_la_colacion_no_se_descartan(self) -> None:
+        session = ScriptedSession(
+            [_blog_row(7, "jamón-ibérico")],
+            [(7, "es", "jamón-ibérico")],
+            [_blog_row(7, "jamón-ibérico")],
+        )
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        post = await service.get_post_by_slug("Jamon-Iberico", "es")
+
+        assert post is not None
+        self.assertEqual(post.id_noticia, 7)
+
+    async def test_el_filtro_se_reconstruye_al_cambiar_la_version(self) -> None:
+        redis = VersionRedis()
+        session = ScriptedSession(
+            [],
+            [_blog_row(9, "paleta-iberica")],
+            [(9, "es", "paleta-iberica")],
+            [_blog_row(9, "paleta-iberica")],
+        )
+        service = BlogService(cast(AsyncSession, session), cache=bound_content_cache(redis))
+
+        self.assertIsNone(await service.get_post_by_slug("paleta-iberica", "es"))
+        redis.version = b"2"
+        post = await service.get_post_by_slug("paleta-iberica", "es")
+
+        assert post is not None
+        self.assertEqual(post.id_noticia, 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
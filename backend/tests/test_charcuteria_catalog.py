@@ -0,0 +1,104 @@
+"""Pruebas del catálogo de charcutería agrupado por categoría con facetas."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import json
+import unittest
+from types import SimpleNamespace
+from typing import Any, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import schemas
+from backend.services.charcuteria_service import (
+    CharcuteriaService,
+    build_charcuteria_catalog,
+)
+from backend.tests._rows import RecordingSession, bound_content_cache
+
+
+def _product(id_producto: int, categoria: str, nombre: str, empresa: str | None) -> Any:
+    return SimpleNamespace(
+        id_producto=id_producto,
+        idioma="es",
+        nombre=nombre,
+        empresa=empresa,
+        descripcion="Descripción",
+        imagen_url="charcuteria/producto.webp",
+        categoria=categoria,
+        fecha=None,
+    )
+
+
+PRODUCTS = [
+    _product(1, "Embutidos", "Chorizo", "Casa Pérez"),
+    _product(2, "Embutidos", "Salchichón", "Ibéricos Sur"),
+    _product(3, "Jamones", "Jamón de bellota", "Ibéricos Sur"),
+    _product(4, "Quesos", "Manchego", None),
+]
+
+
+class BuildCatalogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.products = [schemas.Charcuteria.model_validate(row) for row in PRODUCTS]
+
+    def test_agrupa_por_categoria_conservando_el_orden(self) -> None:
+        catalog = build_charcuteria_catalog("es", self.products)
+
+        self.assertEqual(catalog.total, 4)
+        self.assertEqual(
+            [(group.categoria, group.total) for group in catalog.categorias],
+            [("Embutidos", 2), ("Jamones", 1), ("Quesos", 1)],
+        )
+        self.assertEqual(
+            [product.nombre for product in catalog.categorias[0].productos],
+            ["Chorizo", "Salchichón"],
+        )
+
+    def test_cada_faceta_aplica_solo_el_filtro_de_la_otra(self) -> None:
+        catalog = build_charcuteria_catalog("es", self.products, empresa="Ibéricos Sur")
+
+        self.assertEqual(catalog.total, 2)
+        self.assertEqual(
+            [(facet.valor, facet.total) for facet in catalog.facetas_categoria],
+            [("Embutidos", 1), ("Jamones", 1)],
+        )
+        self.assertEqual(
+            [(facet.valor, facet.total) for facet in catalog.facetas_empresa],
+            [("Casa Pérez", 1), ("Ibéricos Sur", 2)],
+        )
+
+    def test_filtro_por_categoria_devuelve_solo_su_grupo(self) -> None:
+        catalog = build_charcuteria_catalog("es", self.products, categoria="Jamones")
+
+        self.assertEqual([group.categoria for group in catalog.categorias], ["Jamones"])
+        self.assertEqual(len(catalog.facetas_categoria), 3)
+
+
+class CatalogServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_los_filtros_reutilizan_el_listado_cacheado(self) -> None:
+        session = RecordingSession(PRODUCTS)
+        service = CharcuteriaService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        complete = json.loads(await service.get_catalog_json("es"))
+        sliced = json.loads(await service.get_catalog_json("es", categoria="Quesos"))
+
+        self.assertEqual(complete["total"], 4)
+        self.assertEqual(sliced["total"], 1)
+        self.assertEqual(session.execute_calls, 1)
+
+    async def test_filtros_desconocidos_no_ocupan_la_cache(self) -> None:
+        cache = bound_content_cache()
+        service = CharcuteriaService(cast(AsyncSession, RecordingSession(PRODUCTS)), cache=cache)
+
+        body = json.loads(await service.get_catalog_json("es", categoria="Inexistente"))
+
+        self.assertEqual((body["total"], body["categorias"]), (0, []))
+        self.assertNotIn(
+            ("charcuteria", "catalog-json", "es", "Inexistente", None),
+            cache._entries,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
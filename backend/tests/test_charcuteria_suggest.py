@@ -0,0 +1,93 @@
+"""Pruebas del autocompletado de productos de charcutería con árbol de prefijos."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import json
+import unittest
+from types import SimpleNamespace
+from typing import Any, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import schemas
+from backend.services.charcuteria_service import CharcuteriaService
+from backend.services.charcuteria_suggest import MAX_SUGGESTIONS, CharcuteriaSuggestIndex
+from backend.tests._rows import RecordingSession, VersionRedis, bound_content_cache
+
+
+def _product(id_producto: int, nombre: str, empresa: str | None = None) -> Any:
+    return SimpleNamespace(
+        id_producto=id_producto,
+        idioma="es",
+        nombre=nombre,
+        empresa=empresa,
+        descripcion="Descripción",
+        imagen_url="charcuteria/producto.webp",
+        categoria="Embutidos",
+        fecha=None,
+    )
+
+
+PRODUCTS = [
+    _product(1, "Chorizo ibérico de bellota", "Joselito"),
+    _product(2, "Jamón ibérico", "Cinco Jotas"),
+    _product(3, "Jamón serrano"),
+    _product(4, "Lomo embuchado", "Jamones Sierra"),
+]
+
+
+def _index(rows: list[Any] = PRODUCTS) -> CharcuteriaSuggestIndex:
+    return CharcuteriaSuggestIndex(schemas.Charcuteria.model_validate(row) for row in rows)
+
+
+class SuggestIndexTests(unittest.TestCase):
+    def test_ignora_tildes_y_mayusculas(self) -> None:
+        self.assertEqual(
+            [product.id_producto for product in _index().suggest("JAMÓN S")],
+            [3],
+        )
+
+    def test_ordena_inicio_de_nombre_palabra_interior_y_empresa(self) -> None:
+        self.assertEqual(
+            [product.id_producto for product in _index().suggest("jam")],
+            [2, 3, 4],
+        )
+        self.assertEqual(
+            [product.id_producto for product in _index().suggest("iber")],
+            [2, 1],
+        )
+
+    def test_sin_coincidencias_o_consulta_vacia_no_sugiere_nada(self) -> None:
+        self.assertEqual(_index().suggest("queso"), [])
+        self.assertEqual(_index().suggest("   "), [])
+
+    def test_cada_nodo_conserva_como_maximo_el_limite_de_sugerencias(self) -> None:
+        rows = [_product(number, f"Salchichón {number}") for number in range(1, 30)]
+
+        suggestions = _index(rows).suggest("salch", limit=50)
+
+        self.assertEqual(len(suggestions), MAX_SUGGESTIONS)
+
+
+class SuggestServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_las_consultas_reutilizan_el_arbol_hasta_cambiar_la_version(self) -> None:
+        redis = VersionRedis()
+        session = RecordingSession(PRODUCTS)
+        service = CharcuteriaService(cast(AsyncSession, session), cache=bound_content_cache(redis))
+
+        first = json.loads(await service.suggest_products_json("es", "lo", 5))
+        await service.suggest_products_json("es", "cho", 5)
+        self.assertEqual(session.execute_calls, 1)
+
+        session.rows = [*PRODUCTS, _product(5, "Longaniza")]
+        redis.version = b"2"
+        second = json.loads(await service.suggest_products_json("es", "lo", 5))
+
+        self.assertEqual([item["id_producto"] for item in first], [4])
+        self.assertEqual([item["id_producto"] for item in second], [5, 4])
+        self.assertEqual(session.execute_calls, 2)
+        self.assertNotIn("descripcion", second[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""Pruebas de la revalidación condicional de los endpoints de contenido."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.middleware.cache_control import ApiNoStoreMiddleware
+from backend.middleware.conditional_get import ConditionalGetMiddleware, ConditionalRoute
+
+
+class _Version:
+    def __init__(self, value: str | None) -> None:
+        self.value = value
+
+    async def __call__(self) -> str | None:
+        return self.value
+
+
+class _Clock:
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def _build_app(
+    version: _Version,
+    clock: _Clock | None = None,
+) -> tuple[FastAPI, dict[str, int]]:
+    calls = {"blog": 0, "sitemap": 0}
+    app = FastAPI()
+    app.add_middleware(
+        ConditionalGetMiddleware,
+        routes=(
+            ConditionalRoute("/api/blog"),
+            ConditionalRoute("/api/sitemap/blog", answer_before_route=False),
+        ),
+        version_provider=version,
+        max_age_seconds=600,
+        clock=clock or _Clock(1_200_000.0),
+    )
+    app.add_middleware(ApiNoStoreMiddleware)
+
+    @app.get("/api/blog")
+    async def blog_posts() -> list[int]:
+        calls["blog"] += 1
+        return [1, 2]
+
+    @app.get("/api/sitemap/blog")
+    async def sitemap_entries() -> list[int]:
+        calls["sitemap"] += 1
+        return [1]
+
+    @app.get("/api/get-token")
+    async def token() -> dict[str, str]:
+        return {"token": "valor"}
+
+    return app, calls
+
+
+class ConditionalGetTests(unittest.TestCase):
+    def test_emite_etag_y_permite_revalidar_sin_compartir_cache(self) -> None:
+        app, _ = _build_app(_Version("3"))
+
+        response = TestClient(app).get("/api/blog", params={"idioma": "es"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["etag"].startswith('"'))
+        self.assertEqual(response.headers["cache-control"], "private, no-cache")
+
+    def test_revalidacion_coincidente_devuelve_304_sin_ejecutar_la_ruta(self) -> None:
+        app, calls = _build_app(_Version("3"))
+        client = TestClient(app)
+        etag = client.get("/api/blog", params={"idioma": "es"}).headers["etag"]
+
+        response = client.get(
+            "/api/blog",
+            params={"idioma": "es"},
+            headers={"If-None-Match": f"W/{etag}"},
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(calls["blog"], 1)
+
+    def test_la_etag_cambia_con_la_version_y_con_la_query(self) -> None:
+        version = _Version("3")
+        app, _ = _build_app(version)
+        client = TestClient(app)
+        etag_es = client.get("/api/blog", params={"idioma": "es"}).headers["etag"]
+        etag_en = client.get("/api/blog", params={"idioma": "en"}).headers["etag"]
+
+        version.value = "4"
+        response = client.get(
+            "/api/blog",
+            params={"idioma": "es"},
+            headers={"If-None-Match": etag_es},
+        )
+
+        self.assertNotEqual(etag_es, etag_en)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag_es)
+
+    def test_la_etag_caduca_con_la_edad_maxima_de_la_cache(self) -> None:
+        clock = _Clock(1_200_000.0)
+        app, calls = _build_app(_Version("3"), clock)
+        client = TestClient(app)
+        etag = client.get("/api/blog").headers["etag"]
+
+        clock.value += 600
+        response = client.get("/api/blog", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], etag)
+        self.assertEqual(calls["blog"], 2)
+
+    def test_el_sitemap_ejecuta_la_ruta_antes_de_responder_304(self) -> None:
+        app, calls = _build_app(_Version("3"))
+        client = TestClient(app)
+        etag = client.get("/api/sitemap/blog").headers["etag"]
+
+        response = client.get("/api/sitemap/blog", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(calls["sitemap"], 2)
+
+    def test_sin_version_conocida_mantiene_no_store(self) -> None:
+        app, _ = _build_app(_Version(None))
+
+        response = TestClient(app).get("/api/blog")
+
+        self.assertNotIn("etag", response.headers)
+        self.assertEqual(response.headers["cache-control"], "no-store, max-age=0")
+
+    def test_rutas_no_configuradas_no_reciben_etag(self) -> None:
+        app, _ = _build_app(_Version("3"))
+
+        response = TestClient(app).get("/api/get-token")
+
+        self.assertNotIn("etag", response.headers)
+        self.assertEqual(response.headers["cache-control"], "no-store, max-age=0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,272 @@
+"""Pruebas de la caché de contenido local invalidada mediante la versión en Redis."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import asyncio
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import AsyncMock
+
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.content_cache import ContentCache
+from backend.services.blog_service import BlogService
+from backend.tests._rows import RowsResult
+
+
+class MutableClock:
+    """Reloj controlable para comprobar el intervalo de sondeo sin esperas reales."""
+
+    def __init__(self) -> None:
+        self.value = 1000.0
+
+    def __call__(self) -> float:
+        return self.value
+
+    def advance(self, seconds: float) -> None:
+        self.value += seconds
+
+
+class FakeVersionRedis:
+    """Implementa únicamente las operaciones de versión que utiliza la caché."""
+
+    def __init__(self) -> None:
+        self.version: bytes | None = None
+        self.get_calls = 0
+        self.fail = False
+
+    async def get(self, key: str) -> bytes | None:
+        self.get_calls += 1
+        if self.fail:
+            raise RedisConnectionError("Redis no disponible")
+        return self.version
+
+    async def incr(self, key: str) -> int:
+        value = int(self.version or b"0") + 1
+        self.version = str(value).encode("ascii")
+        return value
+
+
+def _blog_row(id_noticia: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_noticia=id_noticia,
+        idioma="es",
+        slug=f"articulo-{id_noticia}",
+        titulo="Título",
+        contenido="Contenido",
+        autor="Autor",
+        imagen_url="articulos/imagen.webp",
+        imagen_url_2=None,
+        fecha_publicacion=datetime(2026, 7, 15, 9, 0, 0),
+        fecha_actualizacion=None,
+    )
+
+
+def _build_cache(redis: FakeVersionRedis, clock: MutableClock) -> ContentCache:
+    cache = ContentCache(
+        enabled=True,
+        version_key="tests:content-version",
+        poll_interval_seconds=5,
+        max_entries=2,
+        clock=clock,
+    )
+    cache.bind(cast(Redis, redis))
+    return cache
+
+
+class ContentCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_reutiliza_el_resultado_mientras_la_version_no_cambia(self) -> None:
+        redis = FakeVersionRedis()
+        cache = _build_cache(redis, MutableClock())
+        loader = AsyncMock(return_value="listado")
+
+        self.assertEqual(await cache.get_or_load("clave", loader), "listado")
+        self.assertEqual(await cache.get_or_load("clave", loader), "listado")
+
+        loader.assert_awaited_once()
+        self.assertEqual(redis.get_calls, 1)
+
+    async def test_una_version_nueva_invalida_tras_el_intervalo_de_sondeo(self) -> None:
+        redis = FakeVersionRedis()
+        clock = MutableClock()
+        cache = _build_cache(redis, clock)
+        loader = AsyncMock(side_effect=["antes", "despues"])
+
+        await cache.get_or_load("clave", loader)
+        await redis.incr("tests:content-version")
+        self.assertEqual(await cache.get_or_load("clave", loader), "antes")
+
+        clock.advance(5)
+        self.assertEqual(await cache.get_or_load("clave", loader), "despues")
+
+    async def test_sin_redis_consulta_siempre_el_origen(self) -> None:
+        redis = FakeVersionRedis()
+        redis.fail = True
+        cache = _build_cache(redis, MutableClock())
+        loader = AsyncMock(return_value="listado")
+
+        await cache.get_or_load("clave", loader)
+        await cache.get_or_load("clave", loader)
+
+        self.assertEqual(loader.await_count, 2)
+
+    async def test_descarta_las_entradas_menos_recientes_al_superar_el_maximo(self) -> None:
+        cache = _build_cache(FakeVersionRedis(), MutableClock())
+        loader = AsyncMock(side_effect=["a", "b", "c", "a2"])
+
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("b", loader)
+        await cache.get_or_load("c", loader)
+
+        self.assertEqual(await cache.get_or_load("a", loader), "a2")
+
+    async def test_una_entrada_caduca_aunque_no_cambie_la_version(self) -> None:
+        clock = MutableClock()
+        cache = ContentCache(
+            enabled=True,
+            version_key="tests:content-version",
+            poll_interval_seconds=5,
+            max_entries=2,
+            max_age_seconds=60,
+            clock=clock,
+        )
+        cache.bind(cast(Redis, FakeVersionRedis()))
+        loader = AsyncMock(side_effect=["antes", "despues"])
+
+        await cache.get_or_load("clave", loader)
+        clock.advance(59)
+        self.assertEqual(await cache.get_or_load("clave", loader), "antes")
+
+        clock.advance(1)
+        self.assertEqual(await cache.get_or_load("clave", loader), "despues")
+        self.assertEqual(await cache.peek("clave"), "despues")
+
+    async def test_las_paginas_no_desplazan_las_entradas_principales(self) -> None:
+        cache = _build_cache(FakeVersionRedis(), MutableClock())
+        loader = AsyncMock(return_value="valor")
+
+        await cache.get_or_load("primera-pagina", loader)
+        for position in range(100):
+            await cache.get_or_load(("pagina", position), loader, paged=True)
+        await cache.get_or_load("primera-pagina", loader)
+
+        self.assertEqual(loader.await_count, 101)
+        self.assertEqual(len(cache._pages), 64)
+
+    async def test_listado_del_blog_no_abre_la_sesion_en_un_acierto(self) -> None:
+        cache = _build_cache(FakeVersionRedis(), MutableClock())
+        db = AsyncMock()
+        db.execute.return_value = RowsResult([_blog_row(1)])
+        service = BlogService(cast(AsyncSession, db), cache=cache)
+
+        first = await service.get_all_posts("es")
+        second = await service.get_all_posts("es")
+
+        self.assertEqual([post.id_noticia for post in first], [1])
+        self.assertEqual(first, second)
+        db.execute.assert_awaited_once()
+
+    async def test_incrementar_la_version_invalida_la_cache_local(self) -> None:
+        redis = FakeVersionRedis()
+        cache = _build_cache(redis, MutableClock())
+        loader = AsyncMock(side_effect=["antes", "despues"])
+
+        await cache.get_or_load("clave", loader)
+        self.assertEqual(await cache.bump_version(), 1)
+
+        self.assertEqual(await cache.get_or_load("clave", loader), "despues")
+
+
+class ContentCacheSingleFlightTests(unittest.IsolatedAsyncioTestCase):
+    async def test_cargas_concurrentes_identicas_comparten_una_consulta(self) -> None:
+        cache = _build_cache(FakeVersionRedis(), MutableClock())
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "listado"
+
+        waiting = [asyncio.create_task(cache.get_or_load("clave", loader)) for _ in range(20)]
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*waiting), ["listado"] * 20)
+        self.assertEqual(calls, 1)
+
+    async def test_agrupa_tambien_con_la_cache_desactivada(self) -> None:
+        redis = FakeVersionRedis()
+        redis.fail = True
+        cache = _build_cache(redis, MutableClock())
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "listado"
+
+        waiting = [asyncio.create_task(cache.get_or_load("clave", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*waiting)
+
+        self.assertEqual(calls, 1)
+
+    async def test_los_seguidores_reciben_el_error_de_la_consulta(self) -> None:
+        cache = _build_cache(FakeVersionRedis(), MutableClock())
+        release = asyncio.Event()
+
+        async def loader() -> str:
+            await release.wait()
+            raise RuntimeError("MySQL no disponible")
+
+        waiting = [asyncio.create_task(cache.get_or_load("clave", loader)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiting, return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    async def test_si_se_cancela_quien_carga_un_seguidor_repite_la_consulta(self) -> None:
+        cache = _build_cache(FakeVersionRedis(), MutableClock())
+        started = asyncio.Event()
+        calls = 0
+
+        async def loader() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                started.set()
+                await asyncio.Event().wait()
+            return "listado"
+
+        leader = asyncio.create_task(cache.get_or_load("clave", loader))
+        await started.wait()
+        follower = asyncio.create_task(cache.get_or_load("clave", loader))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        self.assertEqual(await follower, "listado")
+        self.assertEqual(calls, 2)
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+
+    async def test_la_espera_a_una_carga_anunciada_tiene_limite(self) -> None:
+        cache = _build_cache(FakeVersionRedis(), MutableClock())
+        loading = cache.begin_load("clave", await cache.current_version())
+
+        self.assertIsNotNone(loading)
+        self.assertIsNone(cache.begin_load("clave", await cache.current_version()))
+        self.assertIsNone(await cache.wait_for_load("clave", timeout_seconds=0.01))
+
+
+if __name__ == "__main__":
+    unittest.main()
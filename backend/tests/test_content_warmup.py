@@ -0,0 +1,120 @@
+"""Pruebas de la precarga opcional de la caché de contenido en el arranque."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock, patch
+
+from fastapi import FastAPI
+from sqlalchemy.exc import InterfaceError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend import main
+from backend.services.content_warmup import WARMUP_LANGUAGES, warm_up_content_cache
+from backend.tests._content_cache import use_isolated_content_cache
+
+
+class _EmptyResult:
+    def scalars(self) -> "_EmptyResult":
+        return self
+
+    def all(self) -> list[Any]:
+        return []
+
+
+class _RecordingSession:
+    """Sesión que registra su uso concurrente y no devuelve filas."""
+
+    active = 0
+    max_active = 0
+    statements: list[Any] = []
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+
+    async def __aenter__(self) -> "_RecordingSession":
+        type(self).active += 1
+        type(self).max_active = max(type(self).max_active, type(self).active)
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> bool:
+        type(self).active -= 1
+        return False
+
+    async def execute(self, statement):
+        await asyncio.sleep(0)
+        type(self).statements.append(statement)
+        if self.fail:
+            raise InterfaceError("SELECT 1", {}, Exception("conexión cerrada"))
+        return _EmptyResult()
+
+
+class ContentWarmupTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        use_isolated_content_cache(self)
+        _RecordingSession.active = 0
+        _RecordingSession.max_active = 0
+        _RecordingSession.statements = []
+
+    async def test_precarga_listados_de_cada_idioma_y_el_sitemap(self) -> None:
+        result = await warm_up_content_cache(
+            session_factory=lambda: cast(AsyncSession, _RecordingSession()),
+            max_concurrency=2,
+        )
+
+        expected_reads = 1 + 2 * len(WARMUP_LANGUAGES)
+        self.assertEqual((result.loaded, result.failed), (expected_reads, 0))
+        self.assertEqual(len(_RecordingSession.statements), expected_reads)
+        self.assertLessEqual(_RecordingSession.max_active, 2)
+
+    async def test_los_fallos_se_cuentan_sin_interrumpir_el_resto(self) -> None:
+        with self.assertLogs("backend.services.content_warmup", level="WARNING"):
+            result = await warm_up_content_cache(
+                session_factory=lambda: cast(AsyncSession, _RecordingSession(fail=True)),
+                languages=("es",),
+            )
+
+        self.assertEqual((result.loaded, result.failed), (0, 3))
+
+
+class LifespanWarmupTests(unittest.IsolatedAsyncioTestCase):
+    @staticmethod
+    def _app(database_available: bool) -> FastAPI:
+        app = FastAPI()
+        app.state.database_available = database_available
+        return app
+
+    async def test_se_omite_si_la_base_de_datos_no_esta_disponible(self) -> None:
+        with patch.object(main, "warm_up_content_cache", new=AsyncMock()) as warm_up:
+            await main.warm_up_content(self._app(database_available=False))
+
+        warm_up.assert_not_awaited()
+
+    async def test_se_omite_si_la_cache_no_esta_activa(self) -> None:
+        with (
+            patch.object(main.content_cache, "current_version", new=AsyncMock(return_value=None)),
+            patch.object(main, "warm_up_content_cache", new=AsyncMock()) as warm_up,
+        ):
+            await main.warm_up_content(self._app(database_available=True))
+
+        warm_up.assert_not_awaited()
+
+    async def test_no_bloquea_el_arranque_mas_alla_del_timeout(self) -> None:
+        async def hanging_warm_up(**kwargs) -> SimpleNamespace:
+            await asyncio.sleep(1)
+            return SimpleNamespace(loaded=0, failed=0)
+
+        with (
+            patch.object(main.settings, "DATABASE_STARTUP_TIMEOUT_SECONDS", 0.01),
+            patch.object(main.content_cache, "current_version", new=AsyncMock(return_value="1")),
+            patch.object(main, "warm_up_content_cache", new=hanging_warm_up),
+            self.assertLogs("backend.main", level="WARNING"),
+        ):
+            await main.warm_up_content(self._app(database_available=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,9 +10,13 @@ from sqlalchemy.exc import InterfaceError, TimeoutError as SQLAlchemyTimeoutErro
 
 from backend.middleware.rate_limit import RateLimitMiddleware, RateLimitRule
 from backend.routers import blog, charcuteria
+from backend.tests._content_cache import use_isolated_content_cache
 
 
 class DatabaseAvailabilityRegressionTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        use_isolated_content_cache(self)
+
     async def test_blog_devuelve_503_ante_un_error_dbapi_distinto_de_operational_error(self) -> None:
         database_error = InterfaceError("SELECT 1", {}, Exception("conexión cerrada"))
         with patch.object(blog.BlogService, "get_all_posts", new=AsyncMock(side_effect=database_error)):
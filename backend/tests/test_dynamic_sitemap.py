@@ -15,6 +15,7 @@ from backend.dependencies import get_db
 from backend.routers import sitemap
 from backend.routers.sitemap import get_sitemap_blog_entries
 from backend.services.sitemap_service import SitemapService
+from backend.tests._content_cache import use_isolated_content_cache
 
 
 class _ScalarResult:
@@ -46,6 +47,9 @@ def _blog_row(**overrides) -> SimpleNamespace:
 
 
 class SitemapServiceTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        use_isolated_content_cache(self)
+
     async def test_devuelve_solo_los_campos_publicos_necesarios(self) -> None:
         db = AsyncMock()
         db.execute.return_value = _ScalarResult([_blog_row()])
@@ -0,0 +1,140 @@
+"""Pruebas de la selección de campos ``fields=`` en los listados de blog y charcutería."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import json
+import unittest
+from datetime import datetime
+from typing import Any, cast
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import schemas
+from backend.routers import charcuteria
+from backend.services.blog_service import BlogService
+from backend.services.charcuteria_service import CharcuteriaService
+from backend.services.field_projection import (
+    InvalidFieldSelectionError,
+    build_projection,
+    parse_field_selection,
+    projection_model,
+)
+from backend.tests._rows import CapturingRowSession
+
+
+def _compile(statement: Any) -> str:
+    return str(
+        statement.compile(
+            dialect=mysql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+def _post_row(id_noticia: int, **overrides) -> dict[str, Any]:
+    values = {
+        "id_noticia": id_noticia,
+        "slug": f"articulo-{id_noticia}",
+        "titulo": "Título",
+        "imagen_url": "articulos/imagen.webp",
+        "fecha_publicacion": datetime(2026, 7, id_noticia, 9, 0, 0),
+        "fecha_actualizacion": None,
+    }
+    values.update(overrides)
+    return values
+
+
+class FieldSelectionTests(unittest.TestCase):
+    def test_devuelve_los_campos_en_el_orden_del_esquema_sin_duplicados(self) -> None:
+        self.assertEqual(
+            parse_field_selection("titulo, slug,titulo", schemas.Blog),
+            ("slug", "titulo"),
+        )
+
+    def test_rechaza_campos_desconocidos_o_vacios(self) -> None:
+        with self.assertRaisesRegex(InvalidFieldSelectionError, "publicamente_valido"):
+            parse_field_selection("slug,publicamente_valido", schemas.Blog)
+        with self.assertRaises(InvalidFieldSelectionError):
+            parse_field_selection("slug,,titulo", schemas.Blog)
+
+
+class ProjectionModelTests(unittest.TestCase):
+    def test_reutiliza_el_modelo_de_cada_combinacion(self) -> None:
+        first = projection_model(schemas.Blog, ("slug", "titulo"))
+
+        self.assertIs(projection_model(schemas.Blog, ("slug", "titulo")), first)
+        self.assertEqual(list(first.model_fields), ["slug", "titulo"])
+
+    def test_aplica_los_validadores_publicos_a_los_campos_incluidos(self) -> None:
+        blog_model = projection_model(schemas.Blog, ("slug", "imagen_url"))
+        product_model = projection_model(schemas.Charcuteria, ("nombre", "empresa"))
+
+        with self.assertRaises(ValidationError):
+            blog_model.model_validate({"slug": "articulo", "imagen_url": "../secreto.webp"})
+        product = product_model.model_validate({"nombre": "Chorizo", "empresa": "   "})
+        self.assertIsNone(product.empresa)
+
+    def test_omite_filas_danadas(self) -> None:
+        model = projection_model(schemas.Blog, ("slug", "titulo"))
+
+        with self.assertLogs("backend.services.field_projection", level="WARNING"):
+            self.assertIsNone(build_projection(model, {"slug": "articulo", "titulo": ""}))
+
+
+class ProjectedListingTests(unittest.IsolatedAsyncioTestCase):
+    async def test_el_blog_solo_lee_y_devuelve_los_campos_seleccionados(self) -> None:
+        session = CapturingRowSession([_post_row(2), _post_row(1, titulo="")])
+
+        body, next_cursor = await BlogService(
+            cast(AsyncSession, session)
+        ).get_projected_posts_json("es", ("slug", "titulo"))
+
+        sql = _compile(session.statement)
+        self.assertNotIn("contenido", sql)
+        self.assertNotIn("autor", sql)
+        self.assertEqual(json.loads(body), [{"slug": "articulo-2", "titulo": "Título"}])
+        self.assertIsNone(next_cursor)
+
+    async def test_la_pagina_proyectada_lee_las_columnas_del_cursor(self) -> None:
+        session = CapturingRowSession([_post_row(3), _post_row(2), _post_row(1)])
+
+        body, next_cursor = await BlogService(
+            cast(AsyncSession, session)
+        ).get_projected_posts_json("es", ("slug",), limit=2)
+
+        sql = _compile(session.statement)
+        self.assertIn("fecha_publicacion", sql)
+        self.assertNotIn("contenido", sql)
+        self.assertEqual(json.loads(body), [{"slug": "articulo-3"}, {"slug": "articulo-2"}])
+        self.assertIsNotNone(next_cursor)
+
+    async def test_charcuteria_solo_lee_los_campos_seleccionados(self) -> None:
+        session = CapturingRowSession([{"nombre": "Chorizo", "imagen_url": "charcuteria/a.webp"}])
+
+        body = await CharcuteriaService(
+            cast(AsyncSession, session)
+        ).get_projected_products_json("es", ("nombre", "imagen_url"))
+
+        self.assertNotIn("descripcion", _compile(session.statement))
+        self.assertEqual(
+            json.loads(body),
+            [{"nombre": "Chorizo", "imagen_url": "charcuteria/a.webp"}],
+        )
+
+    async def test_el_endpoint_rechaza_campos_desconocidos(self) -> None:
+        with self.assertRaises(HTTPException) as context:
+            await charcuteria.get_charcuteria_products(
+                idioma="es",
+                fields="nombre,precio",
+                token_verification=None,
+                db=cast(AsyncSession, CapturingRowSession()),
+            )
+
+        self.assertEqual(context.exception.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
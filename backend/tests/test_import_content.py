@@ -0,0 +1,146 @@
+"""Pruebas de la importación masiva de contenido con upserts por lotes."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy.dialects import mysql
+
+from backend.tools.import_content import (
+    IMPORT_TARGETS,
+    ImportRowError,
+    batched,
+    build_upsert,
+    check_content,
+    read_records,
+    validate_records,
+)
+
+
+def _blog_record(id_noticia: int, **changes) -> dict:
+    record = {
+        "id_noticia": id_noticia,
+        "idioma": "es",
+        "slug": f"articulo-{id_noticia}",
+        "titulo": "Jamón ibérico",
+        "contenido": "La dehesa y el cerdo ibérico.",
+        "autor": "Autor",
+        "imagen_url": "articulos/imagen.webp",
+    }
+    record.update(changes)
+    return record
+
+
+class ImportContentTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def _write(self, name: str, content: str) -> Path:
+        path = Path(self._directory.name) / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_jsonl_ignora_lineas_vacias_y_conserva_el_numero_de_linea(self) -> None:
+        path = self._write(
+            "blog.jsonl",
+            json.dumps(_blog_record(1)) + "\n\n" + json.dumps(_blog_record(2)) + "\n",
+        )
+
+        self.assertEqual(
+            [(line, record["id_noticia"]) for line, record in read_records(path, "jsonl")],
+            [(1, 1), (3, 2)],
+        )
+
+    def test_csv_convierte_celdas_vacias_en_ausencia_de_valor(self) -> None:
+        path = self._write(
+            "charcuteria.csv",
+            "id_producto,idioma,nombre,empresa,descripcion,imagen_url,categoria\n"
+            "7,es,Lomo embuchado,,Curación lenta,charcuteria/lomo.webp,Embutidos\n",
+        )
+
+        rows = list(validate_records(read_records(path, "csv"), IMPORT_TARGETS["charcuteria"]))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["id_producto"], 7)
+        self.assertIsNone(rows[0]["empresa"])
+
+    def test_una_fila_no_valida_indica_su_linea(self) -> None:
+        path = self._write(
+            "blog.jsonl",
+            json.dumps(_blog_record(1)) + "\n" + json.dumps(_blog_record(2, idioma="xx")) + "\n",
+        )
+
+        with self.assertRaises(ImportRowError) as raised:
+            list(validate_records(read_records(path, "jsonl"), IMPORT_TARGETS["blog"]))
+
+        self.assertEqual(raised.exception.line, 2)
+        self.assertIn("idioma", str(raised.exception))
+
+    def test_las_columnas_desconocidas_no_se_aceptan(self) -> None:
+        path = self._write("blog.jsonl", json.dumps(_blog_record(1, visitas=3)) + "\n")
+
+        with self.assertRaises(ImportRowError):
+            list(validate_records(read_records(path, "jsonl"), IMPORT_TARGETS["blog"]))
+
+    def test_la_validacion_previa_informa_de_todas_las_filas(self) -> None:
+        invalid_id = _blog_record(3)
+        invalid_id["id_noticia"] = 0
+        path = self._write(
+            "blog.jsonl",
+            "\n".join(
+                json.dumps(record)
+                for record in (
+                    _blog_record(1, titulo=""),
+                    _blog_record(2),
+                    invalid_id,
+                )
+            ),
+        )
+
+        errors = check_content("blog", path, "jsonl")
+
+        self.assertEqual([error.line for error in errors], [1, 3])
+
+    def test_agrupa_por_lotes_sin_perder_el_resto(self) -> None:
+        batches = list(batched(({"n": number} for number in range(5)), 2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+
+
+class BuildUpsertTests(unittest.TestCase):
+    def _compile(self, target_name: str, rows: list[dict]) -> str:
+        statement = build_upsert(IMPORT_TARGETS[target_name], rows, datetime(2026, 7, 1, 9, 0))
+        return str(statement.compile(dialect=mysql.dialect()))
+
+    def test_un_lote_es_una_sola_sentencia_de_varias_filas(self) -> None:
+        rows = list(
+            validate_records(
+                [(1, _blog_record(1)), (2, _blog_record(2))],
+                IMPORT_TARGETS["blog"],
+            )
+        )
+
+        sql = self._compile("blog", rows)
+        values, update = sql.split(" VALUES ", 1)[1].split(" ON DUPLICATE KEY UPDATE ", 1)
+
+        self.assertEqual(sql.count("INSERT INTO"), 1)
+        # Una tupla de parámetros por fila en la misma sentencia.
+        self.assertEqual(values.count("("), 2)
+        self.assertTrue(update.startswith("fecha_actualizacion = CASE WHEN"))
+
+    def test_la_fecha_de_actualizacion_se_calcula_antes_que_el_contenido(self) -> None:
+        rows = list(validate_records([(1, _blog_record(1))], IMPORT_TARGETS["blog"]))
+
+        update = self._compile("blog", rows).split("ON DUPLICATE KEY UPDATE", 1)[1]
+
+        self.assertLess(update.index("fecha_actualizacion ="), update.index("titulo ="))
+        self.assertNotIn("fecha_publicacion =", update)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""Pruebas de la validación en escritura con la marca ``publicamente_valido``."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import patch
+
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.config import settings
+from backend.core.content_cache import ContentCache
+from backend.models import models, schemas
+from backend.services.blog_service import BlogService
+from backend.services.public_content import (
+    PUBLIC_TABLES,
+    construct_public,
+    only_public_rows,
+    review_public_row,
+)
+from backend.tests._rows import RecordingSession
+
+
+def _product(**changes) -> dict[str, Any]:
+    values = {
+        "id_producto": 1,
+        "idioma": "es",
+        "nombre": "Lomo embuchado",
+        "empresa": "Jamones Sierra",
+        "descripcion": "Curación lenta.",
+        "imagen_url": "charcuteria/lomo.webp",
+        "categoria": "Embutidos",
+        "fecha": None,
+        "publicamente_valido": False,
+    }
+    values.update(changes)
+    return values
+
+
+def _blog_row(id_noticia: int, imagen_url: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_noticia=id_noticia,
+        idioma="es",
+        slug=f"articulo-{id_noticia}",
+        titulo="Jamón ibérico",
+        contenido="La dehesa.",
+        autor="Autor",
+        imagen_url=imagen_url,
+        imagen_url_2=None,
+        fecha_publicacion=datetime(2026, 7, id_noticia, 9, 0, 0),
+        fecha_actualizacion=None,
+    )
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=mysql.dialect()))
+
+
+class ReviewPublicRowTests(unittest.TestCase):
+    def test_una_fila_valida_y_normalizada_no_cambia(self) -> None:
+        review = review_public_row(PUBLIC_TABLES["charcuteria"], _product())
+
+        self.assertTrue(review.valid)
+        self.assertEqual(review.changes, {})
+
+    def test_una_fila_valida_devuelve_su_forma_normalizada(self) -> None:
+        review = review_public_row(PUBLIC_TABLES["charcuteria"], _product(empresa="  "))
+
+        self.assertTrue(review.valid)
+        self.assertEqual(review.changes, {"empresa": None})
+
+    def test_una_fila_danada_no_es_valida_e_indica_el_motivo(self) -> None:
+        review = review_public_row(
+            PUBLIC_TABLES["charcuteria"],
+            _product(imagen_url="../secreto.webp"),
+        )
+
+        self.assertFalse(review.valid)
+        self.assertIn("imagen_url", review.detail or "")
+
+
+class PublicReadsTests(unittest.IsolatedAsyncioTestCase):
+    def test_el_filtro_solo_se_aplica_con_la_opcion_activa(self) -> None:
+        query = select(models.Blog)
+
+        self.assertNotIn("publicamente_valido", _sql(only_public_rows(query, models.Blog)))
+        with patch.object(settings, "CONTENT_VALIDATED_ON_WRITE", True):
+            self.assertIn("publicamente_valido", _sql(only_public_rows(query, models.Blog)))
+
+    def test_construye_la_respuesta_sin_validar(self) -> None:
+        with patch.object(schemas.Charcuteria, "model_validate") as validate:
+            product = construct_public(schemas.Charcuteria, _product())
+
+        validate.assert_not_called()
+        self.assertEqual(product.nombre, "Lomo embuchado")
+        self.assertNotIn("publicamente_valido", product.model_dump())
+
+    async def test_las_lecturas_confian_en_la_marca_con_la_opcion_activa(self) -> None:
+        rows = [_blog_row(1, "articulos/uno.webp"), _blog_row(2, "../fuera.webp")]
+        cache = ContentCache(
+            enabled=False,
+            version_key="tests:content-version",
+            poll_interval_seconds=1.0,
+            max_entries=16,
+        )
+
+        session = RecordingSession(rows)
+        posts = await BlogService(cast(AsyncSession, session), cache=cache).get_all_posts("es")
+        self.assertEqual([post.id_noticia for post in posts], [1])
+        self.assertNotIn("publicamente_valido", _sql(session.statements[0]))
+
+        session = RecordingSession(rows[:1])
+        with (
+            patch.object(settings, "CONTENT_VALIDATED_ON_WRITE", True),
+            patch.object(schemas.Blog, "model_validate") as validate,
+        ):
+            posts = await BlogService(cast(AsyncSession, session), cache=cache).get_all_posts("es")
+        validate.assert_not_called()
+        self.assertEqual([post.id_noticia for post in posts], [1])
+        self.assertIn("publicamente_valido", _sql(session.statements[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,7 @@ from backend.models.schemas import (
 )
 from backend.services.blog_service import BlogService
 from backend.services.charcuteria_service import CharcuteriaService
+from backend.tests._content_cache import use_isolated_content_cache
 
 
 class _ScalarRows:
@@ -89,6 +90,8 @@ def _product(product_id: int, **overrides):
 
 
 class PublicContentValidationTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        use_isolated_content_cache(self)
 
     def test_rutas_publicas_rechazan_delimitadores_url_codificados(self) -> None:
         self.assertFalse(_is_safe_public_asset_path("foto%3Fversion.png"))
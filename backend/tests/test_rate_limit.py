@@ -8,7 +8,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.testclient import TestClient
 
-from backend.middleware.rate_limit import RateLimitMiddleware, RateLimitRule
+from backend.middleware.rate_limit import InMemoryRateLimiter, RateLimitMiddleware, RateLimitRule
 
 
 class MutableClock:
@@ -24,6 +24,18 @@ class MutableClock:
         self.value += seconds
 
 
+class CountingLimiter(InMemoryRateLimiter):
+    """Limitador en memoria que cuenta las consultas, como lo haría Redis."""
+
+    def __init__(self, clock: MutableClock) -> None:
+        super().__init__(clock=clock)
+        self.calls = 0
+
+    async def check_many(self, rules, client_key):
+        self.calls += 1
+        return await super().check_many(rules, client_key)
+
+
 class RateLimitMiddlewareTests(unittest.TestCase):
     def setUp(self) -> None:
         self.clock = MutableClock()
@@ -350,5 +362,73 @@ class RateLimitMiddlewareTests(unittest.TestCase):
         self.assertEqual(client.get("/ruta-nueva").status_code, 429)
 
 
+class BlockedClientCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = MutableClock()
+        self.limiter = CountingLimiter(self.clock)
+
+    def _client(self, max_blocked_clients: int = 100) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(
+            RateLimitMiddleware,
+            rules=[
+                RateLimitRule(
+                    name="estricto",
+                    method="GET",
+                    path="/estricto",
+                    max_requests=1,
+                    window_seconds=10,
+                )
+            ],
+            secret_key="clave-pruebas",
+            clock=self.clock,
+            limiter=self.limiter,
+            max_blocked_clients=max_blocked_clients,
+        )
+
+        @app.get("/estricto")
+        async def estricto() -> dict[str, bool]:
+            return {"ok": True}
+
+        @app.get("/libre")
+        async def libre() -> dict[str, bool]:
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def test_cliente_bloqueado_recibe_429_sin_consultar_el_limitador(self) -> None:
+        client = self._client()
+        client.get("/estricto")
+        client.get("/estricto")
+        self.assertEqual(self.limiter.calls, 2)
+
+        self.clock.advance(4)
+        for _ in range(5):
+            blocked = client.get("/estricto")
+            self.assertEqual(blocked.status_code, 429)
+            self.assertEqual(blocked.headers["retry-after"], "6")
+        self.assertEqual(self.limiter.calls, 2)
+
+        # El bloqueo local solo afecta a las rutas de la regla agotada.
+        self.assertEqual(client.get("/libre").status_code, 200)
+
+    def test_al_reabrirse_la_ventana_vuelve_a_consultar_el_limitador(self) -> None:
+        client = self._client()
+        client.get("/estricto")
+        client.get("/estricto")
+
+        self.clock.advance(10)
+
+        self.assertEqual(client.get("/estricto").status_code, 200)
+        self.assertEqual(self.limiter.calls, 3)
+
+    def test_sin_capacidad_no_recuerda_bloqueos(self) -> None:
+        client = self._client(max_blocked_clients=0)
+        for _ in range(3):
+            client.get("/estricto")
+
+        self.assertEqual(self.limiter.calls, 3)
+
+
 if __name__ == "__main__":
     unittest.main()
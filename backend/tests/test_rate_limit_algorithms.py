@@ -0,0 +1,114 @@
+"""Pruebas del contador de ventana deslizante del rate limit."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import unittest
+from typing import Any, cast
+
+from redis.asyncio import Redis
+
+from backend.middleware.rate_limit import (
+    SLIDING_WINDOW_COUNTER,
+    InMemoryRateLimiter,
+    RateLimitRule,
+    RedisRateLimiter,
+    evaluate_window_counter,
+)
+
+
+class MutableClock:
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def __call__(self) -> float:
+        return self.value
+
+
+class _ScriptRedis:
+    """Registra las claves y argumentos enviados al script Lua."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], list[Any]]] = []
+
+    def register_script(self, script: str):
+        async def run(keys: list[str], args: list[Any]) -> list[int]:
+            self.calls.append((keys, args))
+            return [1, 0, 0]
+
+        return run
+
+
+def _rule(name: str, max_requests: int, **overrides) -> RateLimitRule:
+    return RateLimitRule(
+        name=name,
+        method="*",
+        path="*",
+        max_requests=max_requests,
+        window_seconds=60,
+        **overrides,
+    )
+
+
+class WindowCounterTests(unittest.TestCase):
+    def test_pondera_la_ventana_anterior_por_su_solape(self) -> None:
+        # Mitad de la ventana 21: la anterior, con 10 peticiones, aún cuenta como 5.
+        state, retry_ms = evaluate_window_counter((20, 10, 0), 1_290_000, 10, 60_000)
+
+        self.assertEqual(state, (21, 0, 10))
+        self.assertIsNone(retry_ms)
+
+    def test_descarta_ventanas_no_consecutivas(self) -> None:
+        state, retry_ms = evaluate_window_counter((18, 10, 10), 1_200_000, 10, 60_000)
+
+        self.assertEqual(state, (20, 0, 0))
+        self.assertIsNone(retry_ms)
+
+    def test_regla_desconocida_no_se_acepta(self) -> None:
+        with self.assertRaises(ValueError):
+            _rule("global", 10, algorithm="token_bucket")
+
+
+class InMemoryWindowCounterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_bloquea_hasta_que_la_ventana_anterior_pierde_peso(self) -> None:
+        clock = MutableClock(1200.0)
+        limiter = InMemoryRateLimiter(clock=clock)
+        rule = _rule("global", 10, algorithm=SLIDING_WINDOW_COUNTER)
+
+        for _ in range(10):
+            self.assertEqual(await limiter.check(rule, "cliente"), (True, 0))
+        self.assertEqual(await limiter.check(rule, "cliente"), (False, 66))
+
+        clock.value += 66
+        self.assertEqual(await limiter.check(rule, "cliente"), (True, 0))
+        self.assertEqual(await limiter.check(rule, "cliente"), (False, 6))
+
+    async def test_una_regla_de_contador_agotada_no_consume_las_demas(self) -> None:
+        limiter = InMemoryRateLimiter(clock=MutableClock(1200.0))
+        counter_rule = _rule("global", 1, algorithm=SLIDING_WINDOW_COUNTER)
+        log_rule = _rule("contacto", 2)
+
+        self.assertTrue((await limiter.check_many([log_rule, counter_rule], "cliente"))[0])
+        allowed, _, blocked = await limiter.check_many([log_rule, counter_rule], "cliente")
+        self.assertFalse(allowed)
+        self.assertIs(blocked, counter_rule)
+
+        self.assertEqual(await limiter.check(log_rule, "cliente"), (True, 0))
+
+
+class RedisWindowCounterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_envia_el_algoritmo_y_una_clave_propia_por_regla(self) -> None:
+        redis = _ScriptRedis()
+        limiter = RedisRateLimiter(cast(Redis, redis), "pruebas:", clock=lambda: 1200.0)
+
+        await limiter.check_many(
+            [_rule("global", 300, algorithm=SLIDING_WINDOW_COUNTER), _rule("contacto", 5)],
+            "cliente",
+        )
+
+        keys, args = redis.calls[0]
+        self.assertEqual(keys, ["pruebas:global:contador:cliente", "pruebas:contacto:cliente"])
+        self.assertEqual(args[2:], [300, 60_000, 1, 5, 60_000, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
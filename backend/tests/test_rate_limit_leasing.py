@@ -0,0 +1,206 @@
+"""Pruebas de la reserva de permisos del rate limit para clientes de mucho volumen."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import unittest
+from typing import Any, cast
+
+from redis.asyncio import Redis
+
+from backend.middleware.rate_limit import (
+    RATE_LIMIT_LEASE_LUA_SCRIPT,
+    SLIDING_WINDOW_COUNTER,
+    LeasingRateLimiter,
+    RateLimitRule,
+)
+
+
+class MutableClock:
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def __call__(self) -> float:
+        return self.value
+
+
+class _LeaseRedis:
+    """Concede los permisos pedidos y registra cada llamada a los scripts."""
+
+    def __init__(self) -> None:
+        self.lease_calls: list[tuple[list[str], list[Any]]] = []
+        self.check_calls = 0
+        self.lease_result: list[int] | None = None
+
+    def register_script(self, script: str):
+        if script == RATE_LIMIT_LEASE_LUA_SCRIPT:
+            async def lease(keys: list[str], args: list[Any]) -> list[int]:
+                self.lease_calls.append((keys, args))
+                if self.lease_result is not None:
+                    return self.lease_result
+                return [1, 0, 0, *(args[4 + index * 6] for index in range(len(keys)))]
+
+            return lease
+
+        async def check(keys: list[str], args: list[Any]) -> list[int]:
+            self.check_calls += 1
+            return [1, 0, 0]
+
+        return check
+
+
+class _SharedQuotaRedis:
+    """Redis compartido por varios workers que solo cuenta los permisos de cada clave."""
+
+    def __init__(self) -> None:
+        self.used: dict[str, int] = {}
+
+    def register_script(self, script: str):
+        if script == RATE_LIMIT_LEASE_LUA_SCRIPT:
+            async def lease(keys: list[str], args: list[Any]) -> list[int]:
+                offsets = [1 + index * 6 for index in range(len(keys))]
+                for position, (key, offset) in enumerate(zip(keys, offsets), start=1):
+                    if self.used.get(key, 0) >= args[offset]:
+                        return [0, 60, position]
+                grants = []
+                for key, offset in zip(keys, offsets):
+                    granted = min(args[offset + 3], args[offset] - self.used.get(key, 0))
+                    self.used[key] = self.used.get(key, 0) + granted
+                    grants.append(granted)
+                return [1, 0, 0, *grants]
+
+            return lease
+
+        async def check(keys: list[str], args: list[Any]) -> list[int]:
+            offsets = [2 + index * 3 for index in range(len(keys))]
+            for position, (key, offset) in enumerate(zip(keys, offsets), start=1):
+                if self.used.get(key, 0) + 1 > args[offset]:
+                    return [0, 60, position]
+            for key in keys:
+                self.used[key] = self.used.get(key, 0) + 1
+            return [1, 0, 0]
+
+        return check
+
+
+def _rule(name: str, max_requests: int = 300, **overrides) -> RateLimitRule:
+    return RateLimitRule(
+        name=name,
+        method="*",
+        path="*",
+        max_requests=max_requests,
+        window_seconds=60,
+        **overrides,
+    )
+
+
+class LeasingRateLimiterTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.redis = _LeaseRedis()
+        self.clock = MutableClock(1200.0)
+        self.limiter = LeasingRateLimiter(
+            cast(Redis, self.redis),
+            "pruebas",
+            leased_client_keys={"nextjs"},
+            lease_size=3,
+            lease_seconds=2,
+            clock=self.clock,
+        )
+        self.rules = [_rule("global", algorithm=SLIDING_WINDOW_COUNTER), _rule("blog-listado")]
+
+    async def test_gasta_en_memoria_los_permisos_reservados(self) -> None:
+        for _ in range(7):
+            self.assertEqual(
+                await self.limiter.check_many(self.rules, "nextjs"),
+                (True, 0, None),
+            )
+
+        self.assertEqual(len(self.redis.lease_calls), 3)
+        keys, args = self.redis.lease_calls[0]
+        self.assertEqual(keys, ["pruebas:global:contador:nextjs", "pruebas:blog-listado:nextjs"])
+        self.assertEqual(args[1:5], [300, 60_000, 1, 3])
+        self.assertEqual(self.redis.check_calls, 0)
+
+    async def test_otros_clientes_consultan_redis_en_cada_peticion(self) -> None:
+        for _ in range(3):
+            await self.limiter.check_many(self.rules, "anonimo")
+
+        self.assertEqual(self.redis.check_calls, 3)
+        self.assertEqual(self.redis.lease_calls, [])
+
+    async def test_devuelve_los_sobrantes_de_una_reserva_caducada(self) -> None:
+        await self.limiter.check_many(self.rules, "nextjs")
+        self.clock.value += 2
+
+        await self.limiter.check_many(self.rules, "nextjs")
+
+        _, renewal_args = self.redis.lease_calls[1]
+        # Contador: se devuelven 2 permisos de la ventana 20; registro: de sus miembros.
+        self.assertEqual(renewal_args[5:7], [2, "20"])
+        self.assertEqual(renewal_args[11], 2)
+        self.assertTrue(renewal_args[12].startswith("1200000:"))
+
+    async def test_un_bloqueo_no_gasta_los_permisos_de_otras_reglas(self) -> None:
+        await self.limiter.check_many([self.rules[1]], "nextjs")
+        self.redis.lease_result = [0, 7, 1]
+
+        allowed, retry_after, blocked = await self.limiter.check_many(self.rules, "nextjs")
+        self.redis.lease_result = None
+        await self.limiter.check_many([self.rules[1]], "nextjs")
+        await self.limiter.check_many([self.rules[1]], "nextjs")
+
+        self.assertEqual((allowed, retry_after, blocked), (False, 7, self.rules[0]))
+        # La reserva de blog-listado conserva sus dos permisos restantes.
+        self.assertEqual(len(self.redis.lease_calls), 2)
+
+
+
+class SharedQuotaLeasingTests(unittest.IsolatedAsyncioTestCase):
+    async def test_una_regla_de_limite_bajo_no_se_reserva_en_un_solo_worker(self) -> None:
+        redis = _SharedQuotaRedis()
+        workers = [
+            LeasingRateLimiter(
+                cast(Redis, redis),
+                "pruebas",
+                leased_client_keys={"nextjs"},
+                lease_size=20,
+                lease_seconds=2,
+                clock=MutableClock(1200.0),
+            )
+            for _ in range(2)
+        ]
+        rules = [_rule("global", algorithm=SLIDING_WINDOW_COUNTER), _rule("sitemap", 12)]
+
+        for _ in range(6):
+            for worker in workers:
+                self.assertEqual(await worker.check_many(rules, "nextjs"), (True, 0, None))
+
+        self.assertEqual(redis.used["pruebas:sitemap:nextjs"], 12)
+        # El global se reserva, pero cada reserva toma como mucho una décima parte.
+        self.assertEqual(redis.used["pruebas:global:contador:nextjs"], 40)
+        allowed, _, blocked = await workers[0].check_many(rules, "nextjs")
+        self.assertFalse(allowed)
+        self.assertIs(blocked, rules[1])
+
+    async def test_un_bloqueo_sin_reserva_devuelve_el_permiso_reservado(self) -> None:
+        redis = _SharedQuotaRedis()
+        redis.used["pruebas:sitemap:nextjs"] = 12
+        limiter = LeasingRateLimiter(
+            cast(Redis, redis),
+            "pruebas",
+            leased_client_keys={"nextjs"},
+            lease_size=3,
+            lease_seconds=2,
+            clock=MutableClock(1200.0),
+        )
+        rules = [_rule("global"), _rule("sitemap", 12)]
+
+        for _ in range(3):
+            self.assertFalse((await limiter.check_many(rules, "nextjs"))[0])
+        for _ in range(3):
+            await limiter.check_many([rules[0]], "nextjs")
+
+        self.assertEqual(redis.used["pruebas:global:nextjs"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Pruebas del modo Redis Cluster del cliente y de las claves del rate limit."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import unittest
+from typing import Any, cast
+
+from redis.asyncio import Redis
+from redis.asyncio.cluster import RedisCluster
+from redis.crc import key_slot
+
+from backend.core.redis_client import create_redis_client
+from backend.middleware.rate_limit import (
+    SLIDING_WINDOW_COUNTER,
+    RateLimitRule,
+    RedisRateLimiter,
+)
+from backend.tests._settings import build_test_settings
+
+
+class _ScriptRedis:
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+
+    def register_script(self, script: str):
+        async def run(keys: list[str], args: list[Any]) -> list[int]:
+            self.keys = keys
+            return [1, 0, 0]
+
+        return run
+
+
+def _rule(name: str, **overrides) -> RateLimitRule:
+    return RateLimitRule(
+        name=name,
+        method="*",
+        path="*",
+        max_requests=10,
+        window_seconds=60,
+        **overrides,
+    )
+
+
+class RedisClusterModeTests(unittest.IsolatedAsyncioTestCase):
+    async def test_crea_un_cliente_de_cluster_solo_en_modo_cluster(self) -> None:
+        single = create_redis_client(build_test_settings())
+        cluster = create_redis_client(build_test_settings(REDIS_CLUSTER_MODE=True))
+        try:
+            self.assertIsInstance(single, Redis)
+            self.assertIsInstance(cluster, RedisCluster)
+        finally:
+            await single.aclose()
+            await cluster.aclose()
+
+    async def test_las_claves_de_un_cliente_comparten_slot_en_modo_cluster(self) -> None:
+        redis = _ScriptRedis()
+        limiter = RedisRateLimiter(cast(Redis, redis), "pruebas", cluster_mode=True)
+
+        await limiter.check_many(
+            [_rule("global", algorithm=SLIDING_WINDOW_COUNTER), _rule("contacto")],
+            "a1b2c3",
+        )
+
+        self.assertEqual(
+            redis.keys,
+            ["pruebas:{a1b2c3}:global:contador", "pruebas:{a1b2c3}:contacto"],
+        )
+        self.assertEqual(len({key_slot(key.encode()) for key in redis.keys}), 1)
+
+    async def test_sin_modo_cluster_conserva_las_claves_existentes(self) -> None:
+        redis = _ScriptRedis()
+        limiter = RedisRateLimiter(cast(Redis, redis), "pruebas")
+
+        await limiter.check_many([_rule("contacto")], "a1b2c3")
+
+        self.assertEqual(redis.keys, ["pruebas:contacto:a1b2c3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ from sqlalchemy.exc import OperationalError
 from backend.middleware.request_size import RequestSizeLimitMiddleware, RequestSizeRule
 from backend.services.email_service import EmailService
 from backend.routers import blog, charcuteria
+from backend.tests._content_cache import use_isolated_content_cache
 
 
 class RequestSizeLimitMiddlewareTests(unittest.TestCase):
@@ -78,6 +79,9 @@ class RequestSizeLimitMiddlewareTests(unittest.TestCase):
 
 
 class TimeoutAndDatabaseErrorTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        use_isolated_content_cache(self)
+
     async def test_email_service_pasa_timeout_configurado_al_cliente_smtp(self) -> None:
         service = EmailService()
         service.smtp_timeout = 7.5
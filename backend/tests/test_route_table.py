@@ -0,0 +1,60 @@
+"""Pruebas de la tabla de rutas compartida por los middlewares."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import unittest
+
+from backend.middleware.route_table import RouteTable
+
+
+def _table() -> RouteTable[str]:
+    return RouteTable(
+        [
+            ("*", "*", "global"),
+            ("GET", "/api/blog", "blog-listado"),
+            ("GET", "/api/blog/search", "blog-busqueda"),
+            ("GET", "/api/blog/{slug}", "blog-slug"),
+            ("GET", "/api/blog/by-id/{id_noticia}", "blog-id"),
+            ("POST", "/api/contacto", "contacto"),
+        ]
+    )
+
+
+class RouteTableTests(unittest.TestCase):
+    def test_devuelve_todas_las_coincidencias_en_orden_de_registro(self) -> None:
+        table = _table()
+
+        # Igual que con ``fullmatch``: el literal y el parámetro coinciden a la vez.
+        self.assertEqual(
+            table.match("GET", "/api/blog/search"),
+            ("global", "blog-busqueda", "blog-slug"),
+        )
+        self.assertEqual(table.match("get", "/api/blog/jamon-iberico/"), ("global", "blog-slug"))
+        self.assertEqual(table.match("GET", "/api/blog/by-id/7"), ("global", "blog-id"))
+
+    def test_filtra_por_metodo_y_aplica_las_reglas_globales(self) -> None:
+        table = _table()
+
+        self.assertEqual(table.match("GET", "/api/contacto"), ("global",))
+        self.assertEqual(table.match("POST", "/api/contacto"), ("global", "contacto"))
+        self.assertEqual(table.match("PROPFIND", "/api/blog"), ("global",))
+        self.assertEqual(table.match("GET", "/ruta-nueva"), ("global",))
+
+    def test_los_parametros_no_coinciden_con_segmentos_vacios_ni_varios(self) -> None:
+        table = _table()
+
+        self.assertEqual(table.match("GET", "/api/blog//"), ("global", "blog-listado"))
+        self.assertEqual(table.match("GET", "/api/blog//x"), ("global",))
+        self.assertEqual(table.match("GET", "/api/blog/a/b"), ("global",))
+
+    def test_reutiliza_el_resultado_de_cada_plantilla(self) -> None:
+        table = _table()
+
+        self.assertIs(
+            table.match("GET", "/api/blog/primer-articulo"),
+            table.match("GET", "/api/blog/segundo-articulo"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
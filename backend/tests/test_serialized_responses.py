@@ -0,0 +1,123 @@
+"""Pruebas de las respuestas JSON preserializadas de blog y charcutería."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.routers import blog, charcuteria
+from backend.services.blog_service import BlogService
+from backend.services.charcuteria_service import CharcuteriaService
+from backend.tests._content_cache import use_isolated_content_cache
+from backend.tests._rows import RowsResult, bound_content_cache
+
+
+def _session(rows: list[Any]) -> AsyncMock:
+    session = AsyncMock()
+    session.execute.return_value = RowsResult(rows)
+    return session
+
+
+def _blog_row(id_noticia: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_noticia=id_noticia,
+        idioma="es",
+        slug=f"articulo-{id_noticia}",
+        titulo="Título",
+        contenido="Contenido",
+        autor="Autor",
+        imagen_url="articulos/imagen.webp",
+        imagen_url_2=None,
+        fecha_publicacion=datetime(2026, 7, 15, 9, 0, 0),
+        fecha_actualizacion=None,
+    )
+
+
+def _product_row(id_producto: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_producto=id_producto,
+        idioma="es",
+        nombre="Jamón ibérico",
+        empresa=None,
+        descripcion="Descripción",
+        imagen_url="charcuteria/jamon.webp",
+        categoria="Jamones",
+        fecha=None,
+    )
+
+
+class SerializedServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_el_listado_del_blog_reutiliza_los_bytes_serializados(self) -> None:
+        db = _session([_blog_row(1)])
+        service = BlogService(cast(AsyncSession, db), cache=bound_content_cache())
+
+        first = await service.get_all_posts_json("es")
+        second = await service.get_all_posts_json("es")
+
+        self.assertIs(first, second)
+        self.assertEqual(json.loads(first)[0]["fecha_publicacion"], "2026-07-15T09:00:00")
+        db.execute.assert_awaited_once()
+
+    async def test_las_busquedas_sin_resultado_no_se_conservan(self) -> None:
+        db = _session([])
+        service = BlogService(cast(AsyncSession, db), cache=bound_content_cache())
+
+        self.assertIsNone(await service.get_post_by_id_json(404, "es"))
+        self.assertIsNone(await service.get_post_by_id_json(404, "es"))
+
+        self.assertEqual(db.execute.await_count, 2)
+
+    async def test_charcuteria_reutiliza_los_bytes_serializados(self) -> None:
+        db = _session([_product_row(1)])
+        service = CharcuteriaService(cast(AsyncSession, db), cache=bound_content_cache())
+
+        first = await service.get_all_products_json("es")
+        second = await service.get_all_products_json("es")
+
+        self.assertIs(first, second)
+        self.assertEqual(json.loads(first)[0]["id_producto"], 1)
+        db.execute.assert_awaited_once()
+
+
+class SerializedEndpointTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        use_isolated_content_cache(self)
+
+    async def test_el_listado_devuelve_el_cuerpo_sin_volver_a_serializar(self) -> None:
+        db = _session([_blog_row(1)])
+
+        response = await blog.get_blog_posts(idioma="es", token_verification=None, db=db)
+
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual([post["id_noticia"] for post in json.loads(response.body)], [1])
+
+    async def test_una_publicacion_inexistente_por_id_devuelve_404(self) -> None:
+        with self.assertRaises(HTTPException) as raised:
+            await blog.get_blog_post_by_id(
+                id_noticia=404,
+                idioma="es",
+                token_verification=None,
+                db=_session([]),
+            )
+
+        self.assertEqual(raised.exception.status_code, 404)
+
+    async def test_charcuteria_devuelve_el_cuerpo_serializado(self) -> None:
+        response = await charcuteria.get_charcuteria_products(
+            idioma="es",
+            token_verification=None,
+            db=_session([_product_row(3)]),
+        )
+
+        self.assertEqual(json.loads(response.body)[0]["id_producto"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
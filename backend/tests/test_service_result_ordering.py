@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.services.blog_service import BlogService
 from backend.services.charcuteria_service import CharcuteriaService
+from backend.tests._content_cache import use_isolated_content_cache
 
 
 class _CapturingSession:
@@ -40,6 +41,9 @@ def _as_async_session(session: _CapturingSession) -> AsyncSession:
 
 
 class ServiceResultOrderingTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        use_isolated_content_cache(self)
+
     async def test_blog_uses_id_as_date_tiebreaker(self) -> None:
         session = _CapturingSession()
         await BlogService(_as_async_session(session)).get_all_posts("es")
@@ -0,0 +1,118 @@
+"""Pruebas del sitemap incremental con cursor de cambios y entradas eliminadas."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.services.sitemap_service import (
+    InvalidSitemapCursorError,
+    SitemapService,
+    encode_sitemap_cursor,
+)
+from backend.tests._rows import RecordingSession, bound_content_cache
+
+
+class _SharedRedis:
+    """Redis mínimo con la versión de contenido y valores con caducidad."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {"tests:content-version": b"1"}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> bool:
+        self.values[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+
+def _blog_row(id_noticia: int, slug: str, day: int, idioma: str = "es") -> SimpleNamespace:
+    return SimpleNamespace(
+        id_noticia=id_noticia,
+        idioma=idioma,
+        slug=slug,
+        titulo="Título",
+        contenido="Contenido",
+        autor="Autor",
+        imagen_url="articulos/imagen.webp",
+        imagen_url_2=None,
+        fecha_publicacion=datetime(2026, 7, day, 9, 0, 0),
+        fecha_actualizacion=None,
+    )
+
+
+class SitemapChangesTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.redis = _SharedRedis()
+        self.session = RecordingSession(
+            [_blog_row(1, "jamon-iberico", 1), _blog_row(2, "queso-curado", 2)]
+        )
+        self.service = SitemapService(
+            cast(AsyncSession, self.session),
+            cache=bound_content_cache(self.redis),
+        )
+
+    async def _publish(self, *rows: SimpleNamespace) -> None:
+        self.session.rows = list(rows)
+        self.redis.values["tests:content-version"] = b"2"
+
+    async def test_sin_cursor_devuelve_el_sitemap_completo(self) -> None:
+        changes = await self.service.get_blog_changes()
+
+        self.assertTrue(changes.completo)
+        self.assertEqual([entry.id_noticia for entry in changes.entradas], [1, 2])
+        self.assertTrue(any(ttl > 0 for ttl in self.redis.ttls.values()))
+
+    async def test_sin_publicaciones_nuevas_solo_reenvia_la_fecha_limite(self) -> None:
+        cursor = (await self.service.get_blog_changes()).cursor
+
+        changes = await self.service.get_blog_changes(cursor)
+
+        self.assertFalse(changes.completo)
+        self.assertEqual([entry.id_noticia for entry in changes.entradas], [2])
+        self.assertEqual(changes.eliminadas, [])
+        self.assertEqual(changes.cursor, cursor)
+
+    async def test_devuelve_altas_cambios_de_slug_y_eliminadas(self) -> None:
+        cursor = (await self.service.get_blog_changes()).cursor
+        await self._publish(
+            _blog_row(1, "jamon-de-bellota", 1),
+            _blog_row(3, "lomo-embuchado", 1),
+        )
+
+        changes = await self.service.get_blog_changes(cursor)
+
+        self.assertFalse(changes.completo)
+        self.assertEqual(
+            [(entry.id_noticia, entry.slug) for entry in changes.entradas],
+            [(1, "jamon-de-bellota"), (3, "lomo-embuchado")],
+        )
+        self.assertEqual(
+            [(removal.id_noticia, removal.idioma) for removal in changes.eliminadas],
+            [(2, "es")],
+        )
+        self.assertNotEqual(changes.cursor, cursor)
+
+    async def test_un_cursor_sin_instantanea_conservada_recibe_el_sitemap_completo(self) -> None:
+        cursor = encode_sitemap_cursor(datetime(2026, 7, 1), "0" * 32)
+
+        changes = await self.service.get_blog_changes(cursor)
+
+        self.assertTrue(changes.completo)
+        self.assertEqual(len(changes.entradas), 2)
+
+    async def test_un_cursor_danado_se_rechaza(self) -> None:
+        with self.assertRaises(InvalidSitemapCursorError):
+            await self.service.get_blog_changes("no-es-un-cursor")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""Pruebas del sitemap XML generado en streaming con alternativas hreflang."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import asyncio
+import gzip
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, cast
+from xml.etree import ElementTree
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models import schemas
+from backend.services.sitemap_service import SitemapService, render_blog_url_group
+from backend.tests._rows import VersionRedis, bound_content_cache
+
+SITE_URL = "https://www.paraisodeljamon.com"
+NAMESPACES = {
+    "s": "http://www.sitemaps.org/schemas/sitemap/0.9",
+    "xhtml": "http://www.w3.org/1999/xhtml",
+}
+
+
+class _StreamResult:
+    def __init__(self, rows: list[Any]) -> None:
+        self._rows = rows
+        self.closed = False
+
+    async def _iterate(self):
+        for row in self._rows:
+            yield row
+
+    def scalars(self):
+        return self._iterate()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _StreamingSession:
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+        self.statements: list[Any] = []
+        self.results: list[_StreamResult] = []
+
+    async def stream(self, statement):
+        self.statements.append(statement)
+        result = _StreamResult(self.rows)
+        self.results.append(result)
+        return result
+
+
+def _blog_row(id_noticia: int, idioma: str, slug: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_noticia=id_noticia,
+        idioma=idioma,
+        slug=slug,
+        titulo="Título",
+        contenido="Contenido",
+        autor="Autor",
+        imagen_url="articulos/imagen.webp",
+        imagen_url_2=None,
+        fecha_publicacion=datetime(2026, 7, 15, 9, 0, 0),
+        fecha_actualizacion=None,
+    )
+
+
+def _entry(id_noticia: int, idioma: str, slug: str) -> schemas.SitemapBlogEntry:
+    return schemas.SitemapBlogEntry(
+        id_noticia=id_noticia,
+        idioma=idioma,
+        slug=slug,
+        lastmod=datetime(2026, 7, 15, 9, 0, 0),
+    )
+
+
+async def _collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+class RenderBlogUrlGroupTests(unittest.TestCase):
+    def test_enlaza_traducciones_y_usa_el_espanol_como_x_default(self) -> None:
+        fragment = render_blog_url_group(
+            SITE_URL,
+            [_entry(1, "de", "schinken"), _entry(1, "es", "jamón-ibérico")],
+        ).decode("utf-8")
+
+        self.assertIn(f"<loc>{SITE_URL}/de/blog/schinken</loc>", fragment)
+        self.assertIn(f"<loc>{SITE_URL}/blog/jam%C3%B3n-ib%C3%A9rico</loc>", fragment)
+        self.assertEqual(fragment.count('hreflang="x-default"'), 2)
+        self.assertIn(
+            f'hreflang="x-default" href="{SITE_URL}/blog/jam%C3%B3n-ib%C3%A9rico"',
+            fragment,
+        )
+
+
+class SitemapXmlStreamTests(unittest.IsolatedAsyncioTestCase):
+    async def test_genera_un_documento_valido_agrupado_por_publicacion(self) -> None:
+        session = _StreamingSession(
+            [
+                _blog_row(1, "en", "iberian-ham"),
+                _blog_row(1, "es", "jamon-iberico"),
+                _blog_row(2, "es", "queso-curado"),
+            ]
+        )
+        service = SitemapService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        document = await _collect(await service.stream_blog_xml(SITE_URL))
+
+        root = ElementTree.fromstring(document)
+        urls = root.findall("s:url", NAMESPACES)
+        self.assertEqual(len(urls), 3)
+        self.assertEqual(len(urls[0].findall("xhtml:link", NAMESPACES)), 3)
+        self.assertEqual(len(urls[2].findall("xhtml:link", NAMESPACES)), 2)
+        self.assertTrue(session.results[0].closed)
+        self.assertIn("yield_per", session.statements[0].get_execution_options())
+
+    async def test_el_documento_terminado_se_cachea_comprimido_por_version(self) -> None:
+        redis = VersionRedis()
+        session = _StreamingSession([_blog_row(1, "es", "jamon-iberico")])
+        service = SitemapService(cast(AsyncSession, session), cache=bound_content_cache(redis))
+
+        document = await _collect(await service.stream_blog_xml(SITE_URL))
+        cached = await service.get_cached_blog_xml()
+
+        assert cached is not None
+        self.assertEqual(gzip.decompress(cached), document)
+        redis.version = b"2"
+        self.assertIsNone(await service.get_cached_blog_xml())
+
+    async def test_un_envio_interrumpido_no_se_cachea(self) -> None:
+        session = _StreamingSession([_blog_row(1, "es", "jamon-iberico")])
+        service = SitemapService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        chunks = await service.stream_blog_xml(SITE_URL)
+        await anext(chunks)
+        await chunks.aclose()
+
+        self.assertIsNone(await service.get_cached_blog_xml())
+        self.assertTrue(session.results[0].closed)
+
+
+    async def test_las_peticiones_simultaneas_esperan_el_documento_en_curso(self) -> None:
+        session = _StreamingSession([_blog_row(1, "es", "jamon-iberico")])
+        service = SitemapService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        chunks = await service.stream_blog_xml(SITE_URL)
+        first = await anext(chunks)
+        waiting = asyncio.create_task(service.get_cached_blog_xml())
+        await asyncio.sleep(0)
+        self.assertFalse(waiting.done())
+
+        document = first + await _collect(chunks)
+
+        cached = await waiting
+        assert cached is not None
+        self.assertEqual(gzip.decompress(cached), document)
+        self.assertEqual(len(session.statements), 1)
+
+    async def test_si_se_corta_el_envio_quien_espera_genera_el_suyo(self) -> None:
+        session = _StreamingSession([_blog_row(1, "es", "jamon-iberico")])
+        service = SitemapService(cast(AsyncSession, session), cache=bound_content_cache())
+
+        chunks = await service.stream_blog_xml(SITE_URL)
+        await anext(chunks)
+        waiting = asyncio.create_task(service.get_cached_blog_xml())
+        await asyncio.sleep(0)
+        await chunks.aclose()
+
+        self.assertIsNone(await waiting)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+"""Pruebas de la última copia válida servida mientras MySQL no está disponible."""
+
+from backend.tests import _environment as _test_environment  # noqa: F401
+
+import asyncio
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import AsyncMock, Mock, patch
+
+from redis.asyncio import Redis
+from sqlalchemy.exc import InterfaceError
+
+from backend.core.content_cache import STALE_CONTENT_HEADER, ContentCache
+from backend.routers import blog, charcuteria
+from backend.tests._rows import RowsResult, VersionRedis
+
+
+class MutableClock:
+    def __init__(self) -> None:
+        self.value = 1000.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def _blog_row(id_noticia: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id_noticia=id_noticia,
+        idioma="es",
+        slug=f"articulo-{id_noticia}",
+        titulo="Título",
+        contenido="Contenido",
+        autor="Autor",
+        imagen_url="articulos/imagen.webp",
+        imagen_url_2=None,
+        fecha_publicacion=datetime(2026, 7, 15, 9, 0, 0),
+        fecha_actualizacion=None,
+    )
+
+
+def _build_cache(clock: MutableClock, redis: VersionRedis | None = None) -> ContentCache:
+    cache = ContentCache(
+        enabled=True,
+        version_key="tests:content-version",
+        poll_interval_seconds=0.5,
+        max_entries=8,
+        stale_refresh_seconds=10,
+        clock=clock,
+    )
+    cache.bind(cast(Redis, redis or VersionRedis()))
+    return cache
+
+
+def _database_error() -> InterfaceError:
+    return InterfaceError("SELECT 1", {}, Exception("conexión cerrada"))
+
+
+class StaleSnapshotTests(unittest.IsolatedAsyncioTestCase):
+    async def test_la_copia_sobrevive_a_la_invalidacion_y_conoce_su_antiguedad(self) -> None:
+        clock = MutableClock()
+        cache = _build_cache(clock)
+
+        await cache.get_or_load("clave", AsyncMock(return_value="listado"), keep_snapshot=True)
+        cache.invalidate()
+        clock.value += 42
+
+        stale = cache.stale("clave")
+        assert stale is not None
+        self.assertEqual((stale.value, stale.age_seconds), ("listado", 42))
+
+    async def test_la_recuperacion_en_segundo_plano_se_limita_por_intervalo(self) -> None:
+        clock = MutableClock()
+        cache = _build_cache(clock)
+        refresher = AsyncMock(return_value="nuevo")
+        cache.mark_source_unavailable()
+
+        cache.schedule_refresh("clave", refresher)
+        cache.schedule_refresh("clave", refresher)
+        await asyncio.sleep(0)
+
+        refresher.assert_awaited_once()
+        self.assertTrue(cache.source_available())
+        stale = cache.stale("clave")
+        assert stale is not None
+        self.assertEqual(stale.value, "nuevo")
+
+    async def test_un_fallo_de_recuperacion_mantiene_la_copia_anterior(self) -> None:
+        cache = _build_cache(MutableClock())
+        await cache.get_or_load("clave", AsyncMock(return_value="listado"), keep_snapshot=True)
+        cache.mark_source_unavailable()
+
+        with self.assertLogs("backend.core.content_cache", level="WARNING"):
+            cache.schedule_refresh("clave", AsyncMock(side_effect=_database_error()))
+            await asyncio.sleep(0)
+
+        self.assertFalse(cache.source_available())
+        stale = cache.stale("clave")
+        assert stale is not None
+        self.assertEqual(stale.value, "listado")
+
+
+class StaleEndpointTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.clock = MutableClock()
+        self.cache = _build_cache(self.clock)
+        self.cache.schedule_refresh = Mock()  # type: ignore[method-assign]
+        for target in (
+            "backend.routers.blog.content_cache",
+            "backend.services.blog_service.content_cache",
+            "backend.routers.charcuteria.content_cache",
+            "backend.services.charcuteria_service.content_cache",
+        ):
+            patcher = patch(target, self.cache)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def _load_blog_listing(self) -> None:
+        db = AsyncMock()
+        db.execute.return_value = RowsResult([_blog_row(1), _blog_row(2)])
+        await blog.get_blog_posts(idioma="es", token_verification=None, db=db)
+        self.cache.invalidate()
+
+    async def test_el_listado_se_sirve_obsoleto_si_mysql_falla(self) -> None:
+        await self._load_blog_listing()
+        self.clock.value += 30
+        db = AsyncMock()
+        db.execute.side_effect = _database_error()
+
+        with self.assertLogs("backend.routers.blog", level="WARNING"):
+            response = await blog.get_blog_posts(idioma="es", token_verification=None, db=db)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers[STALE_CONTENT_HEADER], "true")
+        self.assertEqual(response.headers["age"], "30")
+        self.assertEqual([post["id_noticia"] for post in json.loads(response.body)], [1, 2])
+        self.cache.schedule_refresh.assert_called_once()
+
+    async def test_una_publicacion_se_sirve_desde_la_copia_del_listado(self) -> None:
+        await self._load_blog_listing()
+        self.cache.mark_source_unavailable()
+        db = AsyncMock()
+
+        response = await blog.get_blog_post_by_slug(
+            slug="articulo-2",
+            idioma="es",
+            token_verification=None,
+            db=db,
+        )
+
+        self.assertEqual(json.loads(response.body)["id_noticia"], 2)
+        self.assertIn(STALE_CONTENT_HEADER, response.headers)
+        db.execute.assert_not_awaited()
+
+    async def test_sin_copia_previa_se_mantiene_el_503(self) -> None:
+        with patch.object(
+            charcuteria.CharcuteriaService,
+            "get_all_products",
+            new=AsyncMock(side_effect=_database_error()),
+        ):
+            with self.assertRaises(charcuteria.HTTPException) as raised:
+                await charcuteria.get_charcuteria_products(
+                    idioma="es",
+                    token_verification=None,
+                    db=AsyncMock(),
+                )
+
+        self.assertEqual(raised.exception.status_code, 503)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -87,10 +87,12 @@ class BlogSlugValidationTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_endpoint_normaliza_slug_nfd_antes_de_consultar_mysql(self) -> None:
         db = AsyncMock()
-        expected_post = object()
+        expected_body = b'{"slug":"caf\xc3\xa9"}'
 
         with patch("backend.routers.blog.BlogService") as service_class:
-            service_class.return_value.get_post_by_slug = AsyncMock(return_value=expected_post)
+            service_class.return_value.get_post_by_slug_json = AsyncMock(
+                return_value=expected_body
+            )
             result = await get_blog_post_by_slug(
                 slug="cafe\u0301",
                 idioma="es",
@@ -98,8 +100,8 @@ class BlogSlugValidationTests(unittest.IsolatedAsyncioTestCase):
                 db=db,
             )
 
-        self.assertIs(result, expected_post)
-        service_class.return_value.get_post_by_slug.assert_awaited_once_with("café", "es")
+        self.assertEqual(result.body, expected_body)
+        service_class.return_value.get_post_by_slug_json.assert_awaited_once_with("café", "es")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+# backend/tools/benchmark_rate_limit.py
+
+"""
+tools/benchmark_rate_limit.py
+
+Compara la memoria en Redis y las comprobaciones por segundo de los dos algoritmos
+del rate limit: el registro deslizante (un miembro de sorted set por petición) y el
+contador de ventana deslizante (un hash con dos contadores por regla y cliente).
+
+Cada cliente simulado envía tantas peticiones como permite la regla, de modo que
+todas se admiten y el registro alcanza su tamaño máximo: es el caso que determina
+la memoria de la regla global. Las comprobaciones pasan por ``RedisRateLimiter`` y
+el mismo script Lua que usa la aplicación; las claves se crean con un prefijo propio
+y se eliminan al terminar.
+
+Uso, desde la raíz del repositorio, con el ``.env`` del backend configurado y un
+Redis de pruebas (no el de producción):
+
+    python -m backend.tools.benchmark_rate_limit --clients 200 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import secrets
+import time
+
+from redis.asyncio import Redis
+
+from ..core.config import settings
+from ..core.redis_client import create_redis_client
+from ..middleware.rate_limit import (
+    SLIDING_LOG,
+    SLIDING_WINDOW_COUNTER,
+    RateLimitAlgorithm,
+    RateLimitRule,
+    RedisRateLimiter,
+)
+
+
+async def _memory_usage(redis_client: Redis, pattern: str) -> tuple[int, int]:
+    """Devuelve el número de claves y los bytes que Redis atribuye a ellas."""
+    keys = 0
+    total_bytes = 0
+    async for key in redis_client.scan_iter(match=pattern, count=500):
+        keys += 1
+        total_bytes += int(await redis_client.memory_usage(key, samples=0) or 0)
+    return keys, total_bytes
+
+
+async def _delete_keys(redis_client: Redis, pattern: str) -> None:
+    async for key in redis_client.scan_iter(match=pattern, count=500):
+        await redis_client.unlink(key)
+
+
+async def _measure(
+    redis_client: Redis,
+    algorithm: RateLimitAlgorithm,
+    clients: int,
+    requests_per_client: int,
+    window_seconds: int,
+    concurrency: int,
+) -> None:
+    prefix = f"{settings.REDIS_RATE_LIMIT_PREFIX}:benchmark:{secrets.token_hex(4)}"
+    limiter = RedisRateLimiter(redis_client, prefix)
+    rule = RateLimitRule(
+        name="global",
+        method="*",
+        path="*",
+        max_requests=requests_per_client,
+        window_seconds=window_seconds,
+        algorithm=algorithm,
+    )
+    client_keys = [f"cliente{index:05d}" for index in range(clients)]
+    pending = [client_key for _ in range(requests_per_client) for client_key in client_keys]
+    blocked = 0
+
+    try:
+        started = time.perf_counter()
+        for offset in range(0, len(pending), concurrency):
+            results = await asyncio.gather(
+                *(
+                    limiter.check_many([rule], client_key)
+                    for client_key in pending[offset:offset + concurrency]
+                )
+            )
+            blocked += sum(1 for allowed, _, _ in results if not allowed)
+        elapsed = time.perf_counter() - started
+        keys, total_bytes = await _memory_usage(redis_client, f"{prefix}:*")
+    finally:
+        await _delete_keys(redis_client, f"{prefix}:*")
+
+    print(
+        f"{algorithm:<24} {len(pending) / elapsed:10.1f} comprobaciones/s   "
+        f"{keys:6d} claves   {total_bytes / max(1, clients):10.1f} bytes/cliente   "
+        f"{blocked} bloqueadas"
+    )
+
+
+async def run(clients: int, requests_per_client: int, window_seconds: int, concurrency: int) -> None:
+    """Mide ambos algoritmos con la misma carga e imprime una línea por algoritmo."""
+    redis_client = create_redis_client(settings)
+    print(
+        f"{clients} clientes, {requests_per_client} peticiones por cliente, "
+        f"ventana de {window_seconds} s, {concurrency} comprobaciones simultáneas"
+    )
+    try:
+        for algorithm in (SLIDING_LOG, SLIDING_WINDOW_COUNTER):
+            await _measure(
+                redis_client,
+                algorithm,
+                clients,
+                requests_per_client,
+                window_seconds,
+                concurrency,
+            )
+    finally:
+        await redis_client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compara memoria y rendimiento de los algoritmos del rate limit en Redis."
+    )
+    parser.add_argument("--clients", type=int, default=200, help="Clientes simulados.")
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=settings.GLOBAL_RATE_LIMIT_REQUESTS,
+        help="Peticiones por cliente; por defecto, el límite global configurado.",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=settings.GLOBAL_RATE_LIMIT_WINDOW_SECONDS,
+        help="Ventana de la regla en segundos.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.REDIS_MAX_CONNECTIONS,
+        help="Comprobaciones enviadas a Redis a la vez; como mucho REDIS_MAX_CONNECTIONS.",
+    )
+    arguments = parser.parse_args()
+    if min(arguments.clients, arguments.requests, arguments.window, arguments.concurrency) < 1:
+        parser.error("todos los valores deben ser mayores que cero")
+    if arguments.concurrency > settings.REDIS_MAX_CONNECTIONS:
+        # El pool del cliente rechaza las comprobaciones que no encuentran conexión libre.
+        parser.error("--concurrency no puede superar REDIS_MAX_CONNECTIONS")
+    asyncio.run(
+        run(arguments.clients, arguments.requests, arguments.window, arguments.concurrency)
+    )
+
+
+if __name__ == "__main__":
+    main()
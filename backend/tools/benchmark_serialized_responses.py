@@ -0,0 +1,178 @@
+# backend/tools/benchmark_serialized_responses.py
+
+"""
+tools/benchmark_serialized_responses.py
+
+Compara las peticiones por segundo de ``GET /api/blog`` y ``GET /api/charcuteria``
+con el flujo anterior (validar filas ORM y serializar mediante ``response_model``)
+y con el JSON ya serializado que conserva la caché de contenido.
+
+Ambos casos se ejecutan en el mismo proceso, mediante ASGI y sin red, con filas
+generadas en memoria en lugar de MySQL. Así la medición aísla el coste de validar
+y serializar, que es lo que elimina la caché; no mide la latencia de la base de
+datos ni la de Uvicorn.
+
+Uso, desde la raíz del repositorio, con el ``.env`` del backend configurado y
+``CONTENT_CACHE_ENABLED=true``:
+
+    python -m backend.tools.benchmark_serialized_responses --requests 2000 --rows 40
+
+Resultado de referencia con esos valores (una CPU, Python 3.11): ``/api/blog`` pasa
+de 11,5 a 578 req/s y ``/api/charcuteria`` de 70 a 588 req/s. El coste anterior del
+blog lo domina la validación carácter a carácter del contenido completo.
+"""
+
+import argparse
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ..core.content_cache import content_cache
+from ..dependencies import get_db, verify_token
+from ..models import models, schemas
+from ..routers import blog, charcuteria
+
+
+class _MemoryVersion:
+    """Versión de contenido fija: la caché queda activa sin un Redis real."""
+
+    async def get(self, key: str) -> bytes:
+        return b"1"
+
+
+class _MemorySession:
+    """Devuelve las filas de la tabla consultada, como un MySQL sin latencia."""
+
+    def __init__(self, rows_by_table: dict[str, list[SimpleNamespace]]) -> None:
+        self._rows_by_table = rows_by_table
+
+    async def execute(self, statement):
+        rows = self._rows_by_table[statement.get_final_froms()[0].name]
+
+        class _Result:
+            @staticmethod
+            def scalars():
+                return _Result
+
+            @staticmethod
+            def all():
+                return rows
+
+        return _Result()
+
+
+def _blog_rows(count: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id_noticia=index,
+            idioma="es",
+            slug=f"articulo-{index}",
+            titulo=f"Artículo {index}",
+            contenido="Texto del artículo. " * 200,
+            autor="El Paraíso del Jamón",
+            imagen_url=f"articulos/imagen-{index}.webp",
+            imagen_url_2=None,
+            fecha_publicacion=datetime(2026, 1, 1, 9, 0, 0),
+            fecha_actualizacion=None,
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def _charcuteria_rows(count: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id_producto=index,
+            idioma="es",
+            nombre=f"Producto {index}",
+            empresa="Empresa",
+            descripcion="Descripción del producto. " * 20,
+            imagen_url=f"charcuteria/producto-{index}.webp",
+            categoria=f"Categoría {index % 5}",
+            fecha=None,
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def _baseline_app(rows_by_table: dict[str, list[SimpleNamespace]]) -> FastAPI:
+    """Reproduce el flujo anterior: validación por petición y ``response_model``."""
+    app = FastAPI()
+
+    @app.get("/api/blog", response_model=List[schemas.Blog])
+    async def baseline_blog():
+        rows = rows_by_table[models.TABLE_NAME_BLOG]
+        return [schemas.Blog.model_validate(row) for row in rows]
+
+    @app.get("/api/charcuteria", response_model=List[schemas.Charcuteria])
+    async def baseline_charcuteria():
+        rows = rows_by_table[models.TABLE_NAME_CHARCUTERIA]
+        return [schemas.Charcuteria.model_validate(row) for row in rows]
+
+    return app
+
+
+def _serialized_app(rows_by_table: dict[str, list[SimpleNamespace]]) -> FastAPI:
+    """Monta los routers reales; los servicios usan la caché compartida del worker."""
+    app = FastAPI()
+
+    async def override_get_db():
+        yield _MemorySession(rows_by_table)
+
+    app.include_router(blog.router, prefix="/api")
+    app.include_router(charcuteria.router, prefix="/api")
+    app.dependency_overrides[verify_token] = lambda: None
+    app.dependency_overrides[get_db] = override_get_db
+    return app
+
+
+def _measure(app: FastAPI, path: str, total: int) -> float:
+    with TestClient(app) as client:
+        # Primera petición fuera de la medición: llena la caché y calienta Pydantic.
+        client.get(path, params={"idioma": "es"}).raise_for_status()
+        started = time.perf_counter()
+        for _ in range(total):
+            client.get(path, params={"idioma": "es"}).raise_for_status()
+        elapsed = time.perf_counter() - started
+    return total / elapsed
+
+
+def run(total: int, row_count: int) -> None:
+    """Ejecuta ambos casos e imprime las peticiones por segundo de cada uno."""
+    rows_by_table = {
+        models.TABLE_NAME_BLOG: _blog_rows(row_count),
+        models.TABLE_NAME_CHARCUTERIA: _charcuteria_rows(row_count),
+    }
+    baseline = _baseline_app(rows_by_table)
+    serialized = _serialized_app(rows_by_table)
+    content_cache.bind(_MemoryVersion())  # type: ignore[arg-type]
+
+    print(f"{total} peticiones por caso, {row_count} filas por respuesta")
+    try:
+        for path in ("/api/blog", "/api/charcuteria"):
+            before = _measure(baseline, path, total)
+            after = _measure(serialized, path, total)
+            print(
+                f"{path:<18} antes: {before:10.1f} req/s   "
+                f"después: {after:10.1f} req/s   x{after / before:.2f}"
+            )
+    finally:
+        content_cache.unbind()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compara req/s con y sin JSON preserializado en caché."
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="Peticiones medidas por caso.")
+    parser.add_argument("--rows", type=int, default=40, help="Filas devueltas por respuesta.")
+    arguments = parser.parse_args()
+    run(arguments.requests, arguments.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# backend/tools/bump_content_version.py
+
+"""
+tools/bump_content_version.py
+
+Publica una versión de contenido nueva en Redis para que todos los workers
+descarten su caché de contenido.
+
+Las herramientas de importación y validación ya la publican al terminar. Debe
+ejecutarse tras editar filas del blog o de charcutería directamente en MySQL; si
+se olvida, los workers siguen sirviendo su caché hasta que caducan las entradas
+(``CONTENT_CACHE_MAX_AGE_SECONDS``).
+
+Uso, desde la raíz del repositorio, con el ``.env`` del backend configurado:
+
+    python -m backend.tools.bump_content_version
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from ..core.config import settings
+from ..core.content_cache import content_cache
+from ..core.redis_client import create_redis_client
+
+
+async def bump_content_version() -> int:
+    """Publica una versión de contenido nueva con un cliente Redis propio."""
+    redis_client = create_redis_client(settings)
+    content_cache.bind(redis_client)
+    try:
+        return await content_cache.bump_version()
+    finally:
+        content_cache.unbind()
+        await redis_client.aclose()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Publica una versión de contenido nueva tras editar MySQL directamente."
+    )
+    parser.parse_args(argv)
+    try:
+        version = asyncio.run(bump_content_version())
+    except RedisError as error:
+        print(
+            f"No se ha podido publicar la versión de contenido en Redis: {type(error).__name__}",
+            file=sys.stderr,
+        )
+        return 1
+    print(f"Versión de contenido publicada: {version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+# backend/tools/import_content.py
+
+"""
+tools/import_content.py
+
+Importa publicaciones del blog o productos de charcutería desde JSON Lines o CSV.
+
+Las filas se leen en streaming, se validan con ``schemas.BlogCreate`` o
+``schemas.CharcuteriaCreate`` y se escriben por lotes con un único
+``INSERT ... ON DUPLICATE KEY UPDATE`` de varias filas por lote, todos dentro de
+una transacción: si una fila no es válida o MySQL falla, no se importa nada. Al
+confirmar se publica una versión de contenido nueva para que todos los workers
+descarten su caché.
+
+Cada fila debe incluir además su clave (``id_noticia`` o ``id_producto``). En el
+blog, ``fecha_publicacion`` se toma de la fila o de la hora de importación y no se
+modifica al actualizar; ``fecha_actualizacion`` solo cambia si cambia el texto.
+Las filas importadas ya cumplen el contrato público y se guardan con la marca
+``publicamente_valido`` (migración 002).
+
+Uso, desde la raíz del repositorio, con el ``.env`` del backend configurado:
+
+    python -m backend.tools.import_content blog publicaciones.jsonl
+    python -m backend.tools.import_content charcuteria productos.csv --batch-size 1000
+    python -m backend.tools.import_content blog publicaciones.jsonl --dry-run
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+from redis.exceptions import RedisError
+from sqlalchemy import Table, case, func, or_
+from sqlalchemy.dialects.mysql import Insert, insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..database import engine as default_engine
+from ..models import models, schemas
+from .bump_content_version import bump_content_version
+
+DEFAULT_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 20
+# Los contenidos del blog pueden superar el límite de 128 KiB por campo del módulo csv.
+CSV_FIELD_SIZE_LIMIT = 16 * 1024 * 1024
+
+
+class BlogImportRow(schemas.BlogCreate):
+    """Publicación importada: ``BlogCreate`` más su clave y fechas opcionales."""
+
+    model_config = {"extra": "forbid"}
+
+    id_noticia: int = Field(gt=0)
+    fecha_publicacion: Optional[datetime] = None
+    fecha_actualizacion: Optional[datetime] = None
+
+
+class CharcuteriaImportRow(schemas.CharcuteriaCreate):
+    """Producto importado: ``CharcuteriaCreate`` más su clave."""
+
+    model_config = {"extra": "forbid"}
+
+    id_producto: int = Field(gt=0)
+
+
+@dataclass(frozen=True)
+class ImportTarget:
+    """Tabla de destino, esquema de validación y columnas que actualiza el upsert."""
+
+    table: Table
+    row_schema: type[BaseModel]
+    content_columns: tuple[str, ...]
+
+
+IMPORT_TARGETS: dict[str, ImportTarget] = {
+    "blog": ImportTarget(
+        table=models.Blog.__table__,
+        row_schema=BlogImportRow,
+        content_columns=("slug", "titulo", "contenido", "autor", "imagen_url", "imagen_url_2"),
+    ),
+    "charcuteria": ImportTarget(
+        table=models.Charcuteria.__table__,
+        row_schema=CharcuteriaImportRow,
+        content_columns=("nombre", "empresa", "descripcion", "imagen_url", "categoria"),
+    ),
+}
+
+
+class ImportRowError(ValueError):
+    """Fila que no puede importarse, con su línea en el archivo de origen."""
+
+    def __init__(self, line: int, detail: str) -> None:
+        super().__init__(f"línea {line}: {detail}")
+        self.line = line
+
+
+@dataclass(frozen=True)
+class ImportResult:
+    """Resumen de una importación terminada."""
+
+    rows: int
+    batches: int
+    version: Optional[int]
+
+
+def read_records(path: Path, file_format: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Lee el archivo en streaming y devuelve ``(línea, registro)``."""
+    with path.open("r", encoding="utf-8-sig", newline="") as source:
+        if file_format == "jsonl":
+            for line_number, line in enumerate(source, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as error:
+                    raise ImportRowError(line_number, f"JSON no válido ({error.msg})") from None
+                if not isinstance(record, dict):
+                    raise ImportRowError(line_number, "cada línea debe ser un objeto JSON")
+                yield line_number, record
+            return
+
+        csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
+        reader = csv.DictReader(source)
+        for record in reader:
+            # En CSV una celda vacía representa la ausencia de valor.
+            yield reader.line_num, {
+                key: (value if value != "" else None) for key, value in record.items()
+            }
+
+
+def validate_records(
+    records: Iterable[tuple[int, dict[str, Any]]],
+    target: ImportTarget,
+) -> Iterator[dict[str, Any]]:
+    """Valida cada registro con el esquema del destino y devuelve sus columnas."""
+    for line_number, record in records:
+        try:
+            row = target.row_schema.model_validate(record)
+        except ValidationError as error:
+            detail = "; ".join(
+                f"{'.'.join(str(part) for part in item['loc']) or 'fila'}: {item['msg']}"
+                for item in error.errors()
+            )
+            raise ImportRowError(line_number, detail) from None
+        yield row.model_dump()
+
+
+def batched(rows: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    """Agrupa las filas en lotes de ``size`` sin materializar el archivo completo."""
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def build_upsert(target: ImportTarget, rows: list[dict[str, Any]], imported_at: datetime) -> Insert:
+    """Construye el ``INSERT ... ON DUPLICATE KEY UPDATE`` de varias filas de un lote."""
+    table = target.table
+    if "fecha_publicacion" in table.c:
+        rows = [
+            {**row, "fecha_publicacion": row["fecha_publicacion"] or imported_at}
+            for row in rows
+        ]
+
+    # Los esquemas de importación aplican los mismos validadores que las lecturas públicas.
+    rows = [{**row, "publicamente_valido": True} for row in rows]
+    statement = mysql_insert(table).values(rows)
+    inserted = statement.inserted
+    assignments: list[tuple[str, Any]] = []
+    if "fecha_actualizacion" in table.c:
+        # Debe ir antes que las columnas de contenido: MySQL evalúa las asignaciones
+        # en orden y, después, compararía la fila ya actualizada consigo misma.
+        text_changed = or_(
+            *(
+                table.c[column].is_distinct_from(inserted[column])
+                for column in target.content_columns
+            )
+        )
+        assignments.append(
+            (
+                "fecha_actualizacion",
+                case(
+                    (text_changed, func.coalesce(inserted.fecha_actualizacion, func.now())),
+                    else_=table.c.fecha_actualizacion,
+                ),
+            )
+        )
+    assignments.extend((column, inserted[column]) for column in target.content_columns)
+    assignments.append(("publicamente_valido", inserted.publicamente_valido))
+    return statement.on_duplicate_key_update(assignments)
+
+
+async def import_content(
+    engine: AsyncEngine,
+    target_name: str,
+    path: Path,
+    file_format: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[int, int]:
+    """
+    Importa el archivo en una única transacción.
+
+    Args:
+        engine (AsyncEngine): Motor de la base de datos de destino.
+        target_name (str): ``blog`` o ``charcuteria``.
+        path (Path): Archivo de origen.
+        file_format (str): ``jsonl`` o ``csv``.
+        batch_size (int): Filas por sentencia.
+
+    Raises:
+        ImportRowError: Si alguna fila no es válida; la transacción se revierte.
+
+    Returns:
+        tuple[int, int]: Filas y lotes escritos.
+    """
+    target = IMPORT_TARGETS[target_name]
+    imported_at = datetime.now()
+    rows_written = 0
+    batches_written = 0
+    rows = validate_records(read_records(path, file_format), target)
+    async with engine.begin() as connection:
+        for batch in batched(rows, batch_size):
+            await connection.execute(build_upsert(target, batch, imported_at))
+            rows_written += len(batch)
+            batches_written += 1
+    return rows_written, batches_written
+
+
+def check_content(target_name: str, path: Path, file_format: str) -> list[ImportRowError]:
+    """Valida el archivo completo sin escribir y devuelve todos los errores."""
+    target = IMPORT_TARGETS[target_name]
+    errors: list[ImportRowError] = []
+    records = read_records(path, file_format)
+    while True:
+        try:
+            line_number, record = next(records)
+        except StopIteration:
+            return errors
+        except ImportRowError as error:
+            # Un JSON mal formado impide seguir leyendo con el mismo generador.
+            errors.append(error)
+            return errors
+        try:
+            next(validate_records([(line_number, record)], target))
+        except ImportRowError as error:
+            errors.append(error)
+
+
+async def run(arguments: argparse.Namespace) -> ImportResult:
+    """Importa el archivo y publica la versión nueva del contenido."""
+    try:
+        rows, batches = await import_content(
+            default_engine,
+            arguments.target,
+            Path(arguments.path),
+            arguments.format,
+            arguments.batch_size,
+        )
+    finally:
+        await default_engine.dispose()
+
+    version = None
+    if not arguments.no_bump:
+        try:
+            version = await bump_content_version()
+        except RedisError:
+            # Los datos ya están confirmados; sin versión nueva los workers
+            # seguirían sirviendo su caché hasta que caducaran las entradas.
+            print(
+                "Filas importadas, pero no se ha podido publicar la versión de contenido "
+                "en Redis; publíquela con: python -m backend.tools.bump_content_version",
+                file=sys.stderr,
+            )
+    return ImportResult(rows=rows, batches=batches, version=version)
+
+
+def _detect_format(path: str) -> str:
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Importa contenido del blog o de charcutería con upserts por lotes."
+    )
+    parser.add_argument("target", choices=sorted(IMPORT_TARGETS), help="Tabla de destino.")
+    parser.add_argument("path", help="Archivo JSON Lines o CSV con una fila por registro.")
+    parser.add_argument(
+        "--format",
+        choices=("jsonl", "csv"),
+        help="Formato del archivo; por defecto se deduce de la extensión.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Filas por sentencia INSERT.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Solo valida el archivo e informa de todas las filas no válidas.",
+    )
+    parser.add_argument(
+        "--no-bump",
+        action="store_true",
+        help="No publica una versión de contenido nueva tras importar.",
+    )
+    arguments = parser.parse_args(argv)
+    arguments.format = arguments.format or _detect_format(arguments.path)
+    if arguments.batch_size < 1:
+        parser.error("--batch-size debe ser mayor que cero")
+
+    if arguments.dry_run:
+        errors = check_content(arguments.target, Path(arguments.path), arguments.format)
+        for error in errors[:MAX_REPORTED_ERRORS]:
+            print(error, file=sys.stderr)
+        if len(errors) > MAX_REPORTED_ERRORS:
+            print(f"... y {len(errors) - MAX_REPORTED_ERRORS} errores más", file=sys.stderr)
+        print("Archivo válido" if not errors else f"{len(errors)} filas no válidas")
+        return 0 if not errors else 1
+
+    started = time.perf_counter()
+    try:
+        result = asyncio.run(run(arguments))
+    except ImportRowError as error:
+        print(f"Importación cancelada, no se ha escrito ninguna fila: {error}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - started
+    print(f"{result.rows} filas importadas en {result.batches} lotes ({elapsed:.1f} s)")
+    if result.version is not None:
+        print(f"Versión de contenido publicada: {result.version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# backend/tools/validate_public_content.py
+
+"""
+tools/validate_public_content.py
+
+Revisa por lotes las publicaciones del blog y los productos de charcutería con el
+contrato público y actualiza su marca ``publicamente_valido``.
+
+Las filas válidas se guardan en su forma normalizada, de modo que las lecturas con
+``CONTENT_VALIDATED_ON_WRITE=true`` pueden construir las respuestas sin validarlas.
+Las filas no válidas quedan fuera de esas lecturas y se informan aquí, una sola
+vez, en lugar de registrarse en cada petición. Si cambia alguna fila se publica
+una versión de contenido nueva.
+
+Debe ejecutarse tras aplicar la migración 002 y antes de activar la opción, y de
+nuevo después de editar filas directamente en MySQL.
+
+Uso, desde la raíz del repositorio, con el ``.env`` del backend configurado:
+
+    python -m backend.tools.validate_public_content
+    python -m backend.tools.validate_public_content blog --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from ..database import engine
+from ..services.public_content import (
+    DEFAULT_VALIDATION_BATCH_SIZE,
+    PUBLIC_TABLES,
+    PublicValidationReport,
+    validate_public_table,
+)
+from .bump_content_version import bump_content_version
+
+MAX_REPORTED_ROWS = 50
+
+
+async def run(arguments: argparse.Namespace) -> dict[str, PublicValidationReport]:
+    """Revisa las tablas pedidas y publica una versión nueva si alguna cambió."""
+    table_names = sorted(PUBLIC_TABLES) if arguments.table == "todas" else [arguments.table]
+    reports: dict[str, PublicValidationReport] = {}
+    try:
+        for table_name in table_names:
+            reports[table_name] = await validate_public_table(
+                engine,
+                table_name,
+                arguments.batch_size,
+            )
+    finally:
+        await engine.dispose()
+
+    if not arguments.no_bump and any(report.changed for report in reports.values()):
+        try:
+            version = await bump_content_version()
+        except RedisError:
+            print(
+                "Marcas actualizadas, pero no se ha podido publicar la versión de contenido "
+                "en Redis; los workers seguirán con su caché hasta la siguiente versión.",
+                file=sys.stderr,
+            )
+        else:
+            print(f"Versión de contenido publicada: {version}")
+    return reports
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Valida el contenido público y actualiza la marca publicamente_valido."
+    )
+    parser.add_argument(
+        "table",
+        nargs="?",
+        default="todas",
+        choices=("todas", *sorted(PUBLIC_TABLES)),
+        help="Tabla a revisar; por defecto todas.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_VALIDATION_BATCH_SIZE,
+        help="Filas leídas y actualizadas por transacción.",
+    )
+    parser.add_argument(
+        "--no-bump",
+        action="store_true",
+        help="No publica una versión de contenido nueva aunque cambien filas.",
+    )
+    arguments = parser.parse_args(argv)
+    if arguments.batch_size < 1:
+        parser.error("--batch-size debe ser mayor que cero")
+
+    reports = asyncio.run(run(arguments))
+    invalid = [row for report in reports.values() for row in report.invalid]
+    for table_name, report in reports.items():
+        print(
+            f"{table_name}: {report.checked} filas revisadas, {report.marked} marcas "
+            f"cambiadas, {report.normalized} normalizadas, {len(report.invalid)} no válidas"
+        )
+    for row in invalid[:MAX_REPORTED_ROWS]:
+        print(row, file=sys.stderr)
+    if len(invalid) > MAX_REPORTED_ROWS:
+        print(f"... y {len(invalid) - MAX_REPORTED_ROWS} filas no válidas más", file=sys.stderr)
+    # Un código distinto de cero permite que una tarea programada avise de filas dañadas.
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())